@@ -0,0 +1,142 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+Compara los conversores de `suitetecsa_core.utils.nauta` con su implementación anterior, que buscaba las expresiones
+regulares en la caché de `re` en cada llamada y leía las fechas con `strptime`, sobre los valores de `tests/assets`.
+Si NumPy está instalado, mide también los conversores por lotes de `suitetecsa_core.utils.batch`.
+
+Uso: python -m benchmarks.converters [--number N]
+"""
+import argparse
+import datetime
+import json
+import os
+import re
+import timeit
+
+from suitetecsa_core.utils import batch, nauta
+
+assets_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "assets")
+
+
+def legacy_str_to_date(date_str):
+    if not re.match(r'^\d{2}/\d{2}/\d{4}$', date_str):
+        raise ValueError("El formato de la fecha no es válido. Debe ser 'dd/mm/yyyy'.")
+    try:
+        date = datetime.datetime.strptime(date_str, '%d/%m/%Y').date()
+    except ValueError:
+        raise ValueError("La fecha proporcionada no es válida.")
+    return date
+
+
+def legacy_str_to_float(currency_str):
+    match = re.match(r'^\$([0-9,]+)(\s[A-Z]+)?$', currency_str)
+    if not match:
+        raise ValueError("El formato de la cadena no es válido.")
+    return float(match.group(1).replace(',', '.'))
+
+
+def legacy_time_string_to_seconds(time_string):
+    if re.match(r'^(\d+):([0-5]\d):([0-5]\d)$', time_string) is not None:
+        return sum(int(x) * 60 ** i for i, x in enumerate(reversed(time_string.split(":"))))
+    else:
+        raise ValueError("Invalid time format. The format should be HH:MM:SS.")
+
+
+def legacy_parse_datetime(string_datetime):
+    try:
+        datetime_obj = datetime.datetime.strptime(string_datetime, '%d/%m/%Y %H:%M:%S')
+        datetime.datetime(datetime_obj.year, datetime_obj.month, datetime_obj.day,
+                          datetime_obj.hour, datetime_obj.minute, datetime_obj.second)
+        return datetime_obj
+    except (ValueError, TypeError):
+        raise ValueError('Formato de fecha y hora inválido')
+
+
+def legacy_convert_to_bytes(size):
+    units = {"bytes": 1, "kb": 1024, "mb": 1024 ** 2, "gb": 1024 ** 3, "tb": 1024 ** 4}
+    size = size.split()
+    try:
+        return int(float(size[0].replace(",", ".")) * units[size[1].lower()])
+    except (IndexError, KeyError, ValueError):
+        raise ValueError(
+            "El formato del parámetro size es incorrecto. Debe ser en formato 'X unidad', donde unidad puede ser "
+            "'bytes', 'kb', 'mb', 'gb' o 'tb'."
+        )
+
+
+CONVERTERS = {
+    "str_to_date": (legacy_str_to_date, nauta.str_to_date),
+    "str_to_float": (legacy_str_to_float, nauta.str_to_float),
+    "time_string_to_seconds": (legacy_time_string_to_seconds, nauta.time_string_to_seconds),
+    "parse_datetime": (legacy_parse_datetime, nauta.parse_datetime),
+    "convert_to_bytes": (legacy_convert_to_bytes, nauta.convert_to_bytes)
+}
+
+
+def load_values() -> dict[str, list[str]]:
+    values = {name: [] for name in CONVERTERS}
+    for file_name in ("connects_2023_03.json", "recharges_2023_03.json", "transfers_2023_03.json",
+                      "quotes_paid_2023_03.json"):
+        with open(os.path.join(assets_dir, file_name)) as file:
+            rows = json.load(file)
+        for row in rows:
+            for key in ("start_session", "end_session"):
+                if key in row:
+                    values["parse_datetime"].append(row[key])
+            if "date" in row:
+                values["parse_datetime"].append(row["date"])
+                values["str_to_date"].append(row["date"][:10])
+            values["str_to_float"].append(row["import_"])
+            if "duration" in row:
+                values["time_string_to_seconds"].append(row["duration"])
+            for key in ("uploaded", "downloaded"):
+                if key in row:
+                    values["convert_to_bytes"].append(row[key])
+    return values
+
+
+def time_per_call(func, items: list, number: int) -> float:
+    return min(timeit.repeat(lambda: [func(item) for item in items], number=number, repeat=3)) / number / len(items)
+
+
+def main():
+    args_parser = argparse.ArgumentParser(description=__doc__)
+    args_parser.add_argument("--number", type=int, default=200, help="Conversiones de todos los valores por repetición")
+    args = args_parser.parse_args()
+
+    values = load_values()
+    print(f"{'conversor':<26}{'anterior':>14}{'actual':>14}{'mejora':>10}")
+    for name, (legacy, current) in CONVERTERS.items():
+        items = values[name]
+        if not items:
+            continue
+        assert [legacy(item) for item in items] == [current(item) for item in items], name
+        before = time_per_call(legacy, items, args.number)
+        after = time_per_call(current, items, args.number)
+        print(f"{name:<26}{before * 1e6:>11.2f} µs{after * 1e6:>11.2f} µs{before / after:>9.1f}x")
+
+    if batch.numpy is None:
+        return
+    print(f"\n{'conversor por lotes':<26}{'escalar':>14}{'lote':>14}{'mejora':>10}")
+    for name, (_, current) in CONVERTERS.items():
+        batch_converter = getattr(batch, f"batch_{name}", None)
+        if batch_converter is None or not values[name]:
+            continue
+        items = values[name] * 100
+        before = time_per_call(current, items, 1)
+        after = min(timeit.repeat(lambda: batch_converter(items), number=1, repeat=3)) / len(items)
+        print(f"{name:<26}{before * 1e9:>11.0f} ns{after * 1e9:>11.0f} ns{before / after:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+Mide, para cada página de `tests/assets`, cuánto cuesta analizar una respuesta pasando por `response.text` frente a
+decodificar `response.content` con la codificación conocida del portal, como hace ahora el scrapper.
+
+Con `response.text`, si la respuesta no declara su codificación, `requests` la adivina analizando todo el cuerpo antes
+de decodificarlo. La variante `text (sin charset)` mide ese caso, `text (con charset)` el de una respuesta que sí la
+declara y `content` el camino actual. El informe muestra el tiempo por página de cada variante y el ahorro de
+`content` frente a la primera.
+
+Uso: python -m benchmarks.decoding [--parser html.parser] [--number N] [--json RUTA]
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+
+from requests import Response
+
+from suitetecsa_core.repository.session_provider import PORTAL_ENCODINGS
+from suitetecsa_core import Portal
+from suitetecsa_core.utils.nauta import DEFAULT_PARSER, PARSERS, make_soup
+from benchmarks.suite import assets_dir, environment
+
+VARIANTS = ("text (sin charset)", "text (con charset)", "content")
+
+
+def make_response(content: bytes, encoding: str = None) -> Response:
+    response = Response()
+    response._content = content
+    response.encoding = encoding
+    return response
+
+
+def best_time(func, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=3)) / number
+
+
+def measure_page(content: bytes, parser: str, number: int) -> dict[str, float]:
+    """
+    Mide las tres variantes sobre una página. Cada repetición usa una respuesta nueva, porque `requests` guarda en
+    ella la codificación adivinada.
+    """
+    encoding = PORTAL_ENCODINGS[Portal.USER]
+    return dict(zip(VARIANTS, (
+        best_time(lambda: make_soup(make_response(content).text, parser), number),
+        best_time(lambda: make_soup(make_response(content, encoding).text, parser), number),
+        best_time(lambda: make_soup(make_response(content, encoding).content, parser, encoding), number)
+    )))
+
+
+def run(parser: str = DEFAULT_PARSER, number: int = 20) -> dict:
+    """
+    Ejecuta las mediciones y devuelve un informe que se puede serializar en JSON.
+
+    :param parser: El backend de análisis HTML.
+    :param number: Análisis de cada página por repetición.
+    """
+    results = {}
+    for name in sorted(os.listdir(assets_dir)):
+        if name.endswith(".html"):
+            with open(os.path.join(assets_dir, name), "rb") as file:
+                content = file.read()
+            result = measure_page(content, parser, number)
+            result["bytes"] = len(content)
+            result["saved_seconds"] = result[VARIANTS[0]] - result["content"]
+            results[name] = result
+    return {
+        "environment": environment(parser=parser, number=number),
+        "results": results,
+        "mean_saved_seconds": sum(result["saved_seconds"] for result in results.values()) / len(results)
+    }
+
+
+def print_report(report: dict) -> None:
+    print(f"{'página':<34}{'bytes':>8}" + "".join(f"{variant:>22}" for variant in VARIANTS) + f"{'ahorro':>12}")
+    for name, result in report["results"].items():
+        print(
+            f"{name:<34}{result['bytes']:>8}" + "".join(f"{result[variant] * 1e6:>19.0f} µs" for variant in VARIANTS)
+            + f"{result['saved_seconds'] * 1e6:>9.0f} µs"
+        )
+    print(f"Ahorro medio por página: {report['mean_saved_seconds'] * 1e6:.0f} µs")
+
+
+def main():
+    args_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    args_parser.add_argument("--parser", default=DEFAULT_PARSER, choices=PARSERS, help="Backend de análisis HTML")
+    args_parser.add_argument("--number", type=int, default=20, help="Análisis de cada página por repetición")
+    args_parser.add_argument(
+        "--json", dest="json_path", help="Escribe el informe en JSON en esta ruta ('-' para la salida estándar)"
+    )
+    args = args_parser.parse_args()
+
+    report = run(args.parser, args.number)
+    if args.json_path == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print_report(report)
+        if args.json_path:
+            with open(args.json_path, "w") as file:
+                json.dump(report, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,340 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+Prueba de carga del SDK contra los portales de `suitetecsa_core.testing.NautaPortalServer`: `--accounts` cuentas
+simuladas, cada una con su propio `NautaClient`, repiten un recorrido que se conecta por el portal cautivo, consulta el
+tiempo restante, se desconecta, inicia sesión en el portal de usuario, consulta la información de la cuenta y descarga
+listados del historial, con `--concurrency` cuentas a la vez.
+
+El recorrido es siempre el mismo y el servidor usa una semilla fija, así que dos ejecuciones con los mismos parámetros
+hacen el mismo trabajo y sus informes se pueden comparar entre versiones del SDK. Para cada operación informa del
+número de llamadas, los errores, el rendimiento y las latencias p50, p95 y p99. Con `--json` escribe el informe en JSON
+y con `--compare` lo compara con el de una ejecución anterior, terminando con error si el rendimiento total baja o la
+latencia p95 de alguna operación sube más que el umbral indicado.
+
+Por defecto el servidor se ejecuta en el mismo proceso. Para que no compita con el SDK por el intérprete, ejecútelo
+aparte con `python -m suitetecsa_core.testing.portal_server` e indique sus direcciones con `--connect-url`,
+`--user-url` y `--check-url`.
+
+Uso: python -m benchmarks.load [--accounts N] [--concurrency N] [--iterations N] [--mix OPERACIÓN=N,...]
+[--latency S] [--jitter S] [--error-rate P] [--rows N] [--json RUTA] [--compare RUTA]
+"""
+import argparse
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from typing import Callable
+
+from bs4 import BeautifulSoup
+from requests import Session
+
+from suitetecsa_core import Portal
+from suitetecsa_core.domain.service.nauta_client import NautaClient
+from suitetecsa_core.repository.scrapper_provider import DefaultNautaScrapper
+from suitetecsa_core.repository.session_provider import DefaultNautaSession, TransportConfig
+from suitetecsa_core.testing import NautaPortalServer, make_accounts
+from suitetecsa_core.testing.history import HISTORY_ACTIONS
+from benchmarks.suite import environment
+
+OPERATIONS = (
+    "connect", "remaining_time", "disconnect", "captcha_image", "login", "user_information", "history"
+)
+# Veces que se repite cada operación en cada recorrido; el resto se ejecuta una vez
+DEFAULT_MIX = {"remaining_time": 3, "user_information": 2, "history": 4}
+HISTORY_YEAR, HISTORY_MONTH = 2023, 3
+
+
+def percentile(values: list[float], fraction: float) -> float | None:
+    """
+    Devuelve el percentil `fraction` (entre 0 y 1) de una lista ordenada, interpolando entre los dos valores más
+    cercanos, o None si la lista está vacía.
+    """
+    if not values:
+        return None
+    position = (len(values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def parse_mix(text: str) -> dict[str, int]:
+    """
+    Convierte un texto como `remaining_time=3,history=2` en un diccionario de repeticiones por operación.
+
+    :raises ValueError: Si alguna operación no existe.
+    """
+    mix = dict(DEFAULT_MIX)
+    for item in filter(None, text.split(",")):
+        name, _, count = item.partition("=")
+        if name not in OPERATIONS:
+            raise ValueError(f"Operación desconocida: {name}")
+        mix[name] = int(count)
+    return mix
+
+
+class Recorder:
+    """
+    Acumula las latencias y los errores de cada operación de todas las cuentas.
+    """
+
+    def __init__(self) -> None:
+        self.latencies: dict[str, list[float]] = {name: [] for name in OPERATIONS}
+        self.errors: dict[str, dict[str, int]] = {name: {} for name in OPERATIONS}
+        self.__lock = threading.Lock()
+
+    def call(self, name: str, func: Callable[[], object]) -> bool:
+        """
+        Ejecuta y cronometra una operación.
+
+        :return: True si la operación terminó sin errores.
+        """
+        start = time.perf_counter()
+        try:
+            func()
+        except Exception as e:
+            with self.__lock:
+                errors = self.errors[name]
+                errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+            return False
+        elapsed = time.perf_counter() - start
+        with self.__lock:
+            self.latencies[name].append(elapsed)
+        return True
+
+
+def run_account(client: NautaClient, recorder: Recorder, mix: dict[str, int], iterations: int) -> None:
+    """
+    Repite el recorrido de una cuenta. Si falla el inicio de sesión en uno de los portales, se omiten las operaciones
+    que dependen de él en esa vuelta.
+    """
+    for _ in range(iterations):
+        if recorder.call("connect", client.connect):
+            for _ in range(mix["remaining_time"]):
+                recorder.call("remaining_time", lambda: client.remaining_time)
+            recorder.call("disconnect", client.disconnect)
+        if recorder.call("captcha_image", lambda: client.captcha_image) and recorder.call(
+                "login", lambda: client.login("abcd")
+        ):
+            for _ in range(mix["user_information"]):
+                recorder.call("user_information", lambda: client.user_information)
+            for index in range(mix["history"]):
+                method = getattr(client, f"get_{HISTORY_ACTIONS[index % len(HISTORY_ACTIONS)].value}")
+                recorder.call("history", lambda: method(HISTORY_YEAR, HISTORY_MONTH))
+            client.logout()
+
+
+def make_client(
+        username: str, password: str, base_urls: dict[Portal, str], check_connection_url: str,
+        transport: TransportConfig = None
+) -> NautaClient:
+    transports = {portal: transport for portal in Portal} if transport is not None else None
+    scrapper = DefaultNautaScrapper(BeautifulSoup(), DefaultNautaSession(Session(), transports))
+    scrapper.override_base_urls(base_urls, check_connection_url)
+    client = NautaClient(scrapper)
+    client.credentials = (username, password)
+    return client
+
+
+def run(
+        accounts: int = 10, concurrency: int = 4, iterations: int = 3, mix: dict[str, int] = None,
+        latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0, rows: int = 100,
+        base_urls: dict[Portal, str] = None, check_connection_url: str = None, password: str = "password",
+        transport: TransportConfig = None
+) -> dict:
+    """
+    Ejecuta la prueba de carga y devuelve un informe que se puede serializar en JSON.
+
+    :param accounts: Número de cuentas simuladas.
+    :param concurrency: Cuentas que se ejecutan a la vez.
+    :param iterations: Recorridos que hace cada cuenta.
+    :param mix: Repeticiones de cada operación por recorrido. Si no se especifica se utiliza `DEFAULT_MIX`.
+    :param latency: Retraso de cada respuesta del servidor local, en segundos.
+    :param jitter: Variación máxima del retraso, en segundos.
+    :param error_rate: Proporción de respuestas del servidor local con error.
+    :param rows: Filas de cada listado del historial de cada cuenta.
+    :param base_urls: Las direcciones de unos portales ya en ejecución. Si no se especifican, se levanta un
+    `NautaPortalServer` en el mismo proceso.
+    :param check_connection_url: La URL de comprobación de la conexión de los portales ya en ejecución.
+    :param password: La contraseña de las cuentas de los portales ya en ejecución.
+    :param transport: La configuración del transporte de los dos portales. Si no se especifica se utilizan los valores
+    por defecto de `TransportConfig`.
+    """
+    mix = {**DEFAULT_MIX, **(mix or {})}
+    server = None
+    if base_urls is None:
+        server = NautaPortalServer(
+            make_accounts(accounts, rows, password), latency, jitter, error_rate, seed=0
+        )
+        server.start()
+        base_urls, check_connection_url = server.base_urls, server.check_connection_url
+    recorder = Recorder()
+    clients = [
+        make_client(f"user{index}@nauta.com.cu", password, base_urls, check_connection_url, transport)
+        for index in range(accounts)
+    ]
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(concurrency) as executor:
+            for future in [executor.submit(run_account, client, recorder, mix, iterations) for client in clients]:
+                future.result()
+        wall = time.perf_counter() - start
+    finally:
+        if server is not None:
+            server.stop()
+
+    results = {}
+    for name in OPERATIONS:
+        latencies = sorted(recorder.latencies[name])
+        errors = sum(recorder.errors[name].values())
+        if not latencies and not errors:
+            continue
+        results[name] = {
+            "count": len(latencies),
+            "errors": errors,
+            "error_types": recorder.errors[name],
+            "ops_per_sec": len(latencies) / wall,
+            "mean_seconds": sum(latencies) / len(latencies) if latencies else None,
+            "p50_seconds": percentile(latencies, 0.50),
+            "p95_seconds": percentile(latencies, 0.95),
+            "p99_seconds": percentile(latencies, 0.99),
+            "max_seconds": latencies[-1] if latencies else None
+        }
+    completed = sum(result["count"] for result in results.values())
+    return {
+        "environment": environment(
+            accounts=accounts, concurrency=concurrency, iterations=iterations, mix=mix, latency=latency,
+            jitter=jitter, error_rate=error_rate, rows=rows, external_server=server is None,
+            transport=asdict(transport or TransportConfig())
+        ),
+        "totals": {
+            "wall_seconds": wall,
+            "operations": completed,
+            "errors": sum(result["errors"] for result in results.values()),
+            "ops_per_sec": completed / wall
+        },
+        "results": results
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Devuelve las medidas que empeoraron más de `threshold` (una fracción) respecto de `baseline`: el rendimiento total
+    y la latencia p95 de cada operación.
+    """
+    regressions = []
+    if report["totals"]["ops_per_sec"] < baseline["totals"]["ops_per_sec"] * (1 - threshold):
+        regressions.append("ops/s total")
+    for name, result in report["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is None or result["p95_seconds"] is None or previous["p95_seconds"] is None:
+            continue
+        if result["p95_seconds"] > previous["p95_seconds"] * (1 + threshold):
+            regressions.append(f"{name} p95")
+    return regressions
+
+
+def print_report(report: dict, baseline: dict = None) -> None:
+    def milliseconds(value: float | None) -> str:
+        return f"{value * 1e3:>7.1f} ms" if value is not None else f"{'-':>10}"
+
+    header = f"{'operación':<18}{'llamadas':>10}{'errores':>9}{'ops/s':>10}{'p50':>10}{'p95':>10}{'p99':>10}"
+    print(header + (f"{'p95 vs base':>13}" if baseline else ""))
+    for name, result in report["results"].items():
+        line = (
+            f"{name:<18}{result['count']:>10}{result['errors']:>9}{result['ops_per_sec']:>10.1f}"
+            f"{milliseconds(result['p50_seconds'])}{milliseconds(result['p95_seconds'])}"
+            f"{milliseconds(result['p99_seconds'])}"
+        )
+        previous = (baseline or {}).get("results", {}).get(name)
+        if previous is not None and previous["p95_seconds"] and result["p95_seconds"] is not None:
+            line += f"{result['p95_seconds'] / previous['p95_seconds']:>12.2f}x"
+        print(line)
+    totals = report["totals"]
+    print(
+        f"\n{totals['operations']} operaciones y {totals['errors']} errores en {totals['wall_seconds']:.2f} s: "
+        f"{totals['ops_per_sec']:.1f} ops/s"
+    )
+
+
+def main():
+    args_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    args_parser.add_argument("--accounts", type=int, default=10, help="Número de cuentas simuladas")
+    args_parser.add_argument("--concurrency", type=int, default=4, help="Cuentas que se ejecutan a la vez")
+    args_parser.add_argument("--iterations", type=int, default=3, help="Recorridos de cada cuenta")
+    args_parser.add_argument(
+        "--mix", default="", help=f"Repeticiones de cada operación por recorrido, por ejemplo 'history=2' "
+                                  f"(por defecto {','.join(f'{k}={v}' for k, v in DEFAULT_MIX.items())})"
+    )
+    args_parser.add_argument("--latency", type=float, default=0.0, help="Retraso de cada respuesta, en segundos")
+    args_parser.add_argument("--jitter", type=float, default=0.0, help="Variación máxima del retraso, en segundos")
+    args_parser.add_argument("--error-rate", type=float, default=0.0, help="Proporción de respuestas con error 503")
+    args_parser.add_argument("--rows", type=int, default=100, help="Filas de cada listado del historial")
+    args_parser.add_argument("--connect-url", help="Dirección de un portal cautivo ya en ejecución")
+    args_parser.add_argument("--user-url", help="Dirección de un portal de usuario ya en ejecución")
+    args_parser.add_argument("--check-url", help="URL de comprobación de la conexión de los portales en ejecución")
+    args_parser.add_argument("--password", default="password", help="Contraseña de las cuentas")
+    args_parser.add_argument(
+        "--retries", type=int, default=TransportConfig.retries, help="Reintentos de las peticiones GET"
+    )
+    args_parser.add_argument(
+        "--backoff", type=float, default=TransportConfig.backoff_factor, help="Factor de espera entre reintentos"
+    )
+    args_parser.add_argument(
+        "--pool-maxsize", type=int, default=TransportConfig.pool_maxsize, help="Conexiones persistentes por portal"
+    )
+    args_parser.add_argument(
+        "--json", dest="json_path", help="Escribe el informe en JSON en esta ruta ('-' para la salida estándar)"
+    )
+    args_parser.add_argument("--compare", dest="baseline_path", help="Informe JSON de una ejecución anterior")
+    args_parser.add_argument(
+        "--threshold", type=float, default=0.1, help="Empeoramiento que se considera una regresión (0.1 = 10%%)"
+    )
+    args = args_parser.parse_args()
+
+    base_urls = None
+    if args.connect_url or args.user_url:
+        if not (args.connect_url and args.user_url and args.check_url):
+            args_parser.error("--connect-url, --user-url y --check-url deben indicarse juntos")
+        base_urls = {Portal.CONNECT: args.connect_url, Portal.USER: args.user_url}
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        args_parser.error(str(e))
+    report = run(
+        args.accounts, args.concurrency, args.iterations, mix, args.latency, args.jitter, args.error_rate, args.rows,
+        base_urls, args.check_url, args.password,
+        TransportConfig(pool_maxsize=args.pool_maxsize, retries=args.retries, backoff_factor=args.backoff)
+    )
+    baseline = None
+    if args.baseline_path:
+        with open(args.baseline_path) as file:
+            baseline = json.load(file)
+    if args.json_path == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print_report(report, baseline)
+        if args.json_path:
+            with open(args.json_path, "w") as file:
+                json.dump(report, file, indent=2)
+    if baseline is not None:
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"Regresiones de más del {args.threshold:.0%}: {', '.join(regressions)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+Compara la construcción de los modelos del historial con la implementación anterior, basada en `dataclasses.fields`
+y sin `__slots__`, sobre las filas de `tests/assets`.
+
+Uso: python -m benchmarks.models [--number N]
+"""
+import argparse
+import datetime
+import json
+import os
+import timeit
+import tracemalloc
+from dataclasses import dataclass, fields
+
+from suitetecsa_core.domain.model import Connection
+from suitetecsa_core.utils.nauta import str_to_float, parse_datetime, convert_to_bytes, time_string_to_seconds
+
+assets_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "assets")
+
+
+@dataclass
+class LegacyConnection:
+    start_session: datetime.datetime
+    end_session: datetime.datetime
+    duration: int
+    uploaded: int
+    downloaded: int
+    import_: float
+
+    @classmethod
+    def from_dict(cls, data):
+        keys = [f.name for f in fields(cls)]
+        normal_keys = {key: data[key] for key in data if key in keys}
+        normal_keys["start_session"] = parse_datetime(normal_keys["start_session"])
+        normal_keys["end_session"] = parse_datetime(normal_keys["end_session"])
+        normal_keys["import_"] = str_to_float(normal_keys["import_"])
+        normal_keys["duration"] = time_string_to_seconds(normal_keys["duration"])
+        for key in keys:
+            if key in ["uploaded", "downloaded"]:
+                normal_keys[key] = convert_to_bytes(normal_keys[key])
+        return cls(**normal_keys)
+
+
+def time_per_object(func, items: list, number: int) -> float:
+    return min(timeit.repeat(lambda: [func(item) for item in items], number=number, repeat=3)) / number / len(items)
+
+
+def memory_per_object(func, items: list) -> float:
+    tracemalloc.start()
+    objects = [func(item) for item in items]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return current / len(items)
+
+
+def main():
+    args_parser = argparse.ArgumentParser(description=__doc__)
+    args_parser.add_argument("--number", type=int, default=200, help="Construcciones de todas las filas por repetición")
+    args = args_parser.parse_args()
+
+    with open(os.path.join(assets_dir, "connects_2023_03.json")) as file:
+        rows = json.load(file)
+    cells = [tuple(row[f.name] for f in fields(Connection)) for row in rows]
+    cases = [
+        ("LegacyConnection.from_dict", LegacyConnection.from_dict, rows),
+        ("Connection.from_dict", Connection.from_dict, rows),
+        ("Connection.from_cells", Connection.from_cells, cells)
+    ]
+    print(f"{'constructor':<28}{'tiempo':>14}{'memoria':>14}")
+    for name, func, items in cases:
+        print(
+            f"{name:<28}{time_per_object(func, items, args.number) * 1e6:>11.2f} µs"
+            f"{memory_per_object(func, items):>12.0f} B"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+Mide cómo escala el análisis de páginas con el número de núcleos cuando `DefaultNautaScrapper` usa un
+`ProcessPoolExecutor` como `parse_executor`, frente al análisis en los propios hilos, que el GIL limita a un núcleo.
+
+`--accounts` scrappers, cada uno con su sesión simulada sobre un historial de `SyntheticHistory` de `--rows` filas por
+listado, consultan la información de la cuenta, el resumen y el listado de conexiones de un mes con `--threads` hilos.
+No hay red: todo el tiempo es análisis, construcción de modelos y, con procesos, el envío de los cuerpos de las
+respuestas y de las tuplas resultantes entre procesos. Para cada número de procesos de `--workers` informa del tiempo
+total, las cuentas por segundo y la aceleración respecto del análisis en hilos.
+
+Uso: python -m benchmarks.parse_executor [--accounts N] [--threads N] [--rows N] [--workers 1,2,4] [--json RUTA]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from suitetecsa_core.repository.scrapper_provider import DefaultNautaScrapper
+from suitetecsa_core.testing import SyntheticHistory
+from benchmarks.suite import environment, make_scrapper
+
+HISTORY_YEAR, HISTORY_MONTH = 2023, 3
+
+
+def default_workers() -> list[int]:
+    """
+    Devuelve 1, 2, 4... hasta el número de núcleos disponibles, incluido.
+    """
+    cpus = os.cpu_count() or 1
+    workers = [1]
+    while workers[-1] * 2 < cpus:
+        workers.append(workers[-1] * 2)
+    return workers + [cpus] if cpus > 1 else workers
+
+
+def run_account(scrapper: DefaultNautaScrapper) -> None:
+    scrapper.user_information
+    summary = scrapper.get_connections_summary(HISTORY_YEAR, HISTORY_MONTH)
+    scrapper.get_connections(HISTORY_YEAR, HISTORY_MONTH, summary)
+
+
+def measure(scrappers: list[DefaultNautaScrapper], threads: int) -> float:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        list(executor.map(run_account, scrappers))
+    return time.perf_counter() - start
+
+
+def run(accounts: int = 16, threads: int = 8, rows: int = 500, workers: list[int] = None) -> dict:
+    """
+    Ejecuta la comparación y devuelve un informe que se puede serializar en JSON.
+
+    :param accounts: Número de scrappers, uno por cuenta simulada.
+    :param threads: Hilos que ejecutan las cuentas.
+    :param rows: Filas del listado de conexiones de cada cuenta.
+    :param workers: Números de procesos a medir. Si no se especifica se utiliza `default_workers`.
+    """
+    workers = workers or default_workers()
+    history = SyntheticHistory(HISTORY_YEAR, HISTORY_MONTH, rows)
+    scrappers = [make_scrapper(history=history) for _ in range(accounts)]
+    results = {"threads": {"seconds": measure(scrappers, threads)}}
+    for count in workers:
+        with ProcessPoolExecutor(count) as executor:
+            # Se arrancan los procesos antes de medir
+            list(executor.map(abs, range(count)))
+            for scrapper in scrappers:
+                scrapper.parse_executor = executor
+            results[f"processes_{count}"] = {"seconds": measure(scrappers, threads)}
+        for scrapper in scrappers:
+            scrapper.parse_executor = None
+    baseline = results["threads"]["seconds"]
+    for result in results.values():
+        result["accounts_per_sec"] = accounts / result["seconds"]
+        result["speedup"] = baseline / result["seconds"]
+    return {
+        "environment": environment(accounts=accounts, threads=threads, rows=rows, cpus=os.cpu_count()),
+        "results": results
+    }
+
+
+def print_report(report: dict) -> None:
+    settings = report["environment"]
+    print(
+        f"{settings['accounts']} cuentas, {settings['threads']} hilos, {settings['rows']} filas por listado, "
+        f"{settings['cpus']} núcleos"
+    )
+    print(f"{'variante':<16}{'tiempo':>14}{'cuentas/s':>14}{'aceleración':>14}")
+    for name, result in report["results"].items():
+        print(
+            f"{name:<16}{result['seconds'] * 1e3:>11.1f} ms{result['accounts_per_sec']:>14.1f}"
+            f"{result['speedup']:>13.2f}x"
+        )
+
+
+def main():
+    args_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    args_parser.add_argument("--accounts", type=int, default=16, help="Número de cuentas simuladas")
+    args_parser.add_argument("--threads", type=int, default=8, help="Hilos que ejecutan las cuentas")
+    args_parser.add_argument("--rows", type=int, default=500, help="Filas del listado de cada cuenta")
+    args_parser.add_argument(
+        "--workers", help="Números de procesos separados por comas (por defecto, potencias de 2 hasta los núcleos)"
+    )
+    args_parser.add_argument(
+        "--json", dest="json_path", help="Escribe el informe en JSON en esta ruta ('-' para la salida estándar)"
+    )
+    args = args_parser.parse_args()
+
+    workers = [int(value) for value in args.workers.split(",")] if args.workers else None
+    report = run(args.accounts, args.threads, args.rows, workers)
+    if args.json_path == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print_report(report)
+        if args.json_path:
+            with open(args.json_path, "w") as file:
+                json.dump(report, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+Compara el tiempo de análisis por página de cada backend HTML sobre las páginas de `tests/assets`.
+
+Uso: python -m benchmarks.parsers [--number N]
+"""
+import argparse
+import glob
+import os
+import timeit
+
+from suitetecsa_core.utils.nauta import PARSERS, check_parser, make_soup
+
+assets_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "assets")
+
+
+def available_parsers() -> list[str]:
+    parsers = []
+    for parser in PARSERS:
+        try:
+            parsers.append(check_parser(parser))
+        except ValueError:
+            pass
+    return parsers
+
+
+def time_page(markup: str, parser: str, number: int) -> float:
+    """
+    Devuelve el mejor tiempo, en segundos, de analizar la página con el backend dado.
+    """
+    return min(timeit.repeat(lambda: make_soup(markup, parser), number=number, repeat=3)) / number
+
+
+def main():
+    args_parser = argparse.ArgumentParser(description=__doc__)
+    args_parser.add_argument("--number", type=int, default=50, help="Análisis por repetición")
+    args = args_parser.parse_args()
+
+    parsers = available_parsers()
+    print(f"{'página':<32}" + "".join(f"{parser:>14}" for parser in parsers) + f"{'mejora':>10}")
+    totals = dict.fromkeys(parsers, 0.0)
+    for path in sorted(glob.glob(os.path.join(assets_dir, "*.html"))):
+        with open(path) as fp:
+            markup = fp.read()
+        times = {parser: time_page(markup, parser, args.number) for parser in parsers}
+        for parser, elapsed in times.items():
+            totals[parser] += elapsed
+        print(
+            f"{os.path.basename(path):<32}" + "".join(f"{times[parser] * 1e3:>11.3f} ms" for parser in parsers) +
+            f"{times['html5lib'] / times['html.parser']:>9.2f}x"
+        )
+    print(
+        f"{'total':<32}" + "".join(f"{totals[parser] * 1e3:>11.3f} ms" for parser in parsers) +
+        f"{totals['html5lib'] / totals['html.parser']:>9.2f}x"
+    )
+
+
+if __name__ == '__main__':
+    main()
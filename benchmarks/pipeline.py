@@ -0,0 +1,144 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+Compara la descarga de un listado largo página a página con la descarga en segundo plano de `DefaultNautaScrapper`
+(`pipeline=True`), en la que la página siguiente se pide al portal mientras se analiza la anterior, contra un
+`suitetecsa_core.testing.NautaPortalServer` en el mismo proceso con el retraso de `--latency` en cada respuesta.
+
+Para cada variante informa de las páginas del listado y de la mediana y el mínimo de `get_<listado>` completo (resumen,
+token CSRF y todas las páginas). La ganancia esperada es, como mucho, el tiempo de análisis de todas las páginas menos
+una: si el retraso del portal domina, el tiempo total apenas cambia.
+
+Uso: python -m benchmarks.pipeline [--rows N] [--latency S] [--prefetch 1,2,4] [--repeat N] [--action connections]
+[--json RUTA]
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+
+from bs4 import BeautifulSoup
+from requests import Session
+
+from suitetecsa_core import Action
+from suitetecsa_core.repository.scrapper_provider import DefaultNautaScrapper
+from suitetecsa_core.repository.session_provider import DefaultNautaSession
+from suitetecsa_core.testing import NautaPortalServer, make_accounts
+from suitetecsa_core.testing.history import HISTORY_ACTIONS
+from benchmarks.suite import environment
+
+HISTORY_YEAR, HISTORY_MONTH = 2023, 3
+ROWS_PER_PAGE = 14
+
+
+def measure(
+        server: NautaPortalServer, action: Action, repeat: int, pipeline: bool, prefetch_pages: int = 2
+) -> dict[str, float]:
+    """
+    Inicia sesión en el portal de usuario de `server` y mide `repeat` descargas completas del listado de `action`.
+    """
+    account = next(iter(server.accounts.values()))
+    scrapper = DefaultNautaScrapper(
+        BeautifulSoup(), DefaultNautaSession(Session()), pipeline=pipeline, prefetch_pages=prefetch_pages
+    )
+    server.configure(scrapper)
+    scrapper.login(account.username, account.password, "abcd")
+    get_list = getattr(scrapper, f"get_{action.value}")
+    times = []
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            get_list(HISTORY_YEAR, HISTORY_MONTH)
+            times.append(time.perf_counter() - start)
+    finally:
+        scrapper.logout()
+    return {"median_seconds": statistics.median(times), "min_seconds": min(times)}
+
+
+def run(
+        rows: int = 1400, latency: float = 0.01, prefetch: list[int] = None, repeat: int = 5,
+        action: Action = Action.GET_CONNECTIONS
+) -> dict:
+    """
+    Ejecuta la comparación y devuelve un informe que se puede serializar en JSON.
+
+    :param rows: Filas del listado.
+    :param latency: Retraso de cada respuesta del servidor local, en segundos.
+    :param prefetch: Valores de `prefetch_pages` que se miden con `pipeline=True`.
+    :param repeat: Descargas completas del listado por variante.
+    :param action: El listado que se descarga.
+    """
+    prefetch = prefetch or [1, 2, 4]
+    server = NautaPortalServer(make_accounts(1, rows), latency, seed=0)
+    server.start()
+    try:
+        results = {"sequential": measure(server, action, repeat, pipeline=False)}
+        for prefetch_pages in prefetch:
+            results[f"pipeline_{prefetch_pages}"] = measure(server, action, repeat, True, prefetch_pages)
+    finally:
+        server.stop()
+    baseline = results["sequential"]["median_seconds"]
+    for result in results.values():
+        result["speedup"] = baseline / result["median_seconds"]
+    return {
+        "environment": environment(
+            rows=rows, pages=-(-rows // ROWS_PER_PAGE), latency=latency, repeat=repeat, action=action.value
+        ),
+        "results": results
+    }
+
+
+def print_report(report: dict) -> None:
+    settings = report["environment"]
+    print(
+        f"{settings['action']}: {settings['rows']} filas, {settings['pages']} páginas, "
+        f"{settings['latency'] * 1e3:.1f} ms de retraso por respuesta"
+    )
+    print(f"{'variante':<16}{'mediana':>14}{'mínimo':>14}{'aceleración':>14}")
+    for name, result in report["results"].items():
+        print(
+            f"{name:<16}{result['median_seconds'] * 1e3:>11.1f} ms{result['min_seconds'] * 1e3:>11.1f} ms"
+            f"{result['speedup']:>13.2f}x"
+        )
+
+
+def main():
+    args_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    args_parser.add_argument("--rows", type=int, default=1400, help="Filas del listado")
+    args_parser.add_argument("--latency", type=float, default=0.01, help="Retraso de cada respuesta, en segundos")
+    args_parser.add_argument("--prefetch", default="1,2,4", help="Valores de prefetch_pages separados por comas")
+    args_parser.add_argument("--repeat", type=int, default=5, help="Descargas completas por variante")
+    args_parser.add_argument(
+        "--action", default=Action.GET_CONNECTIONS.value,
+        choices=[action.value for action in HISTORY_ACTIONS], help="Listado que se descarga"
+    )
+    args_parser.add_argument(
+        "--json", dest="json_path", help="Escribe el informe en JSON en esta ruta ('-' para la salida estándar)"
+    )
+    args = args_parser.parse_args()
+
+    report = run(
+        args.rows, args.latency, [int(value) for value in args.prefetch.split(",")], args.repeat, Action(args.action)
+    )
+    if args.json_path == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print_report(report)
+        if args.json_path:
+            with open(args.json_path, "w") as file:
+                json.dump(report, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
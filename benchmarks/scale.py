@@ -0,0 +1,108 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+Mide cómo crecen la paginación, la extracción de filas y la construcción de modelos de un listado con el número de
+filas del mes, sobre historiales generados con `suitetecsa_core.testing.SyntheticHistory`.
+
+Para cada tamaño informa del número de páginas, del tiempo de `get_<listado>` completo (resumen, token CSRF y todas
+las páginas a través de una sesión simulada), del tiempo de extraer las filas de las páginas y del de construir los
+modelos, por fila, además del pico de memoria de `tracemalloc` de la descarga completa.
+
+Uso: python -m benchmarks.scale [--sizes 10,100,1000,10000,100000] [--action connections] [--json RUTA]
+"""
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+
+from suitetecsa_core import Action
+from suitetecsa_core.testing import SyntheticHistory
+from suitetecsa_core.utils.parser import extract_table_rows, rows_parsers
+from benchmarks.suite import make_scrapper
+
+
+def best_time(func, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def measure_size(action: Action, rows: int, repeat: int) -> dict[str, float | int]:
+    """
+    Mide las etapas de la descarga de un listado de `rows` filas.
+    """
+    history = SyntheticHistory(2023, 3, {action: rows})
+    scrapper = make_scrapper(history=history)
+    get_list = getattr(scrapper, f"get_{action.value}")
+    pages = [history.list_html(action, page).encode() for page in range(1, history.pages[action] + 1)]
+    cells = [row for page in pages for row in extract_table_rows(page)]
+    parse_row = rows_parsers[action]
+
+    total = best_time(lambda: get_list(2023, 3), repeat)
+    extraction = best_time(lambda: [extract_table_rows(page) for page in pages], repeat)
+    models = best_time(lambda: [parse_row(row) for row in cells], repeat)
+    tracemalloc.start()
+    try:
+        result = get_list(2023, 3)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(result) == rows
+    return {
+        "rows": rows,
+        "pages": len(pages),
+        "total_seconds": total,
+        "extraction_seconds": extraction,
+        "models_seconds": models,
+        "alloc_peak_bytes": peak
+    }
+
+
+def main():
+    args_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    args_parser.add_argument(
+        "--sizes", default="10,100,1000,10000,100000", help="Números de filas separados por comas"
+    )
+    args_parser.add_argument(
+        "--action", default=Action.GET_CONNECTIONS.value,
+        choices=[action.value for action in (Action.GET_CONNECTIONS, Action.GET_RECHARGES, Action.GET_TRANSFERS,
+                                             Action.GET_QUOTES_PAID)],
+        help="Listado a medir"
+    )
+    args_parser.add_argument("--repeat", type=int, default=3, help="Repeticiones de cada medida; se toma la mejor")
+    args_parser.add_argument("--json", dest="json_path", help="Escribe los resultados en JSON en esta ruta")
+    args = args_parser.parse_args()
+
+    action = Action(args.action)
+    print(f"{'filas':>8}{'páginas':>9}{'total':>12}{'por fila':>12}{'extracción':>14}{'modelos':>12}{'pico':>12}")
+    results = []
+    for rows in map(int, args.sizes.split(",")):
+        result = measure_size(action, rows, args.repeat)
+        results.append(result)
+        per_row = 1e6 / rows if rows else 0
+        print(
+            f"{rows:>8}{result['pages']:>9}{result['total_seconds'] * 1e3:>9.1f} ms"
+            f"{result['total_seconds'] * per_row:>9.1f} µs{result['extraction_seconds'] * per_row:>11.1f} µs"
+            f"{result['models_seconds'] * per_row:>9.1f} µs{result['alloc_peak_bytes'] / 2 ** 20:>8.1f} MiB"
+        )
+        sys.stdout.flush()
+    if args.json_path:
+        with open(args.json_path, "w") as file:
+            json.dump({"action": action.value, "results": results}, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,352 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+Mide las rutas críticas del SDK sobre las páginas de `tests/assets`, con una sesión simulada que responde sin red:
+los métodos de `DefaultNautaScrapper` que descargan y analizan páginas, `parse_errors` y los conversores de
+`suitetecsa_core.utils.nauta`.
+
+Para cada caso informa de las operaciones por segundo, la memoria reservada por operación según `tracemalloc` y el
+pico de memoria residente del proceso. Con `--json` escribe los resultados en JSON y con `--compare` los compara con
+los de una ejecución anterior, terminando con error si algún caso es más lento que el umbral indicado.
+
+Además de las páginas de `tests/assets`, mide la descarga de los cuatro listados de un mes generado con
+`suitetecsa_core.testing.SyntheticHistory`. `benchmarks.scale` mide cómo crecen esos tiempos con el número de filas.
+
+Uso: python -m benchmarks.suite [--number N] [--repeat N] [--filter TEXTO] [--json RUTA] [--compare RUTA]
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+import tracemalloc
+from importlib import metadata
+from typing import Callable
+
+from requests import Response, Session
+
+from suitetecsa_core import Portal
+from suitetecsa_core.repository.scrapper_provider import DefaultNautaScrapper
+from suitetecsa_core.repository.session_provider import DefaultNautaSession
+from suitetecsa_core.testing import SyntheticHistory
+from suitetecsa_core.testing.history import HISTORY_ACTIONS
+from suitetecsa_core.utils import batch
+from suitetecsa_core.utils.nauta import DEFAULT_PARSER, PARSERS, check_parser, make_soup, parse_errors
+from benchmarks.converters import CONVERTERS, load_values
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+assets_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "assets")
+
+_user_url = "https://www.portal.nauta.cu/"
+_connect_url = "https://secure.etecsa.net:8443/"
+
+get_routes = {
+    f"{_user_url}user/login/es-es": "csrf_token.html",
+    f"{_user_url}useraaa/user_info": "user_info.html",
+    f"{_user_url}useraaa/service_detail/": "csrf_token.html",
+    f"{_user_url}useraaa/recharge_detail/": "csrf_token.html",
+    f"{_user_url}useraaa/transfer_detail/": "csrf_token.html",
+    f"{_user_url}useraaa/nautahogarpaid_detail/": "csrf_token.html",
+    f"{_user_url}useraaa/service_detail_list/2023-03/47": "sdl_2023-03_47.html",
+    f"{_user_url}useraaa/service_detail_list/2023-03/47/2": "sdl_2023-03_2.html",
+    f"{_user_url}useraaa/service_detail_list/2023-03/47/3": "sdl_2023-03_3.html",
+    f"{_user_url}useraaa/service_detail_list/2023-03/47/4": "sdl_2023-03_4.html",
+    f"{_user_url}useraaa/recharge_detail_list/2023-03/2": "rdl_2023_03_2.html",
+    f"{_user_url}useraaa/nautahogarpaid_detail_list/2023-03/1": "qpl_2023_03_1.html"
+}
+
+post_routes = {
+    f"{_user_url}user/login/es-es": "user_info.html",
+    f"{_connect_url}EtecsaQueryServlet": "user_info_connect.html",
+    f"{_user_url}useraaa/service_detail_summary/": "sd_summary.html",
+    f"{_user_url}useraaa/recharge_detail_summary/": "rd_summary.html",
+    f"{_user_url}useraaa/transfer_detail_summary/": "td_summary.html",
+    f"{_user_url}useraaa/nautahogarpaid_detail_summary/": "qp_summary.html"
+}
+
+error_pages = (
+    "login_fail_captcha_code.html", "login_fail_user_or_password.html", "recharge_fail.html",
+    "change_password_fail.html"
+)
+
+
+def read_asset(name: str) -> bytes:
+    with open(os.path.join(assets_dir, name), "rb") as file:
+        return file.read()
+
+
+def get_routes_content() -> dict[str, bytes]:
+    return {url: read_asset(name) for url, name in get_routes.items()}
+
+
+def post_routes_content() -> dict[str, bytes]:
+    return {url: read_asset(name) for url, name in post_routes.items()}
+
+
+class AssetSession(Session):
+    """
+    `requests.Session` que, sin conectarse a la red, responde cada URL con el contenido indicado, por defecto, con
+    las páginas de `tests/assets`.
+
+    Las respuestas son objetos `requests.Response` reales, de modo que la decodificación del contenido forma parte de
+    lo que se mide.
+    """
+
+    # `copy` solo conserva los atributos de `__attrs__`, y `DefaultNautaSession` copia la sesión para el portal cautivo
+    __attrs__ = Session.__attrs__ + ["routes"]
+
+    def __init__(self, get: dict[str, str | bytes] = None, post: dict[str, str | bytes] = None) -> None:
+        """
+        Constructor de la clase.
+
+        :param get: El contenido de cada URL que se obtiene con GET. Si no se especifica se usan las páginas de
+        `tests/assets` de `get_routes`.
+        :param post: El contenido de cada URL que se obtiene con POST. Si no se especifica se usan las páginas de
+        `tests/assets` de `post_routes`.
+        """
+        super().__init__()
+        get = get_routes_content() if get is None else get
+        post = post_routes_content() if post is None else post
+        self.routes = {
+            "GET": {url: content.encode() if isinstance(content, str) else content for url, content in get.items()},
+            "POST": {url: content.encode() if isinstance(content, str) else content for url, content in post.items()}
+        }
+
+    def __respond(self, method: str, url: str) -> Response:
+        response = Response()
+        response.url = url
+        response.encoding = "utf-8"
+        content = self.routes[method].get(url)
+        response.status_code, response.reason = (200, "OK") if content is not None else (404, "Not Found")
+        response._content = content or b""
+        response._content_consumed = True
+        return response
+
+    def get(self, url: str, data: dict = None, **kwargs) -> Response:
+        return self.__respond("GET", url)
+
+    def post(self, url: str, data: dict = None, **kwargs) -> Response:
+        return self.__respond("POST", url)
+
+
+def make_scrapper(parser: str = None, history: SyntheticHistory = None) -> DefaultNautaScrapper:
+    """
+    Devuelve un `DefaultNautaScrapper` con sesión iniciada sobre una `AssetSession`.
+
+    :param parser: El backend de análisis HTML.
+    :param history: Si se especifica, la sesión responde las páginas del historial generado en lugar de las de
+    `tests/assets`.
+    """
+    if history is None:
+        session = AssetSession()
+    else:
+        get, post = history.routes()
+        session = AssetSession({**get_routes_content(), **get}, {**post_routes_content(), **post})
+    scrapper = DefaultNautaScrapper(None, DefaultNautaSession(session), parser=parser)
+    scrapper.login("user.name@nauta.com.cu", "some_password", "some_captcha_code")
+    return scrapper
+
+
+def make_cases(parser: str = None, synthetic_rows: int = 500) -> dict[str, Callable[[], object]]:
+    """
+    Devuelve los casos a medir, indexados por nombre. Cada caso es una función sin argumentos que ejecuta una
+    operación.
+
+    :param parser: El backend de análisis HTML.
+    :param synthetic_rows: Filas de cada listado del historial generado con `SyntheticHistory`.
+    """
+    scrapper = make_scrapper(parser)
+    cases = {
+        "scrapper.get_connections": lambda: scrapper.get_connections(2023, 3),
+        "scrapper.get_recharges": lambda: scrapper.get_recharges(2023, 3),
+        "scrapper.get_quotes_paid": lambda: scrapper.get_quotes_paid(2023, 3),
+        "scrapper.get_connections_summary": lambda: scrapper.get_connections_summary(2023, 3),
+        "scrapper.get_recharges_summary": lambda: scrapper.get_recharges_summary(2023, 3),
+        "scrapper.get_transfers_summary": lambda: scrapper.get_transfers_summary(2023, 3),
+        "scrapper.get_quotes_paid_summary": lambda: scrapper.get_quotes_paid_summary(2023, 3),
+        "scrapper.user_information": lambda: scrapper.user_information,
+        "scrapper.get_connect_information": lambda: scrapper.get_connect_information(
+            "user.name@nauta.com.cu", "some_password"
+        )
+    }
+    synthetic_scrapper = make_scrapper(parser, SyntheticHistory(2023, 3, synthetic_rows))
+    for action in HISTORY_ACTIONS:
+        cases[f"scrapper.get_{action.value}[{synthetic_rows} filas sintéticas]"] = (
+            lambda method=getattr(synthetic_scrapper, f"get_{action.value}"): method(2023, 3)
+        )
+    for name in error_pages:
+        soup = make_soup(read_asset(name), parser)
+        cases[f"parse_errors[{name}]"] = lambda soup=soup: parse_errors(soup, Portal.USER, parser)
+    values = load_values()
+    for name, (_, converter) in CONVERTERS.items():
+        items = values[name]
+        if items:
+            cases[f"nauta.{name}[{len(items)}]"] = lambda converter=converter, items=items: [
+                converter(item) for item in items
+            ]
+        batch_converter = getattr(batch, f"batch_{name}", None)
+        if items and batch_converter is not None and batch.numpy is not None:
+            cases[f"batch.batch_{name}[{len(items)}]"] = lambda converter=batch_converter, items=items: converter(
+                items
+            )
+    return cases
+
+
+def peak_rss_kib() -> int | None:
+    """
+    Devuelve el pico de memoria residente del proceso en KiB, o None si la plataforma no permite obtenerlo.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # En macOS `ru_maxrss` se expresa en bytes y en Linux en KiB
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def measure(func: Callable[[], object], number: int, repeat: int) -> dict[str, float | int | None]:
+    """
+    Mide una operación.
+
+    :param func: La operación a medir.
+    :param number: Ejecuciones por repetición.
+    :param repeat: Repeticiones; se toma la más rápida.
+    :return: Un diccionario con las operaciones por segundo, el tiempo por operación, la memoria reservada por una
+    operación (pico y retenida) y el pico de memoria residente del proceso.
+    """
+    func()
+    best = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = func()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return {
+        "ops_per_sec": 1 / best,
+        "seconds_per_op": best,
+        "alloc_peak_bytes": peak - before,
+        "alloc_retained_bytes": after - before,
+        "peak_rss_kib": peak_rss_kib()
+    }
+
+
+def run(number: int = 20, repeat: int = 3, selected: str = None, parser: str = None) -> dict:
+    """
+    Ejecuta los casos y devuelve un informe que se puede serializar en JSON.
+
+    :param number: Ejecuciones de cada caso por repetición.
+    :param repeat: Repeticiones de cada caso.
+    :param selected: Si se especifica, solo se ejecutan los casos cuyo nombre contiene este texto.
+    :param parser: El backend de análisis HTML. Si no se especifica se utiliza `DEFAULT_PARSER`.
+    """
+    parser = check_parser(parser or DEFAULT_PARSER)
+    results = {}
+    for name, func in make_cases(parser).items():
+        if selected is None or selected in name:
+            results[name] = measure(func, number, repeat)
+    return {
+        "environment": environment(parser=parser, number=number, repeat=repeat),
+        "results": results
+    }
+
+
+def environment(**settings) -> dict:
+    """
+    Describe el intérprete, la plataforma y la versión del SDK de una ejecución, junto con sus parámetros, para que los
+    informes de distintas versiones se puedan comparar.
+    """
+    try:
+        version = metadata.version("suitetecsa_core")
+    except metadata.PackageNotFoundError:
+        version = None
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "suitetecsa_core": version,
+        **settings
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Devuelve los nombres de los casos cuyas operaciones por segundo bajaron más de `threshold` (una fracción) respecto
+    de `baseline`.
+    """
+    regressions = []
+    for name, result in report["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is not None and result["ops_per_sec"] < previous["ops_per_sec"] * (1 - threshold):
+            regressions.append(name)
+    return regressions
+
+
+def print_report(report: dict, baseline: dict = None) -> None:
+    header = f"{'caso':<48}{'ops/s':>12}{'tiempo':>14}{'pico':>12}{'retenida':>12}{'RSS':>10}"
+    print(header + (f"{'vs base':>10}" if baseline else ""))
+    for name, result in report["results"].items():
+        line = (
+            f"{name:<48}{result['ops_per_sec']:>12.1f}{result['seconds_per_op'] * 1e6:>11.1f} µs"
+            f"{result['alloc_peak_bytes'] / 1024:>8.1f} KiB{result['alloc_retained_bytes'] / 1024:>8.1f} KiB"
+            f"{result['peak_rss_kib'] or 0:>6} KiB"
+        )
+        previous = (baseline or {}).get("results", {}).get(name)
+        if previous is not None:
+            line += f"{result['ops_per_sec'] / previous['ops_per_sec']:>9.2f}x"
+        print(line)
+
+
+def main():
+    args_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    args_parser.add_argument("--number", type=int, default=20, help="Ejecuciones de cada caso por repetición")
+    args_parser.add_argument("--repeat", type=int, default=3, help="Repeticiones de cada caso; se toma la más rápida")
+    args_parser.add_argument("--filter", dest="selected", help="Ejecuta solo los casos cuyo nombre contiene el texto")
+    args_parser.add_argument("--parser", choices=PARSERS, help="Backend de análisis HTML")
+    args_parser.add_argument(
+        "--json", dest="json_path", help="Escribe el informe en JSON en esta ruta ('-' para la salida estándar)"
+    )
+    args_parser.add_argument("--compare", dest="baseline_path", help="Informe JSON de una ejecución anterior")
+    args_parser.add_argument(
+        "--threshold", type=float, default=0.1, help="Caída de ops/s que se considera una regresión (0.1 = 10%%)"
+    )
+    args = args_parser.parse_args()
+
+    report = run(args.number, args.repeat, args.selected, args.parser)
+    baseline = None
+    if args.baseline_path:
+        with open(args.baseline_path) as file:
+            baseline = json.load(file)
+    if args.json_path == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print_report(report, baseline)
+        if args.json_path:
+            with open(args.json_path, "w") as file:
+                json.dump(report, file, indent=2)
+    if baseline is not None:
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"Regresiones de más del {args.threshold:.0%}: {', '.join(regressions)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
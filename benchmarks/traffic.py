@@ -0,0 +1,119 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+Mide los bytes que envía y recibe el propio SDK en un recorrido típico de una cuenta (comprobar la conexión,
+conectarse, consultar el tiempo restante, desconectarse, iniciar sesión en el portal de usuario, consultar su
+información y descargar un listado del historial) contra un `suitetecsa_core.testing.NautaPortalServer` en el mismo
+proceso.
+
+El recorrido se repite con cada forma de comprobar la conexión (`CONNECTION_PROBES`) y con el servidor enviando las
+respuestas sin comprimir y comprimidas con gzip. El informe muestra, para cada variante, los bytes de cada acción
+según `DefaultNautaSession.traffic` y el total de la sesión.
+
+Uso: python -m benchmarks.traffic [--rows N] [--json RUTA]
+"""
+import argparse
+import json
+import sys
+from dataclasses import asdict
+
+from bs4 import BeautifulSoup
+from requests import Session
+
+from suitetecsa_core.domain.service.nauta_client import NautaClient
+from suitetecsa_core.repository.scrapper_provider import CONNECTION_PROBES, DefaultNautaScrapper
+from suitetecsa_core.repository.session_provider import DefaultNautaSession
+from suitetecsa_core.testing import NautaPortalServer, make_accounts
+from benchmarks.suite import environment
+
+HISTORY_YEAR, HISTORY_MONTH = 2023, 3
+
+
+def measure(rows: int, connection_probe: str, compress: bool) -> dict:
+    """
+    Hace el recorrido con una cuenta nueva y devuelve el tráfico de cada acción y el total de la sesión.
+    """
+    with NautaPortalServer(make_accounts(1, rows), compress=compress) as server:
+        account = next(iter(server.accounts.values()))
+        session = DefaultNautaSession(Session(), count_traffic=True)
+        scrapper = DefaultNautaScrapper(BeautifulSoup(), session, connection_probe=connection_probe)
+        server.configure(scrapper)
+        client = NautaClient(scrapper)
+        client.credentials = (account.username, account.password)
+        try:
+            scrapper.is_connected
+            client.connect()
+            client.remaining_time
+            client.disconnect()
+            client.captcha_image
+            client.login("abcd")
+            client.user_information
+            client.get_connections(HISTORY_YEAR, HISTORY_MONTH)
+            client.logout()
+        finally:
+            session.close()
+    return {
+        "actions": {
+            action.name.lower() if action is not None else "none": {**asdict(traffic), "total": traffic.total}
+            for action, traffic in session.traffic.items()
+        },
+        "bytes_total": session.bytes_total
+    }
+
+
+def run(rows: int = 100) -> dict:
+    """
+    Ejecuta las mediciones y devuelve un informe que se puede serializar en JSON.
+
+    :param rows: Filas de cada listado del historial de la cuenta.
+    """
+    return {
+        "environment": environment(rows=rows),
+        "results": {
+            f"{probe}{'_gzip' if compress else ''}": measure(rows, probe, compress)
+            for compress in (False, True) for probe in CONNECTION_PROBES
+        }
+    }
+
+
+def print_report(report: dict) -> None:
+    results = report["results"]
+    actions = list(dict.fromkeys(action for result in results.values() for action in result["actions"]))
+    print(f"{'acción':<24}" + "".join(f"{variant:>14}" for variant in results))
+    for action in actions:
+        print(f"{action:<24}" + "".join(
+            f"{result['actions'].get(action, {}).get('total', 0):>12} B" for result in results.values()
+        ))
+    print(f"{'total':<24}" + "".join(f"{result['bytes_total']:>12} B" for result in results.values()))
+
+
+def main():
+    args_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    args_parser.add_argument("--rows", type=int, default=100, help="Filas de cada listado del historial")
+    args_parser.add_argument(
+        "--json", dest="json_path", help="Escribe el informe en JSON en esta ruta ('-' para la salida estándar)"
+    )
+    args = args_parser.parse_args()
+
+    report = run(args.rows)
+    if args.json_path == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print_report(report)
+        if args.json_path:
+            with open(args.json_path, "w") as file:
+                json.dump(report, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -31,7 +31,8 @@ setup(
     version='1.1.0',
     packages=[
         'suitetecsa_core', 'suitetecsa_core.core', 'suitetecsa_core.domain', 'suitetecsa_core.domain.model',
-        'suitetecsa_core.domain.service', 'suitetecsa_core.repository', 'suitetecsa_core.utils'
+        'suitetecsa_core.domain.service', 'suitetecsa_core.repository', 'suitetecsa_core.testing',
+        'suitetecsa_core.utils'
     ],
     url='https://github.com/SuitETECSA/suitetecsa-sdk-python',
     license='MIT',
@@ -56,4 +57,9 @@ setup(
         'html5lib',
         'netifaces'
     ],
+    extras_require={
+        'async': ['aiohttp'],
+        'lxml': ['lxml'],
+        'numpy': ['numpy']
+    },
 )
@@ -37,6 +37,12 @@ class Action(Enum):
 from .domain.service.nauta_client import NautaClient
 from .repository.session_provider import DefaultNautaSession
 from .repository.scrapper_provider import DefaultNautaScrapper
+from .domain.service.async_nauta_client import AsyncNautaClient
+from .repository.async_session_provider import DefaultAsyncNautaSession
+from .repository.async_scrapper_provider import DefaultAsyncNautaScrapper
 
 
-__all__ = ['Portal', 'Action', 'NautaClient', 'DefaultNautaSession', 'DefaultNautaScrapper']
+__all__ = [
+    'Portal', 'Action', 'NautaClient', 'DefaultNautaSession', 'DefaultNautaScrapper',
+    'AsyncNautaClient', 'DefaultAsyncNautaSession', 'DefaultAsyncNautaScrapper'
+]
@@ -12,6 +12,7 @@
 
 from .connections_summary import ConnectionsSummary
 from .connection import Connection
+from .connection_log import ConnectionLog
 from .quotes_paid_summary import QuotesPaidSummary
 from .quote_paid import QuotePaid
 from .recharges_summary import RechargesSummary
@@ -21,6 +22,6 @@ from .transfer import Transfer
 from .nauta_user import NautaUser
 
 __all__ = [
-    'ConnectionsSummary', 'Connection', 'QuotesPaidSummary', 'QuotePaid',
+    'ConnectionsSummary', 'Connection', 'ConnectionLog', 'QuotesPaidSummary', 'QuotePaid',
     'RechargesSummary', 'Recharge', 'TransfersSummary', 'Transfer', 'NautaUser'
 ]
@@ -11,13 +11,14 @@
 #  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 import datetime
-from dataclasses import dataclass, fields
+from dataclasses import dataclass
 
+from suitetecsa_core.domain.model.portal_model import PortalModel
 from suitetecsa_core.utils.nauta import str_to_float, parse_datetime, convert_to_bytes, time_string_to_seconds
 
 
-@dataclass
-class Connection:
+@dataclass(slots=True)
+class Connection(PortalModel):
 
     start_session: datetime.datetime
     end_session: datetime.datetime
@@ -26,15 +27,11 @@ class Connection:
     downloaded: int
     import_: float
 
-    @classmethod
-    def from_dict(cls, data):
-        keys = [f.name for f in fields(cls)]
-        normal_keys = {key: data[key] for key in data if key in keys}
-        normal_keys["start_session"] = parse_datetime(normal_keys["start_session"])
-        normal_keys["end_session"] = parse_datetime(normal_keys["end_session"])
-        normal_keys["import_"] = str_to_float(normal_keys["import_"])
-        normal_keys["duration"] = time_string_to_seconds(normal_keys["duration"])
-        for key in keys:
-            if key in ["uploaded", "downloaded"]:
-                normal_keys[key] = convert_to_bytes(normal_keys[key])
-        return cls(**normal_keys)
+    _converters = {
+        "start_session": parse_datetime,
+        "end_session": parse_datetime,
+        "duration": time_string_to_seconds,
+        "uploaded": convert_to_bytes,
+        "downloaded": convert_to_bytes,
+        "import_": str_to_float
+    }
@@ -0,0 +1,194 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import datetime
+from array import array
+from typing import Iterable, Iterator, Sequence
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from .connection import Connection
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_SECONDS_PER_DAY = 86400
+_INT_COLUMNS = ("start_session", "end_session", "duration", "uploaded", "downloaded")
+
+
+def _to_epoch(value: datetime.datetime) -> int:
+    # Las fechas del portal no tienen zona horaria, así que se cuentan los segundos tal cual desde 1970-01-01
+    return (value - _EPOCH) // datetime.timedelta(seconds=1)
+
+
+def _from_epoch(seconds: int) -> datetime.datetime:
+    return _EPOCH + datetime.timedelta(seconds=seconds)
+
+
+class ConnectionLog:
+    """
+    Contenedor por columnas de un historial de conexiones.
+
+    Cada campo de `Connection` se guarda en un `array` (enteros de 64 bits y `float` para el importe), con las fechas
+    como segundos desde 1970-01-01. Los totales, filtros y agrupaciones por día operan sobre las columnas y, si NumPy
+    está instalado, se vectorizan sin copiar los datos. Los objetos `Connection` solo se crean al pedirlos.
+    """
+
+    __slots__ = _INT_COLUMNS + ("import_",)
+
+    def __init__(self) -> None:
+        for name in _INT_COLUMNS:
+            setattr(self, name, array("q"))
+        self.import_ = array("d")
+
+    @classmethod
+    def from_connections(cls, connections: Iterable[Connection]) -> "ConnectionLog":
+        """
+        Construye el contenedor a partir de objetos `Connection`, por ejemplo, los que devuelve `get_connections` o
+        `iter_connections`.
+        """
+        log = cls()
+        log.extend(connections)
+        return log
+
+    def append(self, connection: Connection) -> None:
+        self.start_session.append(_to_epoch(connection.start_session))
+        self.end_session.append(_to_epoch(connection.end_session))
+        self.duration.append(connection.duration)
+        self.uploaded.append(connection.uploaded)
+        self.downloaded.append(connection.downloaded)
+        self.import_.append(connection.import_)
+
+    def extend(self, connections: Iterable[Connection]) -> None:
+        for connection in connections:
+            self.append(connection)
+
+    def __len__(self) -> int:
+        return len(self.start_session)
+
+    def __getitem__(self, index: int) -> Connection:
+        return Connection(
+            start_session=_from_epoch(self.start_session[index]),
+            end_session=_from_epoch(self.end_session[index]),
+            duration=self.duration[index],
+            uploaded=self.uploaded[index],
+            downloaded=self.downloaded[index],
+            import_=self.import_[index]
+        )
+
+    def __iter__(self) -> Iterator[Connection]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_connections(self) -> list[Connection]:
+        return list(self)
+
+    def to_numpy(self) -> dict:
+        """
+        Devuelve las columnas como arrays de NumPy que comparten la memoria de las columnas del contenedor. Mientras
+        existan, no es posible añadir conexiones al contenedor.
+
+        :raises ImportError: Si NumPy no está instalado.
+        """
+        if numpy is None:
+            raise ImportError("numpy is required: pip install suitetecsa_core[numpy]")
+        columns = {name: numpy.frombuffer(getattr(self, name), dtype=numpy.int64) for name in _INT_COLUMNS}
+        columns["import_"] = numpy.frombuffer(self.import_, dtype=numpy.float64)
+        return columns
+
+    def __sum(self, name: str) -> int | float:
+        column = getattr(self, name)
+        if numpy is None or not len(column):
+            return sum(column)
+        return numpy.frombuffer(column, dtype=numpy.float64 if name == "import_" else numpy.int64).sum().item()
+
+    @property
+    def total_duration(self) -> int:
+        return self.__sum("duration")
+
+    @property
+    def total_uploaded(self) -> int:
+        return self.__sum("uploaded")
+
+    @property
+    def total_downloaded(self) -> int:
+        return self.__sum("downloaded")
+
+    @property
+    def total_traffic(self) -> int:
+        return self.total_uploaded + self.total_downloaded
+
+    @property
+    def total_import(self) -> float:
+        return self.__sum("import_")
+
+    def filter(self, mask: Sequence[bool]) -> "ConnectionLog":
+        """
+        Devuelve un nuevo contenedor con las conexiones cuya posición en `mask` es verdadera.
+
+        :param mask: Una secuencia de valores booleanos con la misma longitud que el contenedor.
+        :raises ValueError: Si `mask` no tiene la misma longitud que el contenedor.
+        """
+        if len(mask) != len(self):
+            raise ValueError("mask debe tener la misma longitud que el contenedor")
+        log = ConnectionLog()
+        if numpy is not None:
+            mask = numpy.asarray(mask, dtype=bool)
+            for name, column in self.to_numpy().items():
+                getattr(log, name).frombytes(column[mask].tobytes())
+        else:
+            for name in self.__slots__:
+                getattr(log, name).extend(value for value, keep in zip(getattr(self, name), mask) if keep)
+        return log
+
+    def between(self, start: datetime.datetime, end: datetime.datetime) -> "ConnectionLog":
+        """
+        Devuelve un nuevo contenedor con las conexiones iniciadas entre `start` y `end`, ambos incluidos.
+        """
+        start, end = _to_epoch(start), _to_epoch(end)
+        if numpy is not None:
+            starts = self.to_numpy()["start_session"]
+            return self.filter((starts >= start) & (starts <= end))
+        return self.filter([start <= value <= end for value in self.start_session])
+
+    def group_by_day(self) -> dict[datetime.date, dict[str, int | float]]:
+        """
+        Agrupa las conexiones por el día en que se iniciaron.
+
+        :return: Un diccionario ordenado por fecha con el número de conexiones y los totales de duración, tráfico e
+        importe de cada día.
+        """
+        if numpy is not None and len(self):
+            columns = self.to_numpy()
+            days, inverse = numpy.unique(columns["start_session"] // _SECONDS_PER_DAY, return_inverse=True)
+            totals = {"count": numpy.bincount(inverse)}
+            for name in ("duration", "uploaded", "downloaded"):
+                totals[name] = numpy.zeros(len(days), dtype=numpy.int64)
+                numpy.add.at(totals[name], inverse, columns[name])
+            totals["import_"] = numpy.bincount(inverse, weights=columns["import_"])
+            return {
+                (_EPOCH + datetime.timedelta(days=int(day))).date(): {
+                    name: column[index].item() for name, column in totals.items()
+                } for index, day in enumerate(days)
+            }
+        groups = {}
+        for index, start in enumerate(self.start_session):
+            group = groups.setdefault(
+                start // _SECONDS_PER_DAY, {"count": 0, "duration": 0, "uploaded": 0, "downloaded": 0, "import_": 0.0}
+            )
+            group["count"] += 1
+            group["duration"] += self.duration[index]
+            group["uploaded"] += self.uploaded[index]
+            group["downloaded"] += self.downloaded[index]
+            group["import_"] += self.import_[index]
+        return {(_EPOCH + datetime.timedelta(days=day)).date(): groups[day] for day in sorted(groups)}
@@ -10,13 +10,14 @@
 #  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
 #  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
-from dataclasses import dataclass, fields
+from dataclasses import dataclass
 
+from suitetecsa_core.domain.model.portal_model import PortalModel
 from suitetecsa_core.utils.nauta import str_to_float, convert_to_bytes, time_string_to_seconds
 
 
-@dataclass
-class ConnectionsSummary:
+@dataclass(slots=True)
+class ConnectionsSummary(PortalModel):
 
     count: int
     year_month_selected: str
@@ -26,13 +27,12 @@ class ConnectionsSummary:
     downloaded: int
     total_traffic: int
 
-    @classmethod
-    def from_dict(cls, data):
-        keys = [f.name for f in fields(cls)]
-        normal_keys = {key: data[key] for key in data if key in keys}
-        normal_keys["total_time"] = time_string_to_seconds(normal_keys["total_time"])
-        normal_keys["total_import"] = str_to_float(normal_keys["total_import"])
-        for key in keys:
-            if key in ["uploaded", "downloaded", "total_traffic"]:
-                normal_keys[key] = convert_to_bytes(normal_keys[key])
-        return cls(**normal_keys)
+    _converters = {
+        "count": None,
+        "year_month_selected": None,
+        "total_time": time_string_to_seconds,
+        "total_import": str_to_float,
+        "uploaded": convert_to_bytes,
+        "downloaded": convert_to_bytes,
+        "total_traffic": convert_to_bytes
+    }
@@ -11,13 +11,14 @@
 #  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 import datetime
-from dataclasses import dataclass, fields
+from dataclasses import dataclass
 
+from suitetecsa_core.domain.model.portal_model import PortalModel
 from suitetecsa_core.utils.nauta import str_to_date, str_to_float, time_string_to_seconds
 
 
-@dataclass
-class NautaUser:
+@dataclass(slots=True)
+class NautaUser(PortalModel):
     username: str
     blocking_date: datetime.date
     date_of_elimination: datetime.date
@@ -40,19 +41,26 @@ class NautaUser:
     voucher: float = None
     debt: float = None
 
-    @classmethod
-    def from_dict(cls, data):
-        keys = [f.name for f in fields(cls)]
-        normal_keys = {key: data[key] for key in data if key in keys}
-        normal_keys['time'] = time_string_to_seconds(normal_keys["time"])
-        for key in keys:
-            if key in [
-                "blocking_date", "date_of_elimination", "activation_date",
-                "blocking_date_home", "date_of_elimination_home"
-            ]:
-                normal_keys[key] = str_to_date(normal_keys[key])
-            elif key in [
-                "credit", "monthly_fee", "quote_paid", "voucher", "debt"
-            ]:
-                normal_keys[key] = str_to_float(normal_keys[key])
-        return cls(**normal_keys)
+    _converters = {
+        "username": None,
+        "blocking_date": str_to_date,
+        "date_of_elimination": str_to_date,
+        "account_type": None,
+        "service_type": None,
+        "credit": str_to_float,
+        "time": time_string_to_seconds,
+        "mail_account": None,
+        "offer": None,
+        "monthly_fee": str_to_float,
+        "download_speeds": None,
+        "upload_speeds": None,
+        "phone": None,
+        "link_identifiers": None,
+        "link_status": None,
+        "activation_date": str_to_date,
+        "blocking_date_home": str_to_date,
+        "date_of_elimination_home": str_to_date,
+        "quote_paid": str_to_float,
+        "voucher": str_to_float,
+        "debt": str_to_float
+    }
@@ -0,0 +1,40 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+from typing import Callable, ClassVar
+
+
+class PortalModel:
+    """
+    Base de los modelos que se construyen a partir del texto del portal.
+
+    Cada modelo declara en `_converters` la conversión de cada campo desde el texto del portal, en el orden de los
+    campos, o None si el campo no requiere conversión.
+    """
+
+    __slots__ = ()
+    _converters: ClassVar[dict[str, Callable[[str], object] | None]] = {}
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(**{
+            key: data[key] if convert is None else convert(data[key])
+            for key, convert in cls._converters.items() if key in data
+        })
+
+    @classmethod
+    def from_cells(cls, cells: tuple[str, ...]):
+        """
+        Construye el objeto a partir del texto de las celdas de una fila del listado, en el orden de los campos.
+        """
+        return cls(*[
+            cell if convert is None else convert(cell) for convert, cell in zip(cls._converters.values(), cells)
+        ])
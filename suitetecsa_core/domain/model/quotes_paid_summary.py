@@ -10,21 +10,21 @@
 #  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
 #  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
-from dataclasses import dataclass, fields
+from dataclasses import dataclass
 
+from suitetecsa_core.domain.model.portal_model import PortalModel
 from suitetecsa_core.utils.nauta import str_to_float
 
 
-@dataclass
-class QuotesPaidSummary:
+@dataclass(slots=True)
+class QuotesPaidSummary(PortalModel):
 
     count: int
     year_month_selected: str
     total_import: float
 
-    @classmethod
-    def from_dict(cls, data):
-        keys = [f.name for f in fields(cls)]
-        normal_keys = {key: data[key] for key in data if key in keys}
-        normal_keys["total_import"] = str_to_float(normal_keys["total_import"])
-        return cls(**normal_keys)
+    _converters = {
+        "count": None,
+        "year_month_selected": None,
+        "total_import": str_to_float
+    }
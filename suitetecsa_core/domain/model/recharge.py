@@ -11,23 +11,23 @@
 #  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 import datetime
-from dataclasses import dataclass, fields
+from dataclasses import dataclass
 
+from suitetecsa_core.domain.model.portal_model import PortalModel
 from suitetecsa_core.utils.nauta import str_to_float, parse_datetime
 
 
-@dataclass
-class Recharge:
+@dataclass(slots=True)
+class Recharge(PortalModel):
 
     date: datetime.datetime
     import_: float
     channel: str
     type_: str
 
-    @classmethod
-    def from_dict(cls, data):
-        keys = [f.name for f in fields(cls)]
-        normal_keys = {key: data[key] for key in data if key in keys}
-        normal_keys["date"] = parse_datetime(normal_keys["date"])
-        normal_keys["import_"] = str_to_float(normal_keys["import_"])
-        return cls(**normal_keys)
+    _converters = {
+        "date": parse_datetime,
+        "import_": str_to_float,
+        "channel": None,
+        "type_": None
+    }
@@ -0,0 +1,239 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import datetime
+from typing import AsyncIterator
+
+from suitetecsa_core import Action
+from suitetecsa_core.core.exceptions import NautaException, NotLoggedIn
+from suitetecsa_core.domain.model import NautaUser, ConnectionsSummary, RechargesSummary, TransfersSummary, \
+    QuotesPaidSummary, Connection, Recharge, Transfer, QuotePaid
+from suitetecsa_core.repository.async_scrapper_provider import AsyncNautaScrapper
+from suitetecsa_core.repository.cache_provider import HistoryCache
+from suitetecsa_core.utils.nauta import time_string_to_seconds
+
+
+class AsyncNautaClient:
+    """
+    Contraparte asíncrona de `NautaClient`. Las propiedades que realizan peticiones a los portales se exponen como
+    corrutinas.
+    """
+
+    _username: str = None
+    _password: str = None
+
+    def __init__(self, scrapper: AsyncNautaScrapper, cache: HistoryCache = None) -> None:
+        """
+        Constructor de la clase.
+
+        :param scrapper: El scrapper a utilizar.
+        :param cache: Opcionalmente, la cache de resúmenes y listados del historial. Los meses cerrados se sirven
+        desde la cache sin realizar ninguna petición al portal. Sin credenciales, el historial no se guarda en la cache.
+        """
+        self.__scrapper = scrapper
+        self.__cache = cache
+
+    @property
+    def cache(self) -> HistoryCache:
+        return self.__cache
+
+    async def __get_summary(self, action: Action, year: int, month: int, fetch):
+        if self.__cache is None or not self._username:
+            return await fetch(year, month)
+        summary = self.__cache.get(self._username, action, year, month, "summary")
+        if summary is None:
+            summary = await fetch(year, month)
+            self.__cache.set(self._username, action, year, month, "summary", summary)
+        return summary
+
+    async def __get_list(
+            self, action: Action, year: int, month: int, summary, large: int, _reversed: bool, fetch_summary, fetch
+    ) -> list:
+        """
+        Devuelve un listado del historial, reutilizando el listado completo del mes si está en la cache.
+
+        Solo se guardan en la cache los listados completos; `large` y `_reversed` se aplican sobre ellos. Si el
+        listado no está en la cache y se solicita solo una parte, se obtiene directamente del portal.
+        """
+        if self.__cache is None or not self._username:
+            return await fetch(year, month, summary, large, _reversed)
+        rows = self.__cache.get(self._username, action, year, month, "list")
+        if rows is None:
+            summary = summary or await self.__get_summary(action, year, month, fetch_summary)
+            if large != 0:
+                return await fetch(year, month, summary, large, _reversed)
+            rows = await fetch(year, month, summary, 0, False)
+            self.__cache.set(self._username, action, year, month, "list", rows)
+        rows = rows[::-1] if _reversed else list(rows)
+        return rows[:abs(large)] if large else rows
+
+    @property
+    def credentials(self) -> tuple[str, str]:
+        return self._username, self._password
+
+    @credentials.setter
+    def credentials(self, value) -> None:
+        self._username, self._password = value
+
+    async def is_connected(self) -> bool:
+        return await self.__scrapper.is_connected()
+
+    async def user_information(self) -> NautaUser:
+        return await self.__scrapper.user_information()
+
+    async def connect_information(self) -> dict:
+        if not self._username or not self._password:
+            raise ValueError("username and password are required")
+        if not await self.check_portal_access():
+            raise NautaException("There is no access to the portal")
+        return await self.__scrapper.get_connect_information(self._username, self._password)
+
+    @property
+    def data_session(self) -> dict[str, str]:
+        if not self.__scrapper.is_logged_in:
+            raise NotLoggedIn("You are not logged in")
+        return self.__scrapper.data_session
+
+    async def captcha_image(self) -> bytes:
+        return await self.__scrapper.captcha_image()
+
+    async def remaining_time(self) -> int:
+        return time_string_to_seconds(await self.__scrapper.remaining_time())
+
+    async def check_portal_access(self) -> bool:
+        return await self.__scrapper.check_portal_access()
+
+    async def connect(self) -> None:
+        if not self._username or not self._password:
+            raise ValueError("username and password are required")
+        if not await self.check_portal_access():
+            raise NautaException("There is no access to the portal")
+        await self.__scrapper.connect(self._username, self._password)
+
+    async def disconnect(self) -> None:
+        if not self.__scrapper.is_logged_in:
+            raise NotLoggedIn("You are not logged in")
+        await self.__scrapper.disconnect()
+
+    async def login(self, captcha_code: str) -> NautaUser:
+        if not self._username or not self._password or not captcha_code:
+            raise ValueError("username and password are required")
+        return await self.__scrapper.login(self._username, self._password, captcha_code)
+
+    async def logout(self):
+        if not self.__scrapper.is_user_logged_in:
+            raise NotLoggedIn("You are not logged in")
+        await self.__scrapper.logout()
+
+    async def to_up(self, recharge_code: str) -> None:
+        await self.__scrapper.to_up(recharge_code)
+
+    async def transfer(self, amount: float, destination_account: str) -> None:
+        await self.__scrapper.transfer(amount, self._password, destination_account)
+
+    async def pay_nauta_home(self, amount: float) -> None:
+        if not self.__scrapper.is_nauta_home:
+            raise NautaException("Operation not allowed for this account")
+        await self.__scrapper.transfer(amount, self._password)
+
+    async def change_password(self, new_password: str) -> None:
+        await self.__scrapper.change_password(self._password, new_password)
+
+    async def change_email_password(self, old_password: str, new_password: str) -> None:
+        await self.__scrapper.change_email_password(old_password, new_password)
+
+    async def get_connections_summary(self, year: int, month: int) -> ConnectionsSummary:
+        return await self.__get_summary(Action.GET_CONNECTIONS, year, month, self.__scrapper.get_connections_summary)
+
+    async def get_recharges_summary(self, year: int, month: int) -> RechargesSummary:
+        return await self.__get_summary(Action.GET_RECHARGES, year, month, self.__scrapper.get_recharges_summary)
+
+    async def get_transfers_summary(self, year: int, month: int) -> TransfersSummary:
+        return await self.__get_summary(Action.GET_TRANSFERS, year, month, self.__scrapper.get_transfers_summary)
+
+    async def get_quotes_paid_summary(self, year: int, month: int) -> QuotesPaidSummary:
+        return await self.__get_summary(Action.GET_QUOTES_PAID, year, month, self.__scrapper.get_quotes_paid_summary)
+
+    async def get_connections(
+            self, year: int, month: int, summary: ConnectionsSummary = None, large: int = 0, _reversed: bool = False
+    ):
+        return await self.__get_list(
+            Action.GET_CONNECTIONS, year, month, summary, large, _reversed, self.__scrapper.get_connections_summary,
+            self.__scrapper.get_connections
+        )
+
+    async def get_recharges(
+            self, year: int, month: int, summary: RechargesSummary = None, large: int = 0, _reversed: bool = False
+    ):
+        return await self.__get_list(
+            Action.GET_RECHARGES, year, month, summary, large, _reversed, self.__scrapper.get_recharges_summary,
+            self.__scrapper.get_recharges
+        )
+
+    async def get_transfers(
+            self, year: int, month: int, summary: TransfersSummary = None, large: int = 0, _reversed: bool = False
+    ):
+        return await self.__get_list(
+            Action.GET_TRANSFERS, year, month, summary, large, _reversed, self.__scrapper.get_transfers_summary,
+            self.__scrapper.get_transfers
+        )
+
+    async def get_quotes_paid(
+            self, year: int, month: int, summary: QuotesPaidSummary = None, large: int = 0, _reversed: bool = False
+    ):
+        return await self.__get_list(
+            Action.GET_QUOTES_PAID, year, month, summary, large, _reversed, self.__scrapper.get_quotes_paid_summary,
+            self.__scrapper.get_quotes_paid
+        )
+
+    async def get_connections_between(
+            self, start_date: datetime.date | datetime.datetime, end_date: datetime.date | datetime.datetime
+    ) -> list[Connection]:
+        return await self.__scrapper.get_connections_between(start_date, end_date)
+
+    async def get_recharges_between(
+            self, start_date: datetime.date | datetime.datetime, end_date: datetime.date | datetime.datetime
+    ) -> list[Recharge]:
+        return await self.__scrapper.get_recharges_between(start_date, end_date)
+
+    async def get_transfers_between(
+            self, start_date: datetime.date | datetime.datetime, end_date: datetime.date | datetime.datetime
+    ) -> list[Transfer]:
+        return await self.__scrapper.get_transfers_between(start_date, end_date)
+
+    async def get_quotes_paid_between(
+            self, start_date: datetime.date | datetime.datetime, end_date: datetime.date | datetime.datetime
+    ) -> list[QuotePaid]:
+        return await self.__scrapper.get_quotes_paid_between(start_date, end_date)
+
+    async def iter_connections(
+            self, year: int, month: int, summary: ConnectionsSummary = None, _reversed: bool = False
+    ) -> AsyncIterator[Connection]:
+        async for row in self.__scrapper.iter_connections(year, month, summary, _reversed):
+            yield row
+
+    async def iter_recharges(
+            self, year: int, month: int, summary: RechargesSummary = None, _reversed: bool = False
+    ) -> AsyncIterator[Recharge]:
+        async for row in self.__scrapper.iter_recharges(year, month, summary, _reversed):
+            yield row
+
+    async def iter_transfers(
+            self, year: int, month: int, summary: TransfersSummary = None, _reversed: bool = False
+    ) -> AsyncIterator[Transfer]:
+        async for row in self.__scrapper.iter_transfers(year, month, summary, _reversed):
+            yield row
+
+    async def iter_quotes_paid(
+            self, year: int, month: int, summary: QuotesPaidSummary = None, _reversed: bool = False
+    ) -> AsyncIterator[QuotePaid]:
+        async for row in self.__scrapper.iter_quotes_paid(year, month, summary, _reversed):
+            yield row
@@ -9,9 +9,14 @@
 #  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
 #  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
 #  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import datetime
+from typing import Iterator
+
+from suitetecsa_core import Action
 from suitetecsa_core.core.exceptions import NautaException, NotLoggedIn
 from suitetecsa_core.domain.model import NautaUser, ConnectionsSummary, RechargesSummary, TransfersSummary, \
-    QuotesPaidSummary
+    QuotesPaidSummary, Connection, Recharge, Transfer, QuotePaid
+from suitetecsa_core.repository.cache_provider import HistoryCache
 from suitetecsa_core.repository.scrapper_provider import NautaScrapper
 from suitetecsa_core.utils.nauta import time_string_to_seconds
 
@@ -21,8 +26,50 @@ class NautaClient:
     _username: str = None
     _password: str = None
 
-    def __init__(self, scrapper: NautaScrapper) -> None:
+    def __init__(self, scrapper: NautaScrapper, cache: HistoryCache = None) -> None:
+        """
+        Constructor de la clase.
+
+        :param scrapper: El scrapper a utilizar.
+        :param cache: Opcionalmente, la cache de resúmenes y listados del historial. Los meses cerrados se sirven
+        desde la cache sin realizar ninguna petición al portal. Sin credenciales, el historial no se guarda en la cache.
+        """
         self.__scrapper = scrapper
+        self.__cache = cache
+
+    @property
+    def cache(self) -> HistoryCache:
+        return self.__cache
+
+    def __get_summary(self, action: Action, year: int, month: int, fetch):
+        if self.__cache is None or not self._username:
+            return fetch(year, month)
+        summary = self.__cache.get(self._username, action, year, month, "summary")
+        if summary is None:
+            summary = fetch(year, month)
+            self.__cache.set(self._username, action, year, month, "summary", summary)
+        return summary
+
+    def __get_list(
+            self, action: Action, year: int, month: int, summary, large: int, _reversed: bool, fetch_summary, fetch
+    ) -> list:
+        """
+        Devuelve un listado del historial, reutilizando el listado completo del mes si está en la cache.
+
+        Solo se guardan en la cache los listados completos; `large` y `_reversed` se aplican sobre ellos. Si el
+        listado no está en la cache y se solicita solo una parte, se obtiene directamente del portal.
+        """
+        if self.__cache is None or not self._username:
+            return fetch(year, month, summary, large, _reversed)
+        rows = self.__cache.get(self._username, action, year, month, "list")
+        if rows is None:
+            summary = summary or self.__get_summary(action, year, month, fetch_summary)
+            if large != 0:
+                return fetch(year, month, summary, large, _reversed)
+            rows = fetch(year, month, summary, 0, False)
+            self.__cache.set(self._username, action, year, month, "list", rows)
+        rows = rows[::-1] if _reversed else list(rows)
+        return rows[:abs(large)] if large else rows
 
     @property
     def credentials(self) -> tuple[str, str]:
@@ -111,33 +158,85 @@ class NautaClient:
         self.__scrapper.change_email_password(old_password, new_password)
 
     def get_connections_summary(self, year: int, month: int) -> ConnectionsSummary:
-        return self.__scrapper.get_connections_summary(year, month)
+        return self.__get_summary(Action.GET_CONNECTIONS, year, month, self.__scrapper.get_connections_summary)
 
     def get_recharges_summary(self, year: int, month: int) -> RechargesSummary:
-        return self.__scrapper.get_recharges_summary(year, month)
+        return self.__get_summary(Action.GET_RECHARGES, year, month, self.__scrapper.get_recharges_summary)
 
     def get_transfers_summary(self, year: int, month: int) -> TransfersSummary:
-        return self.__scrapper.get_transfers_summary(year, month)
+        return self.__get_summary(Action.GET_TRANSFERS, year, month, self.__scrapper.get_transfers_summary)
 
     def get_quotes_paid_summary(self, year: int, month: int) -> QuotesPaidSummary:
-        return self.__scrapper.get_quotes_paid_summary(year, month)
+        return self.__get_summary(Action.GET_QUOTES_PAID, year, month, self.__scrapper.get_quotes_paid_summary)
 
     def get_connections(
             self, year: int, month: int, summary: ConnectionsSummary = None, large: int = 0, _reversed: bool = False
     ):
-        return self.__scrapper.get_connections(year, month, summary, large, _reversed)
+        return self.__get_list(
+            Action.GET_CONNECTIONS, year, month, summary, large, _reversed, self.__scrapper.get_connections_summary,
+            self.__scrapper.get_connections
+        )
 
     def get_recharges(
             self, year: int, month: int, summary: RechargesSummary = None, large: int = 0, _reversed: bool = False
     ):
-        return self.__scrapper.get_recharges(year, month, summary, large, _reversed)
+        return self.__get_list(
+            Action.GET_RECHARGES, year, month, summary, large, _reversed, self.__scrapper.get_recharges_summary,
+            self.__scrapper.get_recharges
+        )
 
     def get_transfers(
             self, year: int, month: int, summary: TransfersSummary = None, large: int = 0, _reversed: bool = False
     ):
-        return self.__scrapper.get_transfers(year, month, summary, large, _reversed)
+        return self.__get_list(
+            Action.GET_TRANSFERS, year, month, summary, large, _reversed, self.__scrapper.get_transfers_summary,
+            self.__scrapper.get_transfers
+        )
 
     def get_quotes_paid(
             self, year: int, month: int, summary: QuotesPaidSummary = None, large: int = 0, _reversed: bool = False
     ):
-        return self.__scrapper.get_quotes_paid(year, month, summary, large, _reversed)
+        return self.__get_list(
+            Action.GET_QUOTES_PAID, year, month, summary, large, _reversed, self.__scrapper.get_quotes_paid_summary,
+            self.__scrapper.get_quotes_paid
+        )
+
+    def get_connections_between(
+            self, start_date: datetime.date | datetime.datetime, end_date: datetime.date | datetime.datetime
+    ) -> list[Connection]:
+        return self.__scrapper.get_connections_between(start_date, end_date)
+
+    def get_recharges_between(
+            self, start_date: datetime.date | datetime.datetime, end_date: datetime.date | datetime.datetime
+    ) -> list[Recharge]:
+        return self.__scrapper.get_recharges_between(start_date, end_date)
+
+    def get_transfers_between(
+            self, start_date: datetime.date | datetime.datetime, end_date: datetime.date | datetime.datetime
+    ) -> list[Transfer]:
+        return self.__scrapper.get_transfers_between(start_date, end_date)
+
+    def get_quotes_paid_between(
+            self, start_date: datetime.date | datetime.datetime, end_date: datetime.date | datetime.datetime
+    ) -> list[QuotePaid]:
+        return self.__scrapper.get_quotes_paid_between(start_date, end_date)
+
+    def iter_connections(
+            self, year: int, month: int, summary: ConnectionsSummary = None, _reversed: bool = False
+    ) -> Iterator[Connection]:
+        return self.__scrapper.iter_connections(year, month, summary, _reversed)
+
+    def iter_recharges(
+            self, year: int, month: int, summary: RechargesSummary = None, _reversed: bool = False
+    ) -> Iterator[Recharge]:
+        return self.__scrapper.iter_recharges(year, month, summary, _reversed)
+
+    def iter_transfers(
+            self, year: int, month: int, summary: TransfersSummary = None, _reversed: bool = False
+    ) -> Iterator[Transfer]:
+        return self.__scrapper.iter_transfers(year, month, summary, _reversed)
+
+    def iter_quotes_paid(
+            self, year: int, month: int, summary: QuotesPaidSummary = None, _reversed: bool = False
+    ) -> Iterator[QuotePaid]:
+        return self.__scrapper.iter_quotes_paid(year, month, summary, _reversed)
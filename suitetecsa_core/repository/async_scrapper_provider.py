@@ -0,0 +1,696 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import asyncio
+import datetime
+import logging
+import re
+from abc import ABCMeta, abstractmethod
+from concurrent.futures import Executor
+from typing import Type, Callable, AsyncIterator
+
+from suitetecsa_core import Portal, Action
+from suitetecsa_core.core.exceptions import GetInfoException, NotLoggedIn, PreLoginException, LoginException, \
+    RechargeException, TransferException, ChangePasswordException, LogoutException
+from suitetecsa_core.domain.model import ConnectionsSummary, RechargesSummary, TransfersSummary, QuotesPaidSummary, \
+    Connection, Recharge, Transfer, QuotePaid, NautaUser
+from suitetecsa_core.repository.async_session_provider import AsyncNautaSession, AsyncNautaResponse
+from suitetecsa_core.repository.scrapper_provider import BaseNautaScrapper
+from suitetecsa_core.utils.nauta import DEFAULT_PARSER, check_parser, make_soup, datetime_range, months_between
+from suitetecsa_core.utils.parser import find_errors, get_inputs, get_csrf, parse_user_information, \
+    parse_connect_information, get_summary_cards, get_table_rows, extract_table_rows, summaries_parsers, \
+    rows_parsers
+
+logger = logging.getLogger()
+
+_summaries_errors_messages = {
+    Action.GET_CONNECTIONS: "Error al obtener el resumen de conexiones",
+    Action.GET_RECHARGES: "Error al obtener el resumen de recargas",
+    Action.GET_QUOTES_PAID: "Error al obtener el resumen de cotizaciones pagadas",
+    Action.GET_TRANSFERS: "Error al obtener el resumen de transferencias"
+}
+_actions_details = {
+    Action.GET_CONNECTIONS: "service_detail",
+    Action.GET_RECHARGES: "recharge_detail",
+    Action.GET_QUOTES_PAID: "nautahogarpaid_detail",
+    Action.GET_TRANSFERS: "transfer_detail"
+}
+
+
+# Funciones de análisis que se ejecutan fuera del bucle de eventos. Reciben el texto de la respuesta y devuelven
+# datos ya extraídos, de forma que ningún árbol de BeautifulSoup cruza de vuelta al bucle.
+
+def _parse_csrf(text: str, parser: str, exception: Type[Exception], message: str) -> str:
+    soup = make_soup(text, parser)
+    find_errors(soup, Portal.USER, exception, message, parser)
+    return get_csrf(soup)
+
+
+def _parse_errors(text: str, parser: str, portal_manager: Portal, exception: Type[Exception], message: str) -> None:
+    find_errors(make_soup(text, parser), portal_manager, exception, message, parser)
+
+
+def _parse_form(text: str, parser: str, form_selector: str = None) -> tuple[str, dict]:
+    soup = make_soup(text, parser)
+    form_soup = soup.select_one(form_selector) if form_selector else soup.form
+    return form_soup["action"], get_inputs(form_soup)
+
+
+def _parse_user_information(text: str, parser: str, exception: Type[Exception], message: str) -> dict:
+    soup = make_soup(text, parser)
+    find_errors(soup, Portal.USER, exception, message, parser)
+    return parse_user_information(soup)
+
+
+def _parse_connect_information(text: str, parser: str) -> dict:
+    soup = make_soup(text, parser)
+    find_errors(soup, Portal.CONNECT, GetInfoException, "Error al obtener la información del usuario", parser)
+    return parse_connect_information(soup)
+
+
+def _parse_summary(text: str, parser: str, action: Action):
+    soup = make_soup(text, parser)
+    find_errors(soup, Portal.USER, GetInfoException, _summaries_errors_messages[action], parser)
+    return summaries_parsers[action](get_summary_cards(soup))
+
+
+def _parse_rows(text: str, parser: str, action: Action, _reversed: bool) -> list:
+    rows = extract_table_rows(text, exception=GetInfoException, message="Fail to obtain information", parser=parser)
+    if rows is None:
+        soup = make_soup(text, parser)
+        find_errors(soup, Portal.USER, GetInfoException, "Fail to obtain information", parser)
+        rows = get_table_rows(soup.select_one(".responsive-table"))
+    if _reversed:
+        rows.reverse()
+    return [rows_parsers[action](row) for row in rows]
+
+
+class AsyncNautaScrapper(BaseNautaScrapper, metaclass=ABCMeta):
+
+    @abstractmethod
+    async def is_connected(self) -> bool:
+        pass
+
+    @property
+    @abstractmethod
+    def is_logged_in(self) -> bool:
+        pass
+
+    @property
+    @abstractmethod
+    def is_user_logged_in(self) -> bool:
+        pass
+
+    @abstractmethod
+    async def user_information(self) -> NautaUser:
+        pass
+
+    @abstractmethod
+    async def remaining_time(self) -> str:
+        pass
+
+    @abstractmethod
+    async def get_connect_information(self, username: str, password: str) -> dict:
+        pass
+
+    @property
+    @abstractmethod
+    def data_session(self) -> dict:
+        pass
+
+    @abstractmethod
+    async def captcha_image(self) -> bytes:
+        pass
+
+    @abstractmethod
+    async def check_portal_access(self) -> bool:
+        pass
+
+    @abstractmethod
+    async def connect(self, username: str, password: str):
+        pass
+
+    @abstractmethod
+    async def disconnect(self):
+        pass
+
+    @abstractmethod
+    async def login(self, username: str, password: str, captcha_code: str) -> NautaUser:
+        pass
+
+    @abstractmethod
+    async def logout(self):
+        pass
+
+    @abstractmethod
+    async def to_up(self, recharge_code: str):
+        pass
+
+    @abstractmethod
+    async def transfer(self, amount: float, password: str, destination_account: str = None):
+        pass
+
+    @abstractmethod
+    async def change_password(self, old_password: str, new_password: str):
+        pass
+
+    @abstractmethod
+    async def change_email_password(self, old_password: str, new_password: str):
+        pass
+
+    @abstractmethod
+    async def get_connections_summary(self, year: int, month: int) -> ConnectionsSummary:
+        pass
+
+    @abstractmethod
+    async def get_recharges_summary(self, year: int, month: int) -> RechargesSummary:
+        pass
+
+    @abstractmethod
+    async def get_transfers_summary(self, year: int, month: int) -> TransfersSummary:
+        pass
+
+    @abstractmethod
+    async def get_quotes_paid_summary(self, year: int, month: int) -> QuotesPaidSummary:
+        pass
+
+    @abstractmethod
+    async def get_connections(
+            self, year: int, month: int, summary: ConnectionsSummary = None, large: int = 0, _reversed: bool = False
+    ) -> list[Connection]:
+        pass
+
+    @abstractmethod
+    async def get_recharges(
+            self, year: int, month: int, summary: RechargesSummary = None, large: int = 0, _reversed: bool = False
+    ) -> list[Recharge]:
+        pass
+
+    @abstractmethod
+    async def get_transfers(
+            self, year: int, month: int, summary: TransfersSummary = None, large: int = 0, _reversed: bool = False
+    ) -> list[Transfer]:
+        pass
+
+    @abstractmethod
+    def iter_connections(
+            self, year: int, month: int, summary: ConnectionsSummary = None, _reversed: bool = False
+    ) -> AsyncIterator[Connection]:
+        pass
+
+    @abstractmethod
+    def iter_recharges(
+            self, year: int, month: int, summary: RechargesSummary = None, _reversed: bool = False
+    ) -> AsyncIterator[Recharge]:
+        pass
+
+    @abstractmethod
+    def iter_transfers(
+            self, year: int, month: int, summary: TransfersSummary = None, _reversed: bool = False
+    ) -> AsyncIterator[Transfer]:
+        pass
+
+    @abstractmethod
+    def iter_quotes_paid(
+            self, year: int, month: int, summary: QuotesPaidSummary = None, _reversed: bool = False
+    ) -> AsyncIterator[QuotePaid]:
+        pass
+
+    @abstractmethod
+    async def get_connections_between(
+            self, start_date: datetime.date | datetime.datetime, end_date: datetime.date | datetime.datetime
+    ) -> list[Connection]:
+        pass
+
+    @abstractmethod
+    async def get_recharges_between(
+            self, start_date: datetime.date | datetime.datetime, end_date: datetime.date | datetime.datetime
+    ) -> list[Recharge]:
+        pass
+
+    @abstractmethod
+    async def get_transfers_between(
+            self, start_date: datetime.date | datetime.datetime, end_date: datetime.date | datetime.datetime
+    ) -> list[Transfer]:
+        pass
+
+    @abstractmethod
+    async def get_quotes_paid_between(
+            self, start_date: datetime.date | datetime.datetime, end_date: datetime.date | datetime.datetime
+    ) -> list[QuotePaid]:
+        pass
+
+    @abstractmethod
+    async def get_quotes_paid(
+            self, year: int, month: int, summary: QuotesPaidSummary = None, large: int = 0, _reversed: bool = False
+    ) -> list[QuotePaid]:
+        pass
+
+
+class DefaultAsyncNautaScrapper(AsyncNautaScrapper):
+    """
+    Implementación asíncrona de las operaciones de `DefaultNautaScrapper`. El análisis del HTML se ejecuta en un
+    executor para no bloquear el bucle de eventos.
+    """
+
+    def __init__(
+            self, session: AsyncNautaSession, max_concurrency: int = 4, executor: Executor = None, parser: str = None
+    ):
+        """
+        Constructor de la clase.
+
+        :param session: La sesión asíncrona de Nauta a utilizar.
+        :param max_concurrency: Número máximo de páginas de un listado que se descargan a la vez.
+        :param executor: El executor en el que se analiza el HTML. Si no se especifica, se utiliza el executor por
+        defecto del bucle de eventos.
+        :param parser: El backend de análisis HTML: 'html.parser', 'lxml' o 'html5lib'. Si no se especifica se
+        utiliza `DEFAULT_PARSER` ('html.parser').
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency debe ser mayor o igual que 1")
+        self.__session = session
+        self.__max_concurrency = max_concurrency
+        self.__executor = executor
+        self.__parser = check_parser(parser or DEFAULT_PARSER)
+
+    @property
+    def parser(self) -> str:
+        return self.__parser
+
+    async def __parse(self, func: Callable, text: str, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.__executor, func, text, self.__parser, *args)
+
+    async def __user_session_init(self):
+        response = await self.__session.get(Portal.USER, self._make_url(Portal.USER, Action.LOGIN))
+        self.__session.csrf = await self.__parse(
+            _parse_csrf, response.text, PreLoginException, "Fail during pre login action"
+        )
+
+    async def __connect_session_init(self):
+        if await self.is_connected():
+            raise PreLoginException("Ya estás conectado a internet")
+
+        response = await self.__session.get(
+            Portal.CONNECT, self._make_url(Portal.CONNECT, Action.CHECK_CONNECTION)
+        )
+        action, data = await self.__parse(_parse_form, response.text)
+
+        logger.debug(f"Connecting to {action}")
+        response = await self.__session.post(Portal.CONNECT, action, data)
+        login_action, data = await self.__parse(_parse_form, response.text, "#formulario")
+
+        self.__session._login_action = login_action
+        self.__session._csrf_hw = data["CSRFHW"]
+        self.__session._wlan_user_ip = data["wlanuserip"]
+
+    async def __get_csrf(self, url: str, exception: Type[Exception], message: str) -> str:
+        csrf = self.__session.csrf_cache.get(url)
+        if csrf is None:
+            response = await self.__session.get(Portal.USER, url)
+            csrf = await self.__parse(_parse_csrf, response.text, exception, message)
+            self.__session.csrf_cache.set(url, csrf)
+        return csrf
+
+    async def __post_with_csrf(
+            self, csrf_url: str, url: str, data: dict, exception: Type[Exception], message: str
+    ) -> AsyncNautaResponse:
+        response = await self.__session.post(
+            Portal.USER, url, {"csrf": await self.__get_csrf(csrf_url, exception, message), **data},
+            parse_response=False
+        )
+        if self.__session.is_csrf_rejected(response):
+            logger.debug(f"CSRF token rejected by {url}, retrying with a new one")
+            self.__session.csrf_cache.invalidate(csrf_url)
+            response = await self.__session.post(
+                Portal.USER, url, {"csrf": await self.__get_csrf(csrf_url, exception, message), **data},
+                parse_response=False
+            )
+        self.__session.parse_response(response)
+        return response
+
+    async def __get_summary(self, year: int, month: int, action: Action):
+        response = await self.__post_with_csrf(
+            self._make_url(Portal.USER, action, True, "base"),
+            self._make_url(Portal.USER, action, True, "summary"),
+            {
+                "year_month": f"{year}-{month:02}",
+                "list_type": _actions_details[action]
+            },
+            GetInfoException,
+            _summaries_errors_messages[action]
+        )
+        return await self.__parse(_parse_summary, response.text, action)
+
+    async def __get_page_rows(self, semaphore: asyncio.Semaphore, url: str, action: Action, _reversed: bool) -> list:
+        async with semaphore:
+            response = await self.__session.get(Portal.USER, url)
+        return await self.__parse(_parse_rows, response.text, action, _reversed)
+
+    async def __iter_action(self, action: Action, summary, _reversed: bool = False) -> AsyncIterator:
+        urls = self._get_list_urls(
+            action, summary.year_month_selected, summary.count,
+            self._get_pages_to_fetch(summary.count, summary.count, _reversed)
+        )
+        for url in urls:
+            response = await self.__session.get(Portal.USER, url)
+            rows = await self.__parse(_parse_rows, response.text, action, _reversed)
+            del response
+            for row in rows:
+                yield row
+            del rows
+
+    async def __get_list(self, action: Action, summary, large: int = 0, _reversed: bool = False) -> list:
+        if summary.count == 0:
+            return []
+        if large == 0:
+            large = summary.count
+        semaphore = asyncio.Semaphore(self.__max_concurrency)
+        urls = self._get_list_urls(
+            action, summary.year_month_selected, summary.count,
+            self._get_pages_to_fetch(summary.count, large, _reversed)
+        )
+        pages_rows = await asyncio.gather(*(self.__get_page_rows(semaphore, url, action, _reversed) for url in urls))
+        rows = []
+        for page_rows in pages_rows:
+            rows.extend(page_rows[:abs(large) - len(rows)])
+        return rows
+
+    async def __get_action_between(
+            self, action: Action, start: datetime.date | datetime.datetime, end: datetime.date | datetime.datetime
+    ) -> list:
+        start, end = datetime_range(start, end)
+        months = months_between(start, end)
+        semaphore = asyncio.Semaphore(self.__max_concurrency)
+        await self.__get_csrf(
+            self._make_url(Portal.USER, action, True, "base"), GetInfoException, _summaries_errors_messages[action]
+        )
+
+        async def get_summary(year: int, month: int):
+            async with semaphore:
+                return await self.__get_summary(year, month, action)
+
+        summaries = await asyncio.gather(*(get_summary(year, month) for year, month in months))
+        # Se piden todas las páginas del rango a la vez; cada mes se invierte porque el portal lista primero las filas
+        # más recientes
+        pages_rows = await asyncio.gather(*(
+            self.__get_page_rows(semaphore, url, action, True)
+            for summary in summaries if summary.count
+            for url in reversed(self._get_list_urls(
+                action, summary.year_month_selected, summary.count,
+                self._get_pages_to_fetch(summary.count, summary.count)
+            ))
+        ))
+        return self._filter_by_range(action, [row for page_rows in pages_rows for row in page_rows], start, end)
+
+    async def is_connected(self) -> bool:
+        response = await self.__session.get(Portal.CONNECT, self._make_url(Portal.CONNECT, Action.CHECK_CONNECTION))
+        return self._connect_domain not in response.url
+
+    @property
+    def is_logged_in(self) -> bool:
+        return self.__session.is_logged_in
+
+    @property
+    def is_user_logged_in(self) -> bool:
+        return self.__session.is_user_logged_in
+
+    async def user_information(self) -> NautaUser:
+        if not self.__session.is_user_logged_in:
+            raise GetInfoException("This session is not logged in")
+        response = await self.__session.get(Portal.USER, self._make_url(Portal.USER, Action.LOAD_USER_INFORMATION))
+        user_info = await self.__parse(
+            _parse_user_information, response.text, GetInfoException, "Error al obtener la información del usuario"
+        )
+        self._is_nauta_home = "offer" in user_info.keys()
+        return NautaUser.from_dict(user_info)
+
+    async def remaining_time(self) -> str:
+        if not self.__session.is_logged_in:
+            raise GetInfoException("This session is not logged in")
+        response = await self.__session.post(
+            Portal.CONNECT,
+            self._make_url(Portal.CONNECT, Action.LOAD_USER_INFORMATION),
+            {
+                "op": "getLeftTime",
+                "ATTRIBUTE_UUID": self.__session.attribute_uuid,
+                "CSRFHW": self.__session.csrf_hw,
+                "wlanuserip": self.__session.wlan_user_ip,
+                "username": self.__session.username,
+            }
+        )
+        return response.text.strip()
+
+    async def check_portal_access(self) -> bool:
+        try:
+            response = await self.__session.get(
+                Portal.CONNECT, self._make_url(Portal.CONNECT, Action.CHECK_CONNECTION)
+            )
+            return self._connect_domain in response.url
+        except Exception:
+            return False
+
+    async def get_connect_information(self, username: str, password: str) -> dict:
+        response = await self.__session.post(
+            Portal.CONNECT,
+            self._make_url(Portal.CONNECT, Action.LOAD_USER_INFORMATION),
+            {
+                'username': username,
+                'password': password,
+                'wlanuserip': self.__session.wlan_user_ip,
+                'CSRFHW': self.__session.csrf_hw,
+                'lang': ''
+            }
+        )
+        return await self.__parse(_parse_connect_information, response.text)
+
+    @property
+    def data_session(self) -> dict:
+        if not self.__session.is_logged_in:
+            raise NotLoggedIn("No has iniciado sesión")
+        return {
+            'username': self.__session.username,
+            'cookies': self.__session.connect_cookies,
+            'wlanuserip': self.__session.wlan_user_ip,
+            'CSRFHW': self.__session.csrf_hw,
+            'ATTRIBUTE_UUID': self.__session.attribute_uuid
+        }
+
+    async def captcha_image(self) -> bytes:
+        if not self.__session.csrf:
+            await self.__user_session_init()
+        response = await self.__session.get(Portal.USER, f"{self._base_url[Portal.USER]}captcha/?")
+        return response.content
+
+    async def connect(self, username: str, password: str):
+        if not self.__session.csrf_hw:
+            await self.__connect_session_init()
+        response = await self.__session.post(
+            Portal.CONNECT,
+            self.__session.login_action,
+            {
+                "CSRFHW": self.__session.csrf_hw,
+                "wlanuserip": self.__session.wlan_user_ip,
+                "username": username,
+                "password": password
+            }
+        )
+        if "online.do" not in response.url:
+            await self.__parse(
+                _parse_errors, response.text, Portal.CONNECT, LoginException, "No se pudo iniciar sesión en el portal"
+            )
+        self.__session._attribute_uuid = re.search(r'ATTRIBUTE_UUID=(\w+)&CSRFHW=', response.text).group(1)
+
+    async def disconnect(self):
+        if not self.is_logged_in:
+            raise NotLoggedIn("You are not logged in")
+        response = await self.__session.post(
+            Portal.CONNECT,
+            f"{self._make_url(Portal.CONNECT, Action.LOGOUT)}?CSRFHW={self.__session.csrf_hw}&"
+            f"username={self.__session.username}&ATTRIBUTE_UUID={self.__session.attribute_uuid}&"
+            f"wlanuserip={self.__session.wlan_user_ip}"
+        )
+        if "SUCCESS" not in response.text.upper():
+            raise LogoutException(
+                f"Fail to logout :: {response.text[:100]}"
+            )
+
+    async def login(self, username: str, password: str, captcha_code: str) -> NautaUser:
+        if not username:
+            raise ValueError("El nombre de usuario es obligatorio")
+        if not password:
+            raise ValueError("La contraseña es obligatoria")
+        if not captcha_code:
+            raise ValueError("El código captcha es obligatorio")
+        if not self.__session.csrf:
+            await self.__user_session_init()
+
+        response = await self.__session.post(
+            Portal.USER,
+            self._make_url(Portal.USER, Action.LOGIN),
+            {
+                'csrf': self.__session.csrf,
+                'login_user': username,
+                'password_user': password,
+                'captcha': captcha_code.upper(),
+                'btn_submit': ''
+            }
+        )
+        user_info = await self.__parse(
+            _parse_user_information, response.text, LoginException, "No se pudo iniciar sesión en el portal"
+        )
+        self.__session._username = username
+        self.__session.csrf_cache.invalidate()
+        self._is_nauta_home = "offer" in user_info.keys()
+        return NautaUser.from_dict(user_info)
+
+    async def logout(self):
+        self.__session.user_cookies = None
+        self.__session.csrf = None
+        self.__session.csrf_cache.invalidate()
+
+    async def to_up(self, recharge_code: str):
+        message = "No se pudo recargar el saldo de la cuenta"
+        url = self._make_url(Portal.USER, Action.RECHARGE)
+        response = await self.__post_with_csrf(
+            url, url, {"recharge_code": recharge_code, "btn_submit": ""}, RechargeException, message
+        )
+        await self.__parse(_parse_errors, response.text, Portal.USER, RechargeException, message)
+
+    async def transfer(self, amount: float, password: str, destination_account: str = None):
+        message = "No se pudo transferir el saldo a la cuenta de destino"
+        url = self._make_url(Portal.USER, Action.TRANSFER)
+        data = {
+            "transfer": f"{amount:.2f}".replace(".", ","),
+            "password_user": password,
+            "action": "checkdata"
+        }
+        if destination_account:
+            data["id_cuenta"] = destination_account
+        response = await self.__post_with_csrf(url, url, data, TransferException, message)
+        await self.__parse(_parse_errors, response.text, Portal.USER, TransferException, message)
+
+    async def __change_password(
+            self, action: Action, old_password: str, new_password: str, exception: Type[Exception], message: str
+    ):
+        url = self._make_url(Portal.USER, action)
+        response = await self.__post_with_csrf(
+            url,
+            url,
+            {
+                "old_password": old_password,
+                "new_password": new_password,
+                "repeat_new_password": new_password,
+                "btn_submit": ""
+            },
+            exception,
+            message
+        )
+        await self.__parse(_parse_errors, response.text, Portal.USER, exception, message)
+
+    async def change_password(self, old_password: str, new_password: str):
+        await self.__change_password(
+            Action.CHANGE_PASSWORD, old_password, new_password, ChangePasswordException,
+            "No se pudo cambiar la contraseña de la cuenta"
+        )
+
+    async def change_email_password(self, old_password: str, new_password: str):
+        await self.__change_password(
+            Action.CHANGE_EMAIL_PASSWORD, old_password, new_password, TransferException,
+            "No se pudo cambiar la contraseña de la cuenta de correo electrónico asociada"
+        )
+
+    async def get_connections_summary(self, year: int, month: int) -> ConnectionsSummary:
+        return await self.__get_summary(year, month, Action.GET_CONNECTIONS)
+
+    async def get_recharges_summary(self, year: int, month: int) -> RechargesSummary:
+        return await self.__get_summary(year, month, Action.GET_RECHARGES)
+
+    async def get_transfers_summary(self, year: int, month: int) -> TransfersSummary:
+        return await self.__get_summary(year, month, Action.GET_TRANSFERS)
+
+    async def get_quotes_paid_summary(self, year: int, month: int) -> QuotesPaidSummary:
+        return await self.__get_summary(year, month, Action.GET_QUOTES_PAID)
+
+    async def get_connections(
+            self, year: int, month: int, summary: ConnectionsSummary = None, large: int = 0, _reversed: bool = False
+    ) -> list[Connection]:
+        summary = await self.get_connections_summary(year, month) if not summary else summary
+        return await self.__get_list(Action.GET_CONNECTIONS, summary, large, _reversed)
+
+    async def get_recharges(
+            self, year: int, month: int, summary: RechargesSummary = None, large: int = 0, _reversed: bool = False
+    ) -> list[Recharge]:
+        summary = await self.get_recharges_summary(year, month) if not summary else summary
+        return await self.__get_list(Action.GET_RECHARGES, summary, large, _reversed)
+
+    async def get_transfers(
+            self, year: int, month: int, summary: TransfersSummary = None, large: int = 0, _reversed: bool = False
+    ) -> list[Transfer]:
+        summary = await self.get_transfers_summary(year, month) if not summary else summary
+        return await self.__get_list(Action.GET_TRANSFERS, summary, large, _reversed)
+
+    async def get_quotes_paid(
+            self, year: int, month: int, summary: QuotesPaidSummary = None, large: int = 0, _reversed: bool = False
+    ) -> list[QuotePaid]:
+        summary = await self.get_quotes_paid_summary(year, month) if not summary else summary
+        return await self.__get_list(Action.GET_QUOTES_PAID, summary, large, _reversed)
+
+    async def get_connections_between(
+            self, start_date: datetime.date | datetime.datetime, end_date: datetime.date | datetime.datetime
+    ) -> list[Connection]:
+        return await self.__get_action_between(Action.GET_CONNECTIONS, start_date, end_date)
+
+    async def get_recharges_between(
+            self, start_date: datetime.date | datetime.datetime, end_date: datetime.date | datetime.datetime
+    ) -> list[Recharge]:
+        return await self.__get_action_between(Action.GET_RECHARGES, start_date, end_date)
+
+    async def get_transfers_between(
+            self, start_date: datetime.date | datetime.datetime, end_date: datetime.date | datetime.datetime
+    ) -> list[Transfer]:
+        return await self.__get_action_between(Action.GET_TRANSFERS, start_date, end_date)
+
+    async def get_quotes_paid_between(
+            self, start_date: datetime.date | datetime.datetime, end_date: datetime.date | datetime.datetime
+    ) -> list[QuotePaid]:
+        return await self.__get_action_between(Action.GET_QUOTES_PAID, start_date, end_date)
+
+    async def iter_connections(
+            self, year: int, month: int, summary: ConnectionsSummary = None, _reversed: bool = False
+    ) -> AsyncIterator[Connection]:
+        summary = await self.get_connections_summary(year, month) if not summary else summary
+        if summary.count != 0:
+            async for row in self.__iter_action(Action.GET_CONNECTIONS, summary, _reversed):
+                yield row
+
+    async def iter_recharges(
+            self, year: int, month: int, summary: RechargesSummary = None, _reversed: bool = False
+    ) -> AsyncIterator[Recharge]:
+        summary = await self.get_recharges_summary(year, month) if not summary else summary
+        if summary.count != 0:
+            async for row in self.__iter_action(Action.GET_RECHARGES, summary, _reversed):
+                yield row
+
+    async def iter_transfers(
+            self, year: int, month: int, summary: TransfersSummary = None, _reversed: bool = False
+    ) -> AsyncIterator[Transfer]:
+        summary = await self.get_transfers_summary(year, month) if not summary else summary
+        if summary.count != 0:
+            async for row in self.__iter_action(Action.GET_TRANSFERS, summary, _reversed):
+                yield row
+
+    async def iter_quotes_paid(
+            self, year: int, month: int, summary: QuotesPaidSummary = None, _reversed: bool = False
+    ) -> AsyncIterator[QuotePaid]:
+        summary = await self.get_quotes_paid_summary(year, month) if not summary else summary
+        if summary.count != 0:
+            async for row in self.__iter_action(Action.GET_QUOTES_PAID, summary, _reversed):
+                yield row
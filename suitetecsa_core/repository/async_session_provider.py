@@ -0,0 +1,202 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+from abc import ABCMeta, abstractmethod
+from dataclasses import dataclass
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+from suitetecsa_core import Portal
+from suitetecsa_core.repository.session_provider import BaseNautaSession
+
+
+@dataclass
+class AsyncNautaResponse:
+    """
+    Respuesta de una petición asíncrona, con el cuerpo ya descargado.
+    """
+    status_code: int
+    reason: str
+    url: str
+    content: bytes
+    encoding: str = "utf-8"
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+
+class AsyncNautaSession(BaseNautaSession, metaclass=ABCMeta):
+    """
+    Clase abstracta que define los métodos y propiedades necesarios para manejar una sesión asíncrona en Nauta.
+    """
+
+    @property
+    @abstractmethod
+    def user_cookies(self) -> dict:
+        pass
+
+    @user_cookies.setter
+    @abstractmethod
+    def user_cookies(self, value: dict):
+        pass
+
+    @property
+    @abstractmethod
+    def connect_cookies(self) -> dict:
+        pass
+
+    @connect_cookies.setter
+    @abstractmethod
+    def connect_cookies(self, value: dict):
+        pass
+
+    @abstractmethod
+    async def get(
+            self, portal_manager: Portal, url: str, data: dict = None, parse_response: bool = True
+    ) -> AsyncNautaResponse:
+        """
+        Realiza una petición HTTP GET a la URL especificada, utilizando la sesión de usuario o de conexión según
+        corresponda.
+
+        :param parse_response: Si es True se lanza `ConnectionException` cuando la respuesta no es satisfactoria.
+        :param portal_manager: Un objeto `Portal` que indica si se debe usar la sesión de usuario o de conexión.
+        :param url: La URL a la que se hará la petición.
+        :param data: Opcionalmente, los datos que se enviarán con la petición.
+        :return: Un objeto `AsyncNautaResponse` con la respuesta a la petición.
+        """
+        pass
+
+    @abstractmethod
+    async def post(
+            self, portal_manager: Portal, url: str, data: dict = None, parse_response: bool = True
+    ) -> AsyncNautaResponse:
+        """
+        Realiza una petición HTTP POST a la URL especificada, utilizando la sesión de usuario o de conexión según
+        corresponda.
+
+        :param parse_response: Si es True se lanza `ConnectionException` cuando la respuesta no es satisfactoria.
+        :param portal_manager: Un objeto `Portal` que indica si se debe usar la sesión de usuario o de conexión.
+        :param url: La URL a la que se hará la petición.
+        :param data: Opcionalmente, los datos que se enviarán con la petición.
+        :return: Un objeto `AsyncNautaResponse` con la respuesta a la petición.
+        """
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """
+        Libera las conexiones abiertas por la sesión.
+        """
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class DefaultAsyncNautaSession(AsyncNautaSession):
+    """
+    Implementación de `AsyncNautaSession` basada en `aiohttp`. Las sesiones de usuario y de conexión se crean la
+    primera vez que se utilizan, ya que `aiohttp` requiere un bucle de eventos en ejecución.
+    """
+
+    def __init__(
+            self, user_session: "aiohttp.ClientSession" = None, connect_session: "aiohttp.ClientSession" = None
+    ) -> None:
+        """
+        Constructor de la clase.
+
+        :param user_session: Opcionalmente, la `aiohttp.ClientSession` a utilizar con el portal de usuario.
+        :param connect_session: Opcionalmente, la `aiohttp.ClientSession` a utilizar con el portal cautivo.
+        :raises ImportError: Si `aiohttp` no está instalado.
+        """
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for async sessions: pip install suitetecsa_core[async]")
+        self.__sessions = {Portal.USER: user_session, Portal.CONNECT: connect_session}
+        self.__pending_cookies = {Portal.USER: {}, Portal.CONNECT: {}}
+
+    def __get_session(self, portal_manager: Portal) -> "aiohttp.ClientSession":
+        session = self.__sessions[portal_manager]
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(headers=self._headers)
+            session.cookie_jar.update_cookies(self.__pending_cookies[portal_manager])
+            self.__sessions[portal_manager] = session
+        return session
+
+    def __get_cookies(self, portal_manager: Portal) -> dict:
+        session = self.__sessions[portal_manager]
+        if session is None:
+            return dict(self.__pending_cookies[portal_manager])
+        return {cookie.key: cookie.value for cookie in session.cookie_jar}
+
+    def __set_cookies(self, portal_manager: Portal, value: dict):
+        session = self.__sessions[portal_manager]
+        self.__pending_cookies[portal_manager] = dict(value or {})
+        if session is not None:
+            session.cookie_jar.clear()
+            session.cookie_jar.update_cookies(self.__pending_cookies[portal_manager])
+
+    @property
+    def user_cookies(self) -> dict:
+        return self.__get_cookies(Portal.USER)
+
+    @user_cookies.setter
+    def user_cookies(self, value: dict):
+        self.__set_cookies(Portal.USER, value)
+
+    @property
+    def connect_cookies(self) -> dict:
+        return self.__get_cookies(Portal.CONNECT)
+
+    @connect_cookies.setter
+    def connect_cookies(self, value: dict):
+        self.__set_cookies(Portal.CONNECT, value)
+
+    async def __request(
+            self, method: str, portal_manager: Portal, url: str, data: dict = None, parse_response: bool = True
+    ) -> AsyncNautaResponse:
+        async with self.__get_session(portal_manager).request(method, url, data=data) as response:
+            nauta_response = AsyncNautaResponse(
+                status_code=response.status,
+                reason=response.reason,
+                url=str(response.url),
+                content=await response.read(),
+                encoding=response.charset or "utf-8"
+            )
+        if parse_response:
+            self.parse_response(nauta_response)
+        return nauta_response
+
+    async def get(
+            self, portal_manager: Portal, url: str, data: dict = None, parse_response: bool = True
+    ) -> AsyncNautaResponse:
+        return await self.__request("GET", portal_manager, url, data, parse_response)
+
+    async def post(
+            self, portal_manager: Portal, url: str, data: dict = None, parse_response: bool = True
+    ) -> AsyncNautaResponse:
+        return await self.__request("POST", portal_manager, url, data, parse_response)
+
+    async def close(self) -> None:
+        for session in self.__sessions.values():
+            if session is not None and not session.closed:
+                await session.close()
@@ -0,0 +1,222 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import copy
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from datetime import date
+from typing import Any
+
+from suitetecsa_core import Action
+
+
+class CacheBackend(metaclass=ABCMeta):
+    """
+    Clase abstracta que define el almacenamiento utilizado por `HistoryCache`.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Any:
+        """
+        Devuelve el valor asociado a `key`.
+
+        :param key: La clave del valor.
+        :return: El valor o None si no existe o ha caducado.
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float = None) -> None:
+        """
+        Guarda `value` bajo la clave `key`.
+
+        :param key: La clave del valor.
+        :param value: El valor a guardar.
+        :param ttl: Segundos durante los que el valor es válido. Si es None, el valor no caduca.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Almacenamiento en memoria que descarta los valores usados menos recientemente cuando se supera `max_size`.
+    """
+
+    def __init__(self, max_size: int = 256) -> None:
+        if max_size < 1:
+            raise ValueError("max_size debe ser mayor o igual que 1")
+        self.max_size = max_size
+        self.__items: OrderedDict[str, tuple[Any, float | None]] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def get(self, key: str) -> Any:
+        with self.__lock:
+            if key not in self.__items:
+                return None
+            value, expires_at = self.__items[key]
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self.__items[key]
+                return None
+            self.__items.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float = None) -> None:
+        with self.__lock:
+            self.__items[key] = (value, None if ttl is None else time.monotonic() + ttl)
+            self.__items.move_to_end(key)
+            while len(self.__items) > self.max_size:
+                self.__items.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self.__lock:
+            self.__items.pop(key, None)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__items.clear()
+
+
+class DiskCacheBackend(CacheBackend):
+    """
+    Almacenamiento en disco: cada valor se serializa con `pickle` en un fichero del directorio `directory`, por lo que
+    la cache se conserva entre ejecuciones. Solo debe apuntarse a directorios de confianza.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def __path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{hashlib.sha1(key.encode()).hexdigest()}.pickle")
+
+    def get(self, key: str) -> Any:
+        path = self.__path(key)
+        try:
+            with open(path, "rb") as file:
+                stored_key, value, expires_at = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        if stored_key != key:
+            return None
+        if expires_at is not None and expires_at <= time.time():
+            self.delete(key)
+            return None
+        return value
+
+    def set(self, key: str, value: Any, ttl: float = None) -> None:
+        # Se escribe en un fichero temporal y se renombra para que un lector nunca vea un fichero a medias
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            pickle.dump((key, value, None if ttl is None else time.time() + ttl), file)
+        os.replace(tmp_path, self.__path(key))
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self.__path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        for name in os.listdir(self.directory):
+            if name.endswith(".pickle"):
+                os.remove(os.path.join(self.directory, name))
+
+
+class HistoryCache:
+    """
+    Cache de los resúmenes y listados del historial de una cuenta, indexados por usuario, acción y mes.
+
+    Los meses cerrados no pueden cambiar, por lo que se guardan sin caducidad. El mes en curso, y cualquier mes
+    posterior, se guarda durante `current_month_ttl` segundos.
+
+    Las claves exigen un usuario, de modo que varias cuentas pueden compartir una cache sin leer los datos de las
+    otras. Los listados se guardan como tuplas y cada lectura devuelve copias de los modelos, así que modificar un
+    resultado no altera lo que reciben las demás llamadas. Los contadores `hits` y `misses` admiten accesos
+    concurrentes.
+    """
+
+    def __init__(self, backend: CacheBackend = None, current_month_ttl: float = 300) -> None:
+        """
+        Constructor de la clase.
+
+        :param backend: El almacenamiento a utilizar. Por defecto, un `MemoryCacheBackend`.
+        :param current_month_ttl: Segundos durante los que se conservan los datos del mes en curso.
+        """
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.current_month_ttl = current_month_ttl
+        self.hits = 0
+        self.misses = 0
+        self.__stats_lock = threading.Lock()
+
+    @staticmethod
+    def make_key(username: str, action: Action, year: int, month: int, kind: str) -> str:
+        """
+        :raises ValueError: Si no se especifica el usuario.
+        """
+        if not username:
+            raise ValueError("username es necesario para usar la cache del historial")
+        return f"{username}:{action.value}:{year}-{month:02}:{kind}"
+
+    @staticmethod
+    def __copy(value: Any) -> Any:
+        if isinstance(value, (list, tuple)):
+            return [copy.copy(item) for item in value]
+        return copy.copy(value)
+
+    def ttl(self, year: int, month: int) -> float | None:
+        """
+        Devuelve los segundos durante los que se conservan los datos de un mes, o None si el mes está cerrado.
+        """
+        today = date.today()
+        return None if (year, month) < (today.year, today.month) else self.current_month_ttl
+
+    def get(self, username: str, action: Action, year: int, month: int, kind: str) -> Any:
+        value = self.backend.get(self.make_key(username, action, year, month, kind))
+        with self.__stats_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return None if value is None else self.__copy(value)
+
+    def set(self, username: str, action: Action, year: int, month: int, kind: str, value: Any) -> None:
+        value = tuple(self.__copy(value)) if isinstance(value, (list, tuple)) else self.__copy(value)
+        self.backend.set(self.make_key(username, action, year, month, kind), value, self.ttl(year, month))
+
+    def invalidate(self, username: str, action: Action, year: int, month: int) -> None:
+        for kind in ("summary", "list"):
+            self.backend.delete(self.make_key(username, action, year, month, kind))
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        with self.__stats_lock:
+            return {"hits": self.hits, "misses": self.misses}
@@ -0,0 +1,222 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import datetime
+import logging
+import sqlite3
+from dataclasses import fields
+
+from suitetecsa_core import Action
+from suitetecsa_core.domain.model import Connection, Recharge, Transfer, QuotePaid
+from suitetecsa_core.utils.nauta import months_between
+
+logger = logging.getLogger(__name__)
+
+# Tabla, modelo y columna de fecha por la que se indexa y ordena cada acción
+_tables = {
+    Action.GET_CONNECTIONS: ("connections", Connection, "start_session"),
+    Action.GET_RECHARGES: ("recharges", Recharge, "date"),
+    Action.GET_TRANSFERS: ("transfers", Transfer, "date"),
+    Action.GET_QUOTES_PAID: ("quotes_paid", QuotePaid, "date")
+}
+
+_sql_types = {int: "INTEGER", float: "REAL", str: "TEXT", datetime.datetime: "TEXT"}
+
+
+class HistoryStore:
+    """
+    Almacén local en SQLite del historial de conexiones, recargas, transferencias y cotizaciones pagadas de una o
+    varias cuentas.
+
+    Las filas se guardan por cuenta y mes, con índices por cuenta y fecha, de forma que las consultas se resuelven sin
+    acceder al portal. `sync` solo descarga los meses que faltan y, en los meses aún abiertos, solo las filas nuevas.
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        """
+        Constructor de la clase.
+
+        :param path: La ruta de la base de datos. Por defecto, una base de datos en memoria.
+        """
+        self.__connection = sqlite3.connect(path)
+        self.__create_schema()
+
+    def __create_schema(self):
+        with self.__connection:
+            for table, model, date_column in _tables.values():
+                columns = ", ".join(f"{f.name} {_sql_types[f.type]}" for f in fields(model))
+                self.__connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} (account TEXT NOT NULL, year_month TEXT NOT NULL, {columns})"
+                )
+                self.__connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {table}_account_date ON {table} (account, {date_column})"
+                )
+                self.__connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {table}_account_month ON {table} (account, year_month)"
+                )
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS months ("
+                "account TEXT NOT NULL, action TEXT NOT NULL, year_month TEXT NOT NULL, complete INTEGER NOT NULL, "
+                "PRIMARY KEY (account, action, year_month))"
+            )
+
+    def close(self) -> None:
+        self.__connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def add(self, account: str, action: Action, year: int, month: int, rows: list) -> None:
+        """
+        Guarda las filas de un mes.
+
+        :param account: La cuenta a la que pertenecen las filas.
+        :param action: La acción del historial (`Action.GET_CONNECTIONS`, `Action.GET_RECHARGES`, etc.).
+        :param year: El año de las filas.
+        :param month: El mes de las filas.
+        :param rows: Una lista de objetos del modelo correspondiente a la acción.
+        """
+        table, model, _ = _tables[action]
+        names = [f.name for f in fields(model)]
+        year_month = f"{year}-{month:02}"
+        with self.__connection:
+            self.__connection.executemany(
+                f"INSERT INTO {table} (account, year_month, {', '.join(names)}) "
+                f"VALUES (?, ?, {', '.join('?' * len(names))})",
+                [
+                    (account, year_month, *(
+                        value.isoformat() if isinstance(value, datetime.datetime) else value
+                        for value in (getattr(row, name) for name in names)
+                    )) for row in rows
+                ]
+            )
+
+    def count(self, account: str, action: Action, year: int, month: int) -> int:
+        """
+        Devuelve el número de filas guardadas de un mes.
+        """
+        table, _, _ = _tables[action]
+        return self.__connection.execute(
+            f"SELECT COUNT(*) FROM {table} WHERE account = ? AND year_month = ?", (account, f"{year}-{month:02}")
+        ).fetchone()[0]
+
+    def query(
+            self, account: str, action: Action, start: datetime.datetime = None, end: datetime.datetime = None
+    ) -> list:
+        """
+        Devuelve las filas guardadas de una cuenta en orden cronológico.
+
+        :param account: La cuenta a consultar.
+        :param action: La acción del historial a consultar.
+        :param start: Opcionalmente, la fecha a partir de la cual se devuelven filas (incluida).
+        :param end: Opcionalmente, la fecha hasta la cual se devuelven filas (excluida).
+        :return: Una lista de objetos del modelo correspondiente a la acción.
+        """
+        table, model, date_column = _tables[action]
+        model_fields = fields(model)
+        conditions, params = ["account = ?"], [account]
+        if start is not None:
+            conditions.append(f"{date_column} >= ?")
+            params.append(start.isoformat())
+        if end is not None:
+            conditions.append(f"{date_column} < ?")
+            params.append(end.isoformat())
+        cursor = self.__connection.execute(
+            f"SELECT {', '.join(f.name for f in model_fields)} FROM {table} WHERE {' AND '.join(conditions)} "
+            f"ORDER BY {date_column}",
+            params
+        )
+        return [
+            model(*(
+                datetime.datetime.fromisoformat(value) if f.type is datetime.datetime else value
+                for f, value in zip(model_fields, row)
+            )) for row in cursor
+        ]
+
+    def connections(self, account: str, start: datetime.datetime = None, end: datetime.datetime = None) -> list:
+        return self.query(account, Action.GET_CONNECTIONS, start, end)
+
+    def recharges(self, account: str, start: datetime.datetime = None, end: datetime.datetime = None) -> list:
+        return self.query(account, Action.GET_RECHARGES, start, end)
+
+    def transfers(self, account: str, start: datetime.datetime = None, end: datetime.datetime = None) -> list:
+        return self.query(account, Action.GET_TRANSFERS, start, end)
+
+    def quotes_paid(self, account: str, start: datetime.datetime = None, end: datetime.datetime = None) -> list:
+        return self.query(account, Action.GET_QUOTES_PAID, start, end)
+
+    def __is_complete(self, account: str, action: Action, year_month: str) -> bool:
+        return self.__connection.execute(
+            "SELECT complete FROM months WHERE account = ? AND action = ? AND year_month = ?",
+            (account, action.value, year_month)
+        ).fetchone() == (1,)
+
+    def __sync_month(self, client, account: str, action: Action, year: int, month: int, closed: bool) -> int:
+        year_month = f"{year}-{month:02}"
+        if self.__is_complete(account, action, year_month):
+            return 0
+        kind = action.value
+        summary = getattr(client, f"get_{kind}_summary")(year, month)
+        stored = self.count(account, action, year, month)
+        added = 0
+        if summary.count < stored:
+            # El portal tiene menos filas de las guardadas: se descarta el mes y se descarga completo
+            logger.debug(f"Stored {kind} for {year_month} do not match the portal, fetching the whole month")
+            table, _, _ = _tables[action]
+            with self.__connection:
+                self.__connection.execute(
+                    f"DELETE FROM {table} WHERE account = ? AND year_month = ?", (account, year_month)
+                )
+            stored = 0
+        if summary.count > stored:
+            # El portal lista primero las filas más recientes, por lo que las que faltan son las primeras
+            rows = getattr(client, f"get_{kind}")(year, month, summary, summary.count - stored if stored else 0)
+            self.add(account, action, year, month, rows)
+            added = len(rows)
+        with self.__connection:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO months (account, action, year_month, complete) VALUES (?, ?, ?, ?)",
+                (account, action.value, year_month, int(closed))
+            )
+        return added
+
+    def sync(
+            self, client, since: datetime.date = None, actions: tuple[Action, ...] = tuple(_tables),
+            until: datetime.date = None
+    ) -> dict[Action, int]:
+        """
+        Sincroniza el historial de la cuenta del cliente con el portal.
+
+        Los meses cerrados que ya se sincronizaron completos no se vuelven a consultar. Para el resto se obtiene el
+        resumen y solo se descargan las filas que faltan comparando `summary.count` con las filas guardadas.
+
+        :param client: Un `NautaClient` con una sesión iniciada en el portal de usuario.
+        :param since: La fecha desde la que se sincroniza. Por defecto, los últimos 12 meses incluido el actual.
+        :param actions: Las acciones del historial a sincronizar. Por defecto, todas.
+        :param until: La fecha hasta la que se sincroniza. Por defecto, la fecha actual.
+        :return: Un diccionario con el número de filas añadidas por acción.
+        """
+        account = client.credentials[0]
+        today = datetime.date.today()
+        until = until or today
+        if since is None:
+            since = datetime.date(today.year, 1, 1) if today.month == 12 else \
+                datetime.date(today.year - 1, today.month + 1, 1)
+        added = {action: 0 for action in actions}
+        for year, month in months_between(since, until):
+            closed = (year, month) < (today.year, today.month)
+            for action in actions:
+                added[action] += self.__sync_month(client, account, action, year, month, closed)
+        return added
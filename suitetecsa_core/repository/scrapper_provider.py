@@ -9,11 +9,17 @@
 #  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
 #  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
 #  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import datetime
 import logging
 import math
+import queue
 import re
+import threading
+import time
 from abc import ABCMeta, abstractmethod
-from typing import Type, Optional
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Type, Optional, Callable, Iterator
+from urllib.parse import urlsplit
 
 from bs4 import BeautifulSoup, Tag
 
@@ -23,9 +29,11 @@ from suitetecsa_core.domain.model import ConnectionsSummary, RechargesSummary, T
 from suitetecsa_core.domain.model.nauta_user import NautaUser
 from suitetecsa_core.core.exceptions import GetInfoException, NotLoggedIn, PreLoginException, LoginException, \
     RechargeException, TransferException, ChangePasswordException, LogoutException
-from suitetecsa_core.repository.session_provider import NautaSession
-from suitetecsa_core.utils.nauta import str_to_float, convert_to_bytes, parse_datetime, str_to_date, parse_errors, \
-    time_string_to_seconds
+from suitetecsa_core.repository.session_provider import NautaSession, ParseEvent, PORTAL_ENCODINGS
+from suitetecsa_core.utils.nauta import DEFAULT_PARSER, check_parser, make_soup, datetime_range, months_between
+from suitetecsa_core.utils.parser import find_errors, get_inputs, get_csrf, parse_user_information, \
+    parse_connect_information, rows_parsers, summaries_cells_parsers, parse_list_page, parse_summary_page, \
+    parse_user_information_page, FormScanner, find_script_errors
 
 logging.basicConfig(
     level=logging.INFO,
@@ -33,8 +41,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger()
 
+# Formas de comprobar si hay conexión: 'get' sigue las redirecciones y deja de leer la página tras el primer fragmento;
+# 'head' no sigue las redirecciones y solo recibe las cabeceras
+CONNECTION_PROBES = ("get", "head")
 
-class NautaScrapper(metaclass=ABCMeta):
+
+class BaseNautaScrapper:
+    """
+    Clase base con las direcciones de los portales de Nauta, compartida por los scrappers síncronos y asíncronos.
+    """
     _connect_domain: str = "secure.etecsa.net"
     _base_url: dict = {
         Portal.CONNECT: f'https://{_connect_domain}:8443/',
@@ -80,6 +95,110 @@ class NautaScrapper(metaclass=ABCMeta):
         }
     }
     _is_nauta_home: bool = False
+    _rows_per_page: int = 14
+
+    @property
+    def is_nauta_home(self):
+        return self._is_nauta_home
+
+    def override_base_urls(self, base_urls: dict[Portal, str], check_connection_url: str = None) -> None:
+        """
+        Dirige las peticiones de este scrapper a otras direcciones, por ejemplo, a las de un
+        `suitetecsa_core.testing.NautaPortalServer` local. Solo afecta a esta instancia.
+
+        :param base_urls: La dirección base, terminada en '/', de cada portal que se quiere cambiar.
+        :param check_connection_url: La URL con la que se comprueba si hay conexión a internet. Si no se especifica se
+        mantiene la actual.
+        """
+        self._base_url = {**self._base_url, **base_urls}
+        if Portal.CONNECT in base_urls:
+            self._connect_domain = urlsplit(base_urls[Portal.CONNECT]).netloc
+        if check_connection_url is not None:
+            self._portals_urls = {
+                **self._portals_urls,
+                Portal.CONNECT: {**self._portals_urls[Portal.CONNECT], Action.CHECK_CONNECTION: check_connection_url}
+            }
+
+    def _make_url(
+            self, portal_manager: Portal, action: Action, get_action: bool = False, sub_action: Optional[str] = None,
+            year_month_selected: Optional[str] = None, count: Optional[int] = None, page: Optional[int] = None
+    ) -> str:
+        """
+        Construye una URL para una acción determinada en un portal determinado.
+
+        :param portal_manager: Un objeto Portal que representa el portal en el que se realizará la acción.
+        :param action: Una enumeración Action que representa la acción que se realizará en el portal.
+        :param get_action: Un booleano que indica si se debe obtener una URL básica para la acción dada o una URL más
+        detallada. El valor predeterminado es False.
+        :param sub_action: Una cadena que representa la sub-acción que se realizará en la acción dada. El valor
+        predeterminado es None.
+        :param year_month_selected: Una cadena que representa el año y mes seleccionados para la acción de lista.
+        Requerido si la sub-acción es 'list'.
+        :param count: Un entero que representa el número máximo de elementos que se deben recuperar para la acción de
+        lista. Requerido si la sub-acción es 'list'.
+        :param page: Un entero que representa el número de página que se debe recuperar para la acción de lista. El
+        valor predeterminado es None, lo que significa que se recuperarán todos los elementos.
+
+        :return: Una cadena que representa la URL construida para la acción dada en el portal dado.
+
+        :raises ValueError: Si year_month_selected o count están ausentes cuando sub_action es 'list'.
+        """
+        if action == Action.CHECK_CONNECTION:
+            return self._portals_urls[portal_manager][action]
+        elif not get_action:
+            return f'{self._base_url[portal_manager]}{self._portals_urls[portal_manager][action]}'
+        else:
+            url = f'{self._base_url[portal_manager]}{self._portals_urls[portal_manager][action][sub_action]}'
+            if sub_action in ('base', 'summary'):
+                return url
+            elif sub_action == 'list':
+                if not year_month_selected:
+                    raise ValueError("year_month_selected is required for 'list' sub-action")
+                if not count:
+                    raise ValueError("count is required for 'list' sub-action")
+                else:
+                    return f'{url}{year_month_selected}/{count}' \
+                        if not page else f'{url}{year_month_selected}/{count}/{page}'
+
+    def _get_list_urls(self, action: Action, year_month_selected: str, count: int, pages: list[int]) -> list[str]:
+        return [
+            self._make_url(
+                portal_manager=Portal.USER, action=action, get_action=True, sub_action='list',
+                year_month_selected=year_month_selected, count=count, page=page if page != 1 else None
+            ) for page in pages
+        ]
+
+    @staticmethod
+    def _filter_by_range(action: Action, rows: list, start: datetime.datetime, end: datetime.datetime) -> list:
+        """
+        Devuelve las filas de un listado cuya fecha está dentro del rango [start, end].
+        """
+        date_field = "start_session" if action == Action.GET_CONNECTIONS else "date"
+        return [row for row in rows if start <= getattr(row, date_field) <= end]
+
+    def _get_pages_to_fetch(self, count: int, large: int, _reversed: bool = False) -> list[int]:
+        """
+        Calcula las páginas de un listado que es necesario descargar para obtener `large` filas.
+
+        :param count: Un entero que representa el número total de elementos.
+        :param large: Un entero que especifica el número máximo de filas a devolver.
+        :param _reversed: Un valor booleano que indica si las páginas se recorren desde la última. El valor por
+        defecto es False.
+        :return: Una lista con los números de página a descargar, en el orden en que deben recorrerse.
+        """
+        totals_pages = math.ceil(count / self._rows_per_page)
+        pages = range(totals_pages, 0, -1) if _reversed else range(1, totals_pages + 1)
+        pages_to_fetch = []
+        expected_rows = 0
+        for page in pages:
+            pages_to_fetch.append(page)
+            expected_rows += min(self._rows_per_page, count - (page - 1) * self._rows_per_page)
+            if expected_rows >= abs(large):
+                break
+        return pages_to_fetch
+
+
+class NautaScrapper(BaseNautaScrapper, metaclass=ABCMeta):
 
     @property
     @abstractmethod
@@ -190,157 +309,247 @@ class NautaScrapper(metaclass=ABCMeta):
     ) -> list[Transfer]:
         pass
 
+    @abstractmethod
+    def iter_connections(
+            self, year: int, month: int, summary: ConnectionsSummary = None, _reversed: bool = False
+    ) -> Iterator[Connection]:
+        pass
+
+    @abstractmethod
+    def iter_recharges(
+            self, year: int, month: int, summary: RechargesSummary = None, _reversed: bool = False
+    ) -> Iterator[Recharge]:
+        pass
+
+    @abstractmethod
+    def iter_transfers(
+            self, year: int, month: int, summary: TransfersSummary = None, _reversed: bool = False
+    ) -> Iterator[Transfer]:
+        pass
+
+    @abstractmethod
+    def iter_quotes_paid(
+            self, year: int, month: int, summary: QuotesPaidSummary = None, _reversed: bool = False
+    ) -> Iterator[QuotePaid]:
+        pass
+
+    @abstractmethod
+    def get_connections_between(
+            self, start_date: datetime.date | datetime.datetime, end_date: datetime.date | datetime.datetime
+    ) -> list[Connection]:
+        pass
+
+    @abstractmethod
+    def get_recharges_between(
+            self, start_date: datetime.date | datetime.datetime, end_date: datetime.date | datetime.datetime
+    ) -> list[Recharge]:
+        pass
+
+    @abstractmethod
+    def get_transfers_between(
+            self, start_date: datetime.date | datetime.datetime, end_date: datetime.date | datetime.datetime
+    ) -> list[Transfer]:
+        pass
+
+    @abstractmethod
+    def get_quotes_paid_between(
+            self, start_date: datetime.date | datetime.datetime, end_date: datetime.date | datetime.datetime
+    ) -> list[QuotePaid]:
+        pass
+
     @abstractmethod
     def get_quotes_paid(
             self, year: int, month: int, summary: QuotesPaidSummary = None, large: int = 0, _reversed: bool = False
     ) -> list[QuotePaid]:
         pass
 
-    @property
-    def is_nauta_home(self):
-        return self._is_nauta_home
-
 
 # noinspection PyTypeChecker
 class DefaultNautaScrapper(NautaScrapper):
 
-    def __init__(self, scrapper: BeautifulSoup, session: NautaSession):
+    def __init__(
+            self, scrapper: BeautifulSoup, session: NautaSession, max_workers: int = 1, parser: str = None,
+            pipeline: bool = True, prefetch_pages: int = 2, parse_executor: Executor = None,
+            connection_probe: str = "get"
+    ):
+        """
+        Constructor de la clase.
+
+        :param scrapper: Una instancia de `BeautifulSoup`.
+        :param session: La sesión de Nauta a utilizar.
+        :param max_workers: Número máximo de páginas de un listado que se descargan en paralelo. El valor
+        predeterminado es 1, lo que significa que las páginas se descargan una a una.
+        :param parser: El backend de análisis HTML: 'html.parser', 'lxml' o 'html5lib'. Si no se especifica se
+        utiliza `DEFAULT_PARSER` ('html.parser').
+        :param pipeline: Si es True y `max_workers` es 1, los listados de más de una página se descargan en un hilo
+        aparte mientras se analizan las páginas ya descargadas, sin más de una petición en curso al portal.
+        :param prefetch_pages: Número máximo de páginas descargadas que esperan a ser analizadas.
+        :param parse_executor: Un `concurrent.futures.Executor`, normalmente un `ProcessPoolExecutor`, en el que se
+        analizan las páginas de los listados, los resúmenes y la información del usuario. Los procesos reciben el
+        cuerpo de la respuesta y devuelven tuplas y diccionarios de cadenas, nunca objetos `Tag`. Como el análisis no
+        libera el GIL, es la única forma de aprovechar varios núcleos cuando muchos scrappers comparten el proceso. El
+        executor puede compartirse entre scrappers y no se cierra con ellos. Si no se especifica, todo se analiza en
+        el hilo que llama.
+        :param connection_probe: Cómo se comprueba si hay conexión (`CONNECTION_PROBES`). Con 'get', la URL de
+        comprobación se pide con GET siguiendo las redirecciones, y hay conexión si la última no lleva al portal
+        cautivo; de la página solo se lee el primer fragmento. Con 'head', se pide con HEAD sin seguir las
+        redirecciones, y hay conexión si la respuesta no redirige al portal cautivo: no se descarga ningún cuerpo ni
+        se hace la petición de la redirección.
+        """
         self.__session = session
         self.__scrapper = scrapper
+        self.max_workers = max_workers
+        self.parser = parser or DEFAULT_PARSER
+        self.pipeline = pipeline
+        self.prefetch_pages = prefetch_pages
+        self.parse_executor = parse_executor
+        self.connection_probe = connection_probe
 
-    def __make_url(
-            self, portal_manager: Portal, action: Action, get_action: bool = False, sub_action: Optional[str] = None,
-            year_month_selected: Optional[str] = None, count: Optional[int] = None, page: Optional[int] = None
-    ) -> str:
-        """
-        Construye una URL para una acción determinada en un portal determinado.
+    @property
+    def parser(self) -> str:
+        return self.__parser
 
-        :param portal_manager: Un objeto Portal que representa el portal en el que se realizará la acción.
-        :param action: Una enumeración Action que representa la acción que se realizará en el portal.
-        :param get_action: Un booleano que indica si se debe obtener una URL básica para la acción dada o una URL más
-        detallada. El valor predeterminado es False.
-        :param sub_action: Una cadena que representa la sub-acción que se realizará en la acción dada. El valor
-        predeterminado es None.
-        :param year_month_selected: Una cadena que representa el año y mes seleccionados para la acción de lista.
-        Requerido si la sub-acción es 'list'.
-        :param count: Un entero que representa el número máximo de elementos que se deben recuperar para la acción de
-        lista. Requerido si la sub-acción es 'list'.
-        :param page: Un entero que representa el número de página que se debe recuperar para la acción de lista. El
-        valor predeterminado es None, lo que significa que se recuperarán todos los elementos.
+    @parser.setter
+    def parser(self, value: str):
+        self.__parser = check_parser(value)
 
-        :return: Una cadena que representa la URL construida para la acción dada en el portal dado.
+    @property
+    def max_workers(self) -> int:
+        return self.__max_workers
 
-        :raises ValueError: Si year_month_selected o count están ausentes cuando sub_action es 'list'.
-        """
-        if action == Action.CHECK_CONNECTION:
-            return self._portals_urls[portal_manager][action]
-        elif not get_action:
-            return f'{self._base_url[portal_manager]}{self._portals_urls[portal_manager][action]}'
-        else:
-            url = f'{self._base_url[portal_manager]}{self._portals_urls[portal_manager][action][sub_action]}'
-            if sub_action in ('base', 'summary'):
-                return url
-            elif sub_action == 'list':
-                if not year_month_selected:
-                    raise ValueError("year_month_selected is required for 'list' sub-action")
-                if not count:
-                    raise ValueError("count is required for 'list' sub-action")
-                else:
-                    return f'{url}{year_month_selected}/{count}' \
-                        if not page else f'{url}{year_month_selected}/{count}/{page}'
+    @max_workers.setter
+    def max_workers(self, value: int):
+        if value < 1:
+            raise ValueError("max_workers debe ser mayor o igual que 1")
+        self.__max_workers = value
+
+    @property
+    def prefetch_pages(self) -> int:
+        return self.__prefetch_pages
+
+    @prefetch_pages.setter
+    def prefetch_pages(self, value: int):
+        if value < 1:
+            raise ValueError("prefetch_pages debe ser mayor o igual que 1")
+        self.__prefetch_pages = value
+
+    @property
+    def connection_probe(self) -> str:
+        return self.__connection_probe
+
+    @connection_probe.setter
+    def connection_probe(self, value: str):
+        if value not in CONNECTION_PROBES:
+            raise ValueError(f"connection_probe debe ser uno de {CONNECTION_PROBES}")
+        self.__connection_probe = value
 
     @staticmethod
     def __get_inputs(form_soup: Tag) -> dict:
-        """
-        Obtiene los valores de entrada de un formulario HTML dado y los devuelve en un diccionario.
-
-        :param form_soup: El objeto BeautifulSoup que representa el formulario HTML.
-        :type form_soup: bs4.Tag
-        :return: Un diccionario que contiene los valores de entrada del formulario.
-        :rtype: dict
-        """
-        return {
-            _["name"]: _.get("value", default=None)
-            for _ in form_soup.select("input[name]")
-        }
+        return get_inputs(form_soup)
 
     @staticmethod
     def __get_csrf(soup: BeautifulSoup) -> str:
+        return get_csrf(soup)
+
+    def __get_information_user(self, soup: BeautifulSoup) -> NautaUser:
+        user_info = parse_user_information(soup)
+        self._is_nauta_home = "offer" in user_info.keys()
+        return NautaUser.from_dict(user_info)
+
+    @staticmethod
+    def __get_information_connect(soup: BeautifulSoup) -> dict:
+        return parse_connect_information(soup)
+
+    def __find_errors(self, soup: BeautifulSoup, portal_manager: Portal, exception: Type[Exception], message: str):
+        find_errors(soup, portal_manager, exception, message, self.__parser)
+
+    def __parse(self, portal_manager: Portal, action: Action, func: Callable, *args):
         """
-        Obtiene el valor del token CSRF de una página web y lo devuelve como una cadena.
+        Llama a `func` con `args` y, si la sesión tiene hooks `parse`, les notifica cuánto tardó y, si lanzó una
+        excepción, cuál.
+        """
+        if not self.__session.has_hooks("parse"):
+            return func(*args)
+        start = time.perf_counter()
+        try:
+            result = func(*args)
+        except Exception as e:
+            self.__session.dispatch_hook("parse", ParseEvent(
+                portal_manager, action, time.perf_counter() - start, exception=e
+            ))
+            raise
+        self.__session.dispatch_hook("parse", ParseEvent(
+            portal_manager, action, time.perf_counter() - start, len(result) if isinstance(result, list) else None
+        ))
+        return result
+
+    def __run_parser(self, func: Callable, response, *args):
+        """
+        Llama a `func` con el cuerpo y la codificación de `response`, el backend de análisis HTML y `args`, en
+        `parse_executor` si está configurado.
+        """
+        args = (response.content, response.encoding or "utf-8", self.__parser, *args)
+        if self.parse_executor is None:
+            return func(*args)
+        return self.parse_executor.submit(func, *args).result()
 
-        :param soup: El objeto BeautifulSoup que representa la página web.
-        :type soup: BeautifulSoup
-        :return: El valor del token CSRF de la página web.
-        :rtype: str
+    def __make_soup(self, response) -> BeautifulSoup:
+        """
+        Analiza el cuerpo de `response` decodificándolo con la codificación que fijó la sesión, sin pasar por
+        `response.text`.
         """
-        return soup.select_one('input[name=csrf]').attrs["value"]
+        return make_soup(response.content, self.__parser, response.encoding or "utf-8")
 
-    def __get_information_user(self, soup: BeautifulSoup) -> NautaUser:
-        keys = [
-            'username', 'blocking_date', 'date_of_elimination',
-            'account_type', 'service_type', 'credit', 'time',
-            'mail_account', 'offer', 'monthly_fee', 'download_speeds',
-            'upload_speeds', 'phone', 'link_identifiers',
-            'link_status', 'activation_date', 'blocking_date_home',
-            'date_of_elimination_home', 'quote_paid', 'voucher', 'debt'
-        ]
-        user_info = {}
-        for _index, attr in enumerate(
-                soup.select_one('.z-depth-1').select('.m6')
-        ):
-            user_info = {
-                **user_info,
-                keys[_index]: attr.select_one('p').text.strip()
-            }
+    def __make_checked_soup(
+            self, response, portal_manager: Portal, exception: Type[Exception], message: str
+    ) -> BeautifulSoup:
+        soup = self.__make_soup(response)
+        self.__find_errors(soup, portal_manager, exception, message)
+        return soup
+
+    def __parse_user_information(self, response, exception: Type[Exception], message: str) -> NautaUser:
+        user_info = self.__run_parser(parse_user_information_page, response, exception, message)
         self._is_nauta_home = "offer" in user_info.keys()
         return NautaUser.from_dict(user_info)
 
     @staticmethod
-    def __get_information_connect(soup: BeautifulSoup) -> dict:
-        keys = [
-            "account_status",
-            "credit",
-            "expiration_date",
-            "access_areas",
-            "from",
-            "to",
-            "time"
-        ]
-        return {
-            'account_info': {
-                keys[count]: value.text.strip()
-                for count, value in enumerate(soup.select(
-                    '#sessioninfo > tbody > tr > :not(td.key)'
-                ))
-            },
-            'lasts_connections': [
-                {
-                    keys[count + 4]: value.text.strip()
-                    for count, value in enumerate(tr.select('td'))
-                } for tr in soup.select(
-                    '#sesiontraza > tbody > tr'
-                )
-            ]
-        }
+    def __parse_rows(action: Action, rows: list[tuple[str, ...]]) -> list:
+        # El hook `parse` ya se notificó al extraer las filas de cada página, así que aquí no se vuelve a notificar
+        parse_row = rows_parsers[action]
+        return [parse_row(row) for row in rows]
 
     @staticmethod
-    def __find_errors(soup: BeautifulSoup, portal_manager: Portal, exception: Type[Exception], message: str):
-        errors = parse_errors(soup, portal_manager)
-        if errors:
-            raise exception(f"{message} :: {errors}")
+    def __parse_summary(action: Action, summary_cells: tuple[str, ...]):
+        # Como en `__parse_rows`, el hook `parse` ya se notificó al analizar la página del resumen
+        return summaries_cells_parsers[action](summary_cells)
 
     def __user_session_init(self):
-        response = self.__session.get(
-            Portal.USER,
-            self.__make_url(
-                Portal.USER,
-                Action.LOGIN
-            )
+        self.__session.csrf = self.__get_csrf_from(
+            self._make_url(Portal.USER, Action.LOGIN), PreLoginException, "Fail during pre login action", Action.LOGIN
         )
-        soup = BeautifulSoup(response.text, "html5lib")
-        self.__find_errors(soup, Portal.USER, PreLoginException, "Fail during pre login action")
-        self.__session.csrf = self.__get_csrf(soup)
+
+    def __get_csrf_from(self, url: str, exception: Type[Exception], message: str, action: Action) -> str:
+        """
+        Devuelve el token csrf de la página `url` del portal de usuario.
+
+        La página se analiza mientras se descarga, sin construir el árbol del documento. El portal muestra sus errores
+        en un script posterior al formulario, así que se lee hasta `</body>`, sin descargar lo que venga después, y,
+        si contiene un error, se lanza aunque también tenga el token. Si termina sin error y sin token, se analiza
+        completa con `get_csrf`.
+
+        :param url: La URL de la página que contiene el token.
+        :param exception: La excepción a lanzar si el portal devuelve un error.
+        :param message: El mensaje de la excepción.
+        :param action: La acción a la que corresponde la página, para los hooks de la sesión.
+        :return: El token csrf.
+        """
+        scanner = FormScanner(("csrf",), encoding=PORTAL_ENCODINGS[Portal.USER], scripts=True)
+        response = self.__session.get(Portal.USER, url, action=action, consume=scanner.scan)
+        find_script_errors(scanner.last_script, Portal.USER, exception, message, self.__parser)
+        if "csrf" in scanner.inputs:
+            return scanner.inputs["csrf"]
+        soup = self.__parse(Portal.USER, action, self.__make_checked_soup, response, Portal.USER, exception, message)
+        return self.__get_csrf(soup)
 
     def __connect_session_init(self):
         """
@@ -352,49 +561,119 @@ class DefaultNautaScrapper(NautaScrapper):
         if self.is_connected:
             raise PreLoginException("Ya estás conectado a internet")
 
-        # Primera pasada: se espera una redirección
+        # Primera pasada: se espera una redirección. Solo hace falta el formulario, así que se deja de leer la página
+        # en cuanto se cierra
+        scanner = FormScanner(form=True, encoding=PORTAL_ENCODINGS[Portal.CONNECT])
         response = self.__session.get(
             Portal.CONNECT,
-            self.__make_url(
+            self._make_url(
                 Portal.CONNECT,
                 Action.CHECK_CONNECTION
-            )
+            ),
+            action=Action.LOGIN,
+            consume=scanner.scan
         )
         # Obteniendo datos previos al inicio de sesión
         logger.debug("Obtaining pre login data")
-        soup = BeautifulSoup(response.text, "html5lib")
-        action = soup.form["action"]
-        data = self.__get_inputs(soup)
+        if scanner.done:
+            action, data = scanner.action, scanner.inputs
+        else:
+            soup = self.__make_soup(response)
+            action = soup.form["action"]
+            data = self.__get_inputs(soup)
 
         # Segunda pasada: contentando con el portal
         logger.debug(f"Connecting to {action}")
+        scanner = FormScanner(("CSRFHW", "wlanuserip"), "formulario", PORTAL_ENCODINGS[Portal.CONNECT])
         response = self.__session.post(
             Portal.CONNECT,
             action,
-            data
+            data,
+            action=Action.LOGIN,
+            consume=scanner.scan
         )
 
         # Obteniendo datos para establecer la sesión
         logger.debug("Obtaining data for make a session")
-        soup = BeautifulSoup(response.text, "html5lib")
-        form_soup = soup.select_one("#formulario")
-        data = self.__get_inputs(form_soup)
+        if scanner.done:
+            login_action, data = scanner.action, scanner.inputs
+        else:
+            form_soup = self.__make_soup(response).select_one("#formulario")
+            login_action, data = form_soup["action"], self.__get_inputs(form_soup)
 
         # Estableciendo datos para la sesión
         logger.debug("Establishing data for the session")
-        self.__session._login_action = form_soup["action"]
+        self.__session._login_action = login_action
         self.__session._csrf_hw = data["CSRFHW"]
         self.__session._wlan_user_ip = data["wlanuserip"]
 
-    def __get_summary_html_content(self, year: int, month: int, action: Action) -> list[Tag]:
+    def __get_cached_csrf(self, url: str, exception: Type[Exception], message: str, action: Action = None) -> str:
+        """
+        Devuelve el token csrf de la página `url`, reutilizando el de la cache de la sesión si sigue siendo válido.
+
+        :param url: La URL de la página que contiene el formulario de la acción.
+        :param exception: La excepción a lanzar si el portal devuelve un error.
+        :param message: El mensaje de la excepción.
+        :param action: La acción a la que corresponde el formulario, para los hooks de la sesión.
+        :return: El token csrf.
+        """
+        csrf = self.__session.csrf_cache.get(url)
+        if csrf is None:
+            csrf = self.__get_csrf_from(url, exception, message, action)
+            self.__session.csrf_cache.set(url, csrf)
+        return csrf
+
+    def __post_with_csrf(
+            self, csrf_url: str, url: str, data: dict, exception: Type[Exception], message: str, action: Action = None
+    ) -> BeautifulSoup:
+        """
+        Envía un formulario del portal de usuario con el token csrf de la cache de la sesión y analiza la respuesta
+        (ver `__send_with_csrf`).
+
+        :return: La respuesta del portal analizada.
+        """
+        response = self.__send_with_csrf(csrf_url, url, data, exception, message, action)
+        return self.__parse(Portal.USER, action, self.__make_checked_soup, response, Portal.USER, exception, message)
+
+    def __send_with_csrf(
+            self, csrf_url: str, url: str, data: dict, exception: Type[Exception], message: str, action: Action = None
+    ):
         """
-        Este método privado devuelve el contenido HTML del resumen para un año, mes y acción dados.
+        Envía un formulario del portal de usuario con el token csrf de la cache de la sesión.
+
+        Si el portal rechaza el token, se invalida, se obtiene uno nuevo y se reintenta la petición una sola vez.
+
+        :param csrf_url: La URL de la página de la que se obtiene el token csrf.
+        :param url: La URL a la que se envía el formulario.
+        :param data: Los datos del formulario, sin el token csrf.
+        :param exception: La excepción a lanzar si el portal devuelve un error.
+        :param message: El mensaje de la excepción.
+        :param action: La acción a la que corresponde el formulario, para los hooks de la sesión.
+        :return: La respuesta del portal, sin analizar.
+        """
+        response = self.__session.post(
+            Portal.USER, url, {"csrf": self.__get_cached_csrf(csrf_url, exception, message, action), **data},
+            parse_response=False, action=action
+        )
+        if self.__session.is_csrf_rejected(response):
+            logger.debug(f"CSRF token rejected by {url}, retrying with a new one")
+            self.__session.csrf_cache.invalidate(csrf_url)
+            response = self.__session.post(
+                Portal.USER, url, {"csrf": self.__get_cached_csrf(csrf_url, exception, message, action), **data},
+                parse_response=False, action=action, retries=1
+            )
+        self.__session.parse_response(response)
+        return response
+
+    def __get_summary_cells(self, year: int, month: int, action: Action) -> tuple[str, ...]:
+        """
+        Este método privado devuelve los valores, sin convertir, del resumen para un año, mes y acción dados.
 
         :param year: Un entero que representa el año.
         :param month: Un entero que representa el mes.
         :param action: Un valor enum de Action que representa la acción.
-        :return: Una lista de elementos div con la clase card-content, que contienen el contenido HTML del resumen para
-        la acción, año y mes dados.
+        :return: Una tupla con el número de filas del listado, el mes seleccionado y el valor de cada tarjeta del
+        resumen (ver `get_summary_cells`).
         :raises: GetInfoException: Si ocurren errores al enviar las solicitudes GET o POST o al analizar el HTML de
         respuesta.
         """
@@ -412,46 +691,27 @@ class DefaultNautaScrapper(NautaScrapper):
         }
         year_month = f"{year}-{month:02}"
 
-        # Obtención del token csrf requerido para esta acción
-        response_get = self.__session.get(
-            Portal.USER,
-            self.__make_url(
-                Portal.USER,
-                action,
-                True,
-                "base"
-            )
-        )
-        soup = BeautifulSoup(response_get.text, "html5lib")
-        self.__find_errors(soup, Portal.USER, GetInfoException, errors_messages[action])
-        csrf = self.__get_csrf(soup)
-
-        # Intentando obtener el resumen de la acción
-        response = self.__session.post(
-            Portal.USER,
-            self.__make_url(
-                Portal.USER,
-                action,
-                True,
-                "summary"
-            ),
+        response = self.__send_with_csrf(
+            self._make_url(Portal.USER, action, True, "base"),
+            self._make_url(Portal.USER, action, True, "summary"),
             {
-                "csrf": csrf,
                 "year_month": year_month,
                 "list_type": actions_details[action]
-            }
+            },
+            GetInfoException,
+            errors_messages[action],
+            action
+        )
+        return self.__parse(
+            Portal.USER, action, self.__run_parser, parse_summary_page, response, GetInfoException,
+            errors_messages[action]
         )
-        soup = BeautifulSoup(response.text, "html5lib")
-        self.__find_errors(soup, Portal.USER, GetInfoException, errors_messages[action])
-
-        # Devolviendo una lista de divs con la clase card-content
-        return soup.select_one('#content').select('.card-content')
 
-    def __get_action_per_page_as_row_html(
+    def __get_action_per_page_as_models(
             self, action: Action, year_month_selected: str, count: int, large: int = 0, _reversed: bool = False
-    ) -> list[Tag]:
+    ) -> list:
         """
-        Este método privado devuelve una lista de objetos Tag que representan las filas de una tabla de una página web.
+        Este método privado devuelve las filas de las páginas de un listado como objetos del modelo de la acción.
 
         :param action: Una instancia de la enumeración Action que representa la acción a realizar.
         :param year_month_selected: Una cadena que representa el año y mes seleccionados.
@@ -460,48 +720,199 @@ class DefaultNautaScrapper(NautaScrapper):
         significa que se devolverán todas las filas.
         :param _reversed: Un valor booleano que indica si las filas deben ser devueltas en orden inverso. El valor por
         defecto es False.
-        :return: Una lista de objetos Tag que representan las filas de una tabla de una página web.
+        :return: Una lista de objetos del modelo correspondiente a la acción.
+
+        Las páginas necesarias se calculan de antemano a partir de `count` y se obtienen con `__get_pages_rows`. Las
+        filas de cada página se convierten en modelos en cuanto la página está disponible y se devuelven siempre en
+        el orden de las páginas.
         """
-        rows = []
-        totals_pages = math.ceil(count / 14)
-        current_page = totals_pages if _reversed else 1
         if large == 0:
             large = count
+        urls = self._get_list_urls(
+            action, year_month_selected, count, self._get_pages_to_fetch(count, large, _reversed)
+        )
 
-        while len(rows) < large and current_page >= 1:
-            page = current_page if current_page != 1 else None
-            url = self.__make_url(
-                portal_manager=Portal.USER, action=action, get_action=True, sub_action='list',
-                year_month_selected=year_month_selected, count=count, page=page
-            )
-            table_body = self.__get_table_body_html(url)
-            if table_body:
-                rows_page = [row for row in reversed(table_body.select('tr'))] \
-                    if _reversed else \
-                    [row for row in table_body.select('tr')]
-                rows.extend(
-                    rows_page[:abs(large) - len(rows)]
+        models = []
+        for page_rows in self.__get_pages_rows(action, urls):
+            if _reversed:
+                page_rows.reverse()
+            models.extend(self.__parse_rows(action, page_rows[:abs(large) - len(models)]))
+        return models
+
+    def __get_pages_rows(self, action: Action, urls: list[str]) -> Iterator[list[tuple[str, ...]]]:
+        """
+        Devuelve, en orden, las filas de cada página de un listado.
+
+        Si `max_workers` es mayor que 1, las páginas se descargan en paralelo. Si no, y `pipeline` está activado y hay
+        más de una página, se descargan en un hilo aparte mientras se analizan las anteriores (`__prefetch`). En otro
+        caso, se descargan y analizan una a una.
+        """
+        if self.__max_workers > 1:
+            return iter(self.__map(lambda url: self.__get_table_rows(url, action), urls))
+        if self.pipeline and len(urls) > 1:
+            return self.__prefetch(action, urls)
+        return (self.__get_table_rows(url, action) for url in urls)
+
+    def __prefetch(self, action: Action, urls: list[str]) -> Iterator[list[tuple[str, ...]]]:
+        """
+        Descarga las páginas de `urls` en un hilo aparte, una a una, y devuelve las filas de cada una a medida que se
+        analizan en el hilo que llama.
+
+        Las páginas descargadas esperan en una cola de `prefetch_pages` elementos; cuando se llena, la descarga se
+        detiene hasta que se analiza una página, de modo que nunca hay más de una petición en curso al portal ni más
+        de `prefetch_pages` páginas en memoria. Si la descarga falla, la excepción se lanza en el hilo que llama al
+        llegar a esa página.
+        """
+        pending = queue.Queue(maxsize=self.__prefetch_pages)
+        stop = threading.Event()
+        fetcher = threading.Thread(
+            target=self.__fetch_pages, args=(action, urls, pending, stop), name="nauta-prefetch", daemon=True
+        )
+        fetcher.start()
+        try:
+            for _ in urls:
+                response, error = pending.get()
+                if error is not None:
+                    raise error
+                yield self.__parse(Portal.USER, action, self.__parse_table_rows, response)
+        finally:
+            stop.set()
+            # Se vacía la cola para que la descarga no quede bloqueada en `put`; como ya no quedan huecos ocupados,
+            # a lo sumo entra una página más antes de que vea `stop`
+            while True:
+                try:
+                    pending.get_nowait()
+                except queue.Empty:
+                    break
+            fetcher.join()
+
+    def __fetch_pages(self, action: Action, urls: list[str], pending: queue.Queue, stop: threading.Event):
+        """
+        Descarga las páginas de `urls` para `__prefetch` y deja en `pending` la respuesta de cada una, o la excepción
+        con la que falló su descarga. Se detiene al fallar una descarga o cuando se activa `stop`.
+        """
+        for url in urls:
+            if stop.is_set():
+                return
+            try:
+                item = self.__session.get(Portal.USER, url, action=action), None
+            except Exception as e:
+                item = None, e
+            pending.put(item)
+            if item[1] is not None:
+                return
+
+    def __map(self, func: Callable, items: list) -> list:
+        """
+        Aplica `func` a cada elemento de `items`, en paralelo si `max_workers` es mayor que 1, y devuelve los
+        resultados en el orden de entrada.
+        """
+        if self.__max_workers > 1 and len(items) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.__max_workers, len(items))) as executor:
+                return list(executor.map(func, items))
+        return [func(item) for item in items]
+
+    def __get_action_between(
+            self, action: Action, start: datetime.date | datetime.datetime, end: datetime.date | datetime.datetime
+    ) -> list:
+        """
+        Este método privado devuelve las filas de un listado comprendidas entre dos fechas, en orden cronológico.
+
+        Primero se obtienen los resúmenes de todos los meses del rango y, con ellos, se planifican todas las páginas a
+        descargar. Tanto los resúmenes como las páginas se descargan con hasta `max_workers` peticiones simultáneas.
+        Las filas de los meses de los extremos que quedan fuera del rango se descartan.
+
+        :param action: La acción del listado.
+        :param start: La fecha o fecha y hora de inicio del rango.
+        :param end: La fecha o fecha y hora de fin del rango.
+        :return: Una lista de objetos del modelo correspondiente a la acción.
+        """
+        start, end = datetime_range(start, end)
+        months = months_between(start, end)
+        # Se obtiene el token antes de repartir los resúmenes entre los hilos para que no se pida una vez por hilo
+        self.__get_cached_csrf(
+            self._make_url(Portal.USER, action, True, "base"), GetInfoException, "Fail to obtain information", action
+        )
+        summaries = self.__map(
+            lambda year_month: summaries_cells_parsers[action](self.__get_summary_cells(*year_month, action)),
+            months
+        )
+
+        plan = []
+        for month_index, summary in enumerate(summaries):
+            if summary.count:
+                pages = self._get_pages_to_fetch(summary.count, summary.count)
+                plan.extend(
+                    (month_index, url)
+                    for url in self._get_list_urls(action, summary.year_month_selected, summary.count, pages)
                 )
-            current_page += -1 if _reversed else 1
-        return rows
+        pages_rows = self.__get_pages_rows(action, [url for _, url in plan])
 
-    def __get_table_body_html(self, url: str) -> Tag:
+        # El portal lista primero las filas más recientes, así que cada mes se invierte completo
+        months_rows = [[] for _ in months]
+        for (month_index, _), page_rows in zip(plan, pages_rows):
+            months_rows[month_index].extend(page_rows)
+        rows = []
+        for month_rows in months_rows:
+            rows.extend(self.__parse_rows(action, month_rows[::-1]))
+        return self._filter_by_range(action, rows, start, end)
+
+    def __iter_action(self, action: Action, summary, _reversed: bool = False) -> Iterator:
+        """
+        Este método privado recorre las filas de un listado descargando cada página solo cuando se han consumido las
+        filas de la anterior.
+
+        :param action: La acción del listado.
+        :param summary: El resumen del mes del listado.
+        :param _reversed: Un valor booleano que indica si las filas se recorren desde la más antigua.
+        :return: Un iterador de objetos del modelo correspondiente a la acción.
         """
-        Este método privado devuelve el contenido HTML del cuerpo de una tabla de una página web.
+        urls = self._get_list_urls(
+            action, summary.year_month_selected, summary.count,
+            self._get_pages_to_fetch(summary.count, summary.count, _reversed)
+        )
+        parse_row = rows_parsers[action]
+        for url in urls:
+            rows = self.__get_table_rows(url, action)
+            if _reversed:
+                rows.reverse()
+            for row in rows:
+                yield parse_row(row)
+            # Se suelta la página antes de descargar la siguiente
+            del rows
+
+    def __get_table_rows(self, url: str, action: Action = None) -> list[tuple[str, ...]]:
+        """
+        Este método privado devuelve las filas de la tabla de una página de listado.
+
+        Las filas se extraen directamente de la respuesta con `parse_list_page`, sin construir el árbol del
+        documento. Los errores del portal se detectan aunque la página contenga la tabla.
 
         :param url: Una cadena que representa la URL de la página web.
-        :return: Un objeto de tipo Tag que representa el contenido HTML del cuerpo de una tabla de una página web.
+        :param action: La acción del listado, para los hooks de la sesión.
+        :return: Una lista de tuplas con el texto de las celdas de cada fila.
         """
-        response = self.__session.get(Portal.USER, url)
-        soup = BeautifulSoup(response.text, "html5lib")
-        self.__find_errors(soup, Portal.USER, GetInfoException, "Fail to obtain information")
-        return soup.select_one(".responsive-table > tbody")
+        response = self.__session.get(Portal.USER, url, action=action)
+        return self.__parse(Portal.USER, action, self.__parse_table_rows, response)
+
+    def __parse_table_rows(self, response) -> list[tuple[str, ...]]:
+        return self.__run_parser(parse_list_page, response)
+
+    def __redirects_to_connect_portal(self) -> bool:
+        """
+        Pide la URL de comprobación de la conexión según `connection_probe` e indica si lleva al portal cautivo.
+        """
+        url = self._make_url(Portal.CONNECT, Action.CHECK_CONNECTION)
+        if self.__connection_probe == "head":
+            response = self.__session.head(Portal.CONNECT, url, parse_response=False, action=Action.CHECK_CONNECTION)
+            return self._connect_domain in (response.headers.get("Location") or "")
+        response = self.__session.get(Portal.CONNECT, url, action=Action.CHECK_CONNECTION, consume=lambda chunk: True)
+        return self._connect_domain in response.url
 
     @property
     def is_connected(self) -> bool:
         logger.debug("Checking connection")
-        response = self.__session.get(Portal.CONNECT, self.__make_url(Portal.CONNECT, Action.CHECK_CONNECTION))
-        return self._connect_domain not in response.url
+        return not self.__redirects_to_connect_portal()
 
     @property
     def is_logged_in(self) -> bool:
@@ -527,14 +938,16 @@ class DefaultNautaScrapper(NautaScrapper):
             )
         response = self.__session.get(
             Portal.USER,
-            self.__make_url(
+            self._make_url(
                 Portal.USER,
                 Action.LOAD_USER_INFORMATION
-            )
+            ),
+            action=Action.LOAD_USER_INFORMATION
+        )
+        return self.__parse(
+            Portal.USER, Action.LOAD_USER_INFORMATION, self.__parse_user_information, response, GetInfoException,
+            "Error al obtener la información del usuario"
         )
-        soup = BeautifulSoup(response.text, "html5lib")
-        self.__find_errors(soup, Portal.USER, GetInfoException, "Error al obtener la información del usuario")
-        return self.__get_information_user(soup)
 
     @property
     def remaining_time(self) -> str:
@@ -542,7 +955,7 @@ class DefaultNautaScrapper(NautaScrapper):
             raise GetInfoException("This session is not logged in")
         response = self.__session.post(
             Portal.CONNECT,
-            self.__make_url(
+            self._make_url(
                 Portal.CONNECT,
                 Action.LOAD_USER_INFORMATION
             ),
@@ -552,20 +965,14 @@ class DefaultNautaScrapper(NautaScrapper):
                 "CSRFHW": self.__session.csrf_hw,
                 "wlanuserip": self.__session.wlan_user_ip,
                 "username": self.__session.username,
-            }
+            },
+            action=Action.LOAD_USER_INFORMATION
         )
         return response.text.strip()
 
     def check_portal_access(self):
         try:
-            response = self.__session.get(
-                Portal.CONNECT,
-                self.__make_url(
-                    Portal.CONNECT,
-                    Action.CHECK_CONNECTION
-                )
-            )
-            return self._connect_domain in response.url
+            return self.__redirects_to_connect_portal()
         except Type[Exception]:
             return False
 
@@ -585,7 +992,7 @@ class DefaultNautaScrapper(NautaScrapper):
 
         response = self.__session.post(
             Portal.CONNECT,
-            self.__make_url(
+            self._make_url(
                 Portal.CONNECT,
                 Action.LOAD_USER_INFORMATION
             ),
@@ -595,11 +1002,16 @@ class DefaultNautaScrapper(NautaScrapper):
                 'wlanuserip': self.__session.wlan_user_ip,
                 'CSRFHW': self.__session.csrf_hw,
                 'lang': ''
-            }
+            },
+            action=Action.LOAD_USER_INFORMATION
+        )
+        return self.__parse(
+            Portal.CONNECT, Action.LOAD_USER_INFORMATION, lambda: self.__get_information_connect(
+                self.__make_checked_soup(
+                    response, Portal.CONNECT, GetInfoException, "Error al obtener la información del usuario"
+                )
+            )
         )
-        soup = BeautifulSoup(response.text, "html5lib")
-        self.__find_errors(soup, Portal.CONNECT, GetInfoException, "Error al obtener la información del usuario")
-        return self.__get_information_connect(soup)
 
     @property
     def data_session(self) -> dict:
@@ -635,7 +1047,8 @@ class DefaultNautaScrapper(NautaScrapper):
             self.__user_session_init()
         return self.__session.get(
             Portal.USER,
-            "https://www.portal.nauta.cu/captcha/?"
+            f"{self._base_url[Portal.USER]}captcha/?",
+            action=Action.LOGIN
         ).content
 
     def connect(self, username: str, password: str):
@@ -657,11 +1070,12 @@ class DefaultNautaScrapper(NautaScrapper):
                 "wlanuserip": self.__session.wlan_user_ip,
                 "username": username,
                 "password": password
-            }
+            },
+            action=Action.LOGIN
         )
         if "online.do" not in response.url:
             self.__find_errors(
-                BeautifulSoup(response.text, "html5lib"),
+                self.__make_soup(response),
                 Portal.CONNECT,
                 LoginException,
                 "No se pudo iniciar sesión en el portal"
@@ -680,9 +1094,10 @@ class DefaultNautaScrapper(NautaScrapper):
             raise NotLoggedIn("You are not logged in")
         response = self.__session.post(
             Portal.CONNECT,
-            f"{self.__make_url(Portal.CONNECT, Action.LOGOUT)}?CSRFHW={self.__session.csrf_hw}&"
+            f"{self._make_url(Portal.CONNECT, Action.LOGOUT)}?CSRFHW={self.__session.csrf_hw}&"
             f"username={self.__session.username}&ATTRIBUTE_UUID={self.__session.attribute_uuid}&"
-            f"wlanuserip={self.__session.wlan_user_ip}"
+            f"wlanuserip={self.__session.wlan_user_ip}",
+            action=Action.LOGOUT
         )
         if "SUCCESS" not in response.text.upper():
             raise LogoutException(
@@ -711,7 +1126,7 @@ class DefaultNautaScrapper(NautaScrapper):
 
         response = self.__session.post(
             Portal.USER,
-            self.__make_url(
+            self._make_url(
                 Portal.USER,
                 Action.LOGIN
             ),
@@ -721,12 +1136,16 @@ class DefaultNautaScrapper(NautaScrapper):
                 'password_user': password,
                 'captcha': captcha_code.upper(),
                 'btn_submit': ''
-            }
+            },
+            action=Action.LOGIN
+        )
+        user = self.__parse(
+            Portal.USER, Action.LOGIN, self.__parse_user_information, response, LoginException,
+            "No se pudo iniciar sesión en el portal"
         )
-        soup = BeautifulSoup(response.text, "html5lib")
-        self.__find_errors(soup, Portal.USER, LoginException, "No se pudo iniciar sesión en el portal")
         self.__session._username = username
-        return self.__get_information_user(soup)
+        self.__session.csrf_cache.invalidate()
+        return user
 
     def logout(self):
         """
@@ -734,6 +1153,7 @@ class DefaultNautaScrapper(NautaScrapper):
         """
         self.__session.user_cookies = None
         self.__session.csrf = None
+        self.__session.csrf_cache.invalidate()
 
     def to_up(self, recharge_code):
         """
@@ -743,33 +1163,18 @@ class DefaultNautaScrapper(NautaScrapper):
         :raises RechargeException: Si no se puede recargar el saldo de la cuenta.
         """
 
-        # Obtención del token csrf requerido para esta acción
-        response_get = self.__session.get(
-            Portal.USER,
-            self.__make_url(
-                Portal.USER,
-                Action.RECHARGE
-            )
-        )
-        soup = BeautifulSoup(response_get.text, "html5lib")
-        self.__find_errors(soup, Portal.USER, RechargeException, "No se pudo recargar el saldo de la cuenta")
-        csrf = self.__get_csrf(soup)
-
-        # Intento de recarga del saldo de la cuenta
-        response = self.__session.post(
-            Portal.USER,
-            self.__make_url(
-                Portal.USER,
-                Action.RECHARGE
-            ),
+        url = self._make_url(Portal.USER, Action.RECHARGE)
+        self.__post_with_csrf(
+            url,
+            url,
             {
-                "csrf": csrf,
                 "recharge_code": recharge_code,
                 "btn_submit": ""
-            }
+            },
+            RechargeException,
+            "No se pudo recargar el saldo de la cuenta",
+            Action.RECHARGE
         )
-        soup = BeautifulSoup(response.text, "html5lib")
-        self.__find_errors(soup, Portal.USER, RechargeException, "No se pudo recargar el saldo de la cuenta")
 
     def transfer(self, amount: float, password: str, destination_account: str = None):
         """
@@ -783,39 +1188,22 @@ class DefaultNautaScrapper(NautaScrapper):
         :raises TransferException: Si no se puede transferir el saldo a la cuenta de destino.
         """
 
-        # Obtención del token csrf requerido para esta acción
-        response_get = self.__session.get(
-            Portal.USER,
-            self.__make_url(
-                Portal.USER,
-                Action.TRANSFER
-            )
-        )
-        soup = BeautifulSoup(response_get.text, "html5lib")
-        self.__find_errors(soup, Portal.USER, TransferException,
-                           "No se pudo transferir el saldo a la cuenta de destino")
-        csrf = self.__get_csrf(soup)
-
-        # Intento de transferencia del saldo
         data = {
-            "csrf": csrf,
             "transfer": f"{amount:.2f}".replace(".", ","),
             "password_user": password,
             "action": "checkdata"
         }
         if destination_account:
             data["id_cuenta"] = destination_account
-        response = self.__session.post(
-            Portal.USER,
-            self.__make_url(
-                Portal.USER,
-                Action.TRANSFER
-            ),
-            data
+        url = self._make_url(Portal.USER, Action.TRANSFER)
+        self.__post_with_csrf(
+            url,
+            url,
+            data,
+            TransferException,
+            "No se pudo transferir el saldo a la cuenta de destino",
+            Action.TRANSFER
         )
-        soup = BeautifulSoup(response.text, "html5lib")
-        self.__find_errors(soup, Portal.USER, TransferException,
-                           "No se pudo transferir el saldo a la cuenta de destino")
 
     def change_password(self, old_password: str, new_password: str):
         """
@@ -827,35 +1215,20 @@ class DefaultNautaScrapper(NautaScrapper):
         :raises ChangePasswordException: Si no se puede cambiar la contraseña de la cuenta.
         """
 
-        # Obtención del token csrf requerido para esta acción
-        response_get = self.__session.get(
-            Portal.USER,
-            self.__make_url(
-                Portal.USER,
-                Action.CHANGE_PASSWORD
-            )
-        )
-        soup = BeautifulSoup(response_get.text, "html5lib")
-        self.__find_errors(soup, Portal.USER, ChangePasswordException, "No se pudo cambiar la contraseña de la cuenta")
-        csrf = self.__get_csrf(soup)
-
-        # Intento de cambio de contraseña
-        response = self.__session.post(
-            Portal.USER,
-            self.__make_url(
-                Portal.USER,
-                Action.CHANGE_PASSWORD
-            ),
+        url = self._make_url(Portal.USER, Action.CHANGE_PASSWORD)
+        self.__post_with_csrf(
+            url,
+            url,
             {
-                "csrf": csrf,
                 "old_password": old_password,
                 "new_password": new_password,
                 "repeat_new_password": new_password,
                 "btn_submit": ""
-            }
+            },
+            ChangePasswordException,
+            "No se pudo cambiar la contraseña de la cuenta",
+            Action.CHANGE_PASSWORD
         )
-        soup = BeautifulSoup(response.text, "html5lib")
-        self.__find_errors(soup, Portal.USER, ChangePasswordException, "No se pudo cambiar la contraseña de la cuenta")
 
     def change_email_password(self, old_password: str, new_password: str):
         """
@@ -867,40 +1240,19 @@ class DefaultNautaScrapper(NautaScrapper):
         :raises TransferException: Si no se puede cambiar la contraseña de la cuenta de correo electrónico asociada.
         """
 
-        # Obtención del token csrf requerido para esta acción
-        response_get = self.__session.get(
-            Portal.USER,
-            self.__make_url(
-                Portal.USER,
-                Action.CHANGE_EMAIL_PASSWORD
-            )
-        )
-        soup = BeautifulSoup(response_get.text, "html5lib")
-        self.__find_errors(
-            soup, Portal.USER, TransferException,
-            "No se pudo cambiar la contraseña de la cuenta de correo electrónico asociada"
-        )
-        csrf = self.__get_csrf(soup)
-
-        # Intento de cambio de contraseña de la cuenta de correo electrónico asociada
-        response = self.__session.post(
-            Portal.USER,
-            self.__make_url(
-                Portal.USER,
-                Action.CHANGE_EMAIL_PASSWORD
-            ),
+        url = self._make_url(Portal.USER, Action.CHANGE_EMAIL_PASSWORD)
+        self.__post_with_csrf(
+            url,
+            url,
             {
-                "csrf": csrf,
                 "old_password": old_password,
                 "new_password": new_password,
                 "repeat_new_password": new_password,
                 "btn_submit": ""
-            }
-        )
-        soup = BeautifulSoup(response.text, "html5lib")
-        self.__find_errors(
-            soup, Portal.USER, TransferException,
-            "No se pudo cambiar la contraseña de la cuenta de correo electrónico asociada"
+            },
+            TransferException,
+            "No se pudo cambiar la contraseña de la cuenta de correo electrónico asociada",
+            Action.CHANGE_EMAIL_PASSWORD
         )
 
     def get_connections_summary(self, year: int, month: int) -> ConnectionsSummary:
@@ -912,16 +1264,8 @@ class DefaultNautaScrapper(NautaScrapper):
         :param month: Un entero que representa el mes.
         :return: Un objeto de tipo ConnectionsSummary que contiene un resumen de conexiones para el año y mes dados.
         """
-        summary_html = self.__get_summary_html_content(year, month, Action.GET_CONNECTIONS)
-        return ConnectionsSummary(
-            count=int(summary_html[0].select_one("input[name=count]").attrs["value"]),
-            year_month_selected=summary_html[0].select_one("input[name=year_month_selected]").attrs["value"],
-            total_time=time_string_to_seconds(summary_html[1].select_one('.card-stats-number').text.strip()),
-            total_import=str_to_float(summary_html[2].select_one('.card-stats-number').text.strip()),
-            uploaded=convert_to_bytes(summary_html[3].select_one('.card-stats-number').text.strip()),
-            downloaded=convert_to_bytes(summary_html[4].select_one('.card-stats-number').text.strip()),
-            total_traffic=convert_to_bytes(summary_html[5].select_one('.card-stats-number').text.strip())
-        )
+        summary_cells = self.__get_summary_cells(year, month, Action.GET_CONNECTIONS)
+        return self.__parse_summary(Action.GET_CONNECTIONS, summary_cells)
 
     def get_recharges_summary(self, year: int, month: int) -> RechargesSummary:
         """
@@ -932,12 +1276,8 @@ class DefaultNautaScrapper(NautaScrapper):
         :param month: Un entero que representa el mes.
         :return: Un objeto de tipo RechargesSummary que contiene un resumen de recargas para el año y mes dados.
         """
-        summary_html = self.__get_summary_html_content(year, month, Action.GET_RECHARGES)
-        return RechargesSummary(
-            count=int(summary_html[0].select_one("input[name=count]").attrs["value"]),
-            year_month_selected=summary_html[0].select_one("input[name=year_month_selected]").attrs["value"],
-            total_import=str_to_float(summary_html[1].select_one('.card-stats-number').text.strip())
-        )
+        summary_cells = self.__get_summary_cells(year, month, Action.GET_RECHARGES)
+        return self.__parse_summary(Action.GET_RECHARGES, summary_cells)
 
     def get_transfers_summary(self, year: int, month: int) -> TransfersSummary:
         """
@@ -948,12 +1288,8 @@ class DefaultNautaScrapper(NautaScrapper):
         :param month: Un entero que representa el mes.
         :return: Un objeto de tipo TransfersSummary que contiene un resumen de transferencias para el año y mes dados.
         """
-        summary_html = self.__get_summary_html_content(year, month, Action.GET_TRANSFERS)
-        return TransfersSummary(
-            count=int(summary_html[0].select_one("input[name=count]").attrs["value"]),
-            year_month_selected=summary_html[0].select_one("input[name=year_month_selected]").attrs["value"],
-            total_import=str_to_float(summary_html[1].select_one('.card-stats-number').text.strip())
-        )
+        summary_cells = self.__get_summary_cells(year, month, Action.GET_TRANSFERS)
+        return self.__parse_summary(Action.GET_TRANSFERS, summary_cells)
 
     def get_quotes_paid_summary(self, year: int, month: int) -> QuotesPaidSummary:
         """
@@ -965,12 +1301,8 @@ class DefaultNautaScrapper(NautaScrapper):
         :return: Un objeto de tipo QuotesPaidSummary que contiene un resumen de cotizaciones pagadas para el año y mes
         dados.
         """
-        summary_html = self.__get_summary_html_content(year, month, Action.GET_QUOTES_PAID)
-        return QuotesPaidSummary(
-            count=int(summary_html[0].select_one("input[name=count]").attrs["value"]),
-            year_month_selected=summary_html[0].select_one("input[name=year_month_selected]").attrs["value"],
-            total_import=str_to_float(summary_html[1].select_one('.card-stats-number').text.strip())
-        )
+        summary_cells = self.__get_summary_cells(year, month, Action.GET_QUOTES_PAID)
+        return self.__parse_summary(Action.GET_QUOTES_PAID, summary_cells)
 
     def get_connections(
             self, year: int, month: int, summary: ConnectionsSummary = None, large: int = 0, _reversed: bool = False
@@ -997,21 +1329,9 @@ class DefaultNautaScrapper(NautaScrapper):
         summary = self.get_connections_summary(year, month) if not summary else summary
         connections = []
         if summary.count != 0:
-            rows = self.__get_action_per_page_as_row_html(
+            connections = self.__get_action_per_page_as_models(
                 Action.GET_CONNECTIONS, summary.year_month_selected, summary.count, large, _reversed
             )
-            if rows:
-                for row in rows:
-                    connections.append(
-                        Connection(
-                            start_session=parse_datetime(row.select("td")[0].text.strip()),
-                            end_session=parse_datetime(row.select("td")[1].text.strip()),
-                            duration=time_string_to_seconds(row.select("td")[2].text.strip()),
-                            uploaded=convert_to_bytes(row.select("td")[3].text.strip()),
-                            downloaded=convert_to_bytes(row.select("td")[4].text.strip()),
-                            import_=str_to_float(row.select("td")[5].text.strip())
-                        )
-                    )
         return connections
 
     def get_recharges(
@@ -1036,19 +1356,9 @@ class DefaultNautaScrapper(NautaScrapper):
         summary = self.get_recharges_summary(year, month) if not summary else summary
         recharges = []
         if summary.count != 0:
-            rows = self.__get_action_per_page_as_row_html(
+            recharges = self.__get_action_per_page_as_models(
                 Action.GET_RECHARGES, summary.year_month_selected, summary.count, large, _reversed
             )
-            if rows:
-                for row in rows:
-                    recharges.append(
-                        Recharge(
-                            date=parse_datetime(row.select("td")[0].text.strip()),
-                            import_=str_to_float(row.select("td")[1].text.strip()),
-                            channel=row.select("td")[2].text.strip(),
-                            type_=row.select("td")[3].text.strip()
-                        )
-                    )
         return recharges
 
     def get_transfers(
@@ -1074,18 +1384,9 @@ class DefaultNautaScrapper(NautaScrapper):
         summary = self.get_transfers_summary(year, month) if not summary else summary
         transfers = []
         if summary.count != 0:
-            rows = self.__get_action_per_page_as_row_html(
+            transfers = self.__get_action_per_page_as_models(
                 Action.GET_TRANSFERS, summary.year_month_selected, summary.count, large, _reversed
             )
-            if rows:
-                for row in rows:
-                    transfers.append(
-                        Transfer(
-                            date=parse_datetime(row.select("td")[0].text.strip()),
-                            import_=str_to_float(row.select("td")[1].text.strip()),
-                            destiny_account=row.select("td")[2].text.strip()
-                        )
-                    )
         return transfers
 
     def get_quotes_paid(
@@ -1113,18 +1414,131 @@ class DefaultNautaScrapper(NautaScrapper):
         summary = self.get_quotes_paid_summary(year, month) if not summary else summary
         quotes_paid = []
         if summary.count != 0:
-            rows = self.__get_action_per_page_as_row_html(
+            quotes_paid = self.__get_action_per_page_as_models(
                 Action.GET_QUOTES_PAID, summary.year_month_selected, summary.count, large, _reversed
             )
-            if rows:
-                for row in rows:
-                    quotes_paid.append(
-                        QuotePaid(
-                            date=parse_datetime(row.select("td")[0].text.strip()),
-                            import_=str_to_float(row.select("td")[1].text.strip()),
-                            channel=row.select("td")[2].text.strip(),
-                            type_=row.select("td")[3].text.strip(),
-                            office=row.select("td")[4].text.strip()
-                        )
-                    )
         return quotes_paid
+
+    def get_connections_between(
+            self, start_date: datetime.date | datetime.datetime, end_date: datetime.date | datetime.datetime
+    ) -> list[Connection]:
+        """
+        Obtiene las conexiones a internet comprendidas entre dos fechas, ambas incluidas.
+
+        :param start_date: La fecha o fecha y hora de inicio. Si es una fecha, se incluye el día completo.
+        :param end_date: La fecha o fecha y hora de fin. Si es una fecha, se incluye el día completo.
+        :return: Una lista de objetos Connection en orden cronológico.
+        """
+        return self.__get_action_between(Action.GET_CONNECTIONS, start_date, end_date)
+
+    def get_recharges_between(
+            self, start_date: datetime.date | datetime.datetime, end_date: datetime.date | datetime.datetime
+    ) -> list[Recharge]:
+        """
+        Obtiene las recargas realizadas entre dos fechas, ambas incluidas.
+
+        :param start_date: La fecha o fecha y hora de inicio. Si es una fecha, se incluye el día completo.
+        :param end_date: La fecha o fecha y hora de fin. Si es una fecha, se incluye el día completo.
+        :return: Una lista de objetos Recharge en orden cronológico.
+        """
+        return self.__get_action_between(Action.GET_RECHARGES, start_date, end_date)
+
+    def get_transfers_between(
+            self, start_date: datetime.date | datetime.datetime, end_date: datetime.date | datetime.datetime
+    ) -> list[Transfer]:
+        """
+        Obtiene las transferencias realizadas entre dos fechas, ambas incluidas.
+
+        :param start_date: La fecha o fecha y hora de inicio. Si es una fecha, se incluye el día completo.
+        :param end_date: La fecha o fecha y hora de fin. Si es una fecha, se incluye el día completo.
+        :return: Una lista de objetos Transfer en orden cronológico.
+        """
+        return self.__get_action_between(Action.GET_TRANSFERS, start_date, end_date)
+
+    def get_quotes_paid_between(
+            self, start_date: datetime.date | datetime.datetime, end_date: datetime.date | datetime.datetime
+    ) -> list[QuotePaid]:
+        """
+        Obtiene las cotizaciones pagadas entre dos fechas, ambas incluidas.
+
+        :param start_date: La fecha o fecha y hora de inicio. Si es una fecha, se incluye el día completo.
+        :param end_date: La fecha o fecha y hora de fin. Si es una fecha, se incluye el día completo.
+        :return: Una lista de objetos QuotePaid en orden cronológico.
+        """
+        return self.__get_action_between(Action.GET_QUOTES_PAID, start_date, end_date)
+
+    def iter_connections(
+            self, year: int, month: int, summary: ConnectionsSummary = None, _reversed: bool = False
+    ) -> Iterator[Connection]:
+        """
+        Recorre las conexiones a internet de un año y mes específicos.
+
+        Cada página del listado se descarga solo cuando se han consumido las filas de la anterior, por lo que es
+        posible detener el recorrido sin descargar el resto.
+
+        :param year: El año del listado.
+        :param month: El mes del listado.
+        :param summary: Opcionalmente, el resumen del mes. Si no se especifica, se obtiene al comenzar el recorrido.
+        :param _reversed: Un booleano que indica si se recorren desde la más antigua. El valor predeterminado es False.
+        :return: Un iterador de objetos Connection.
+        """
+        summary = self.get_connections_summary(year, month) if not summary else summary
+        if summary.count != 0:
+            yield from self.__iter_action(Action.GET_CONNECTIONS, summary, _reversed)
+
+    def iter_recharges(
+            self, year: int, month: int, summary: RechargesSummary = None, _reversed: bool = False
+    ) -> Iterator[Recharge]:
+        """
+        Recorre las recargas de un año y mes específicos.
+
+        Cada página del listado se descarga solo cuando se han consumido las filas de la anterior, por lo que es
+        posible detener el recorrido sin descargar el resto.
+
+        :param year: El año del listado.
+        :param month: El mes del listado.
+        :param summary: Opcionalmente, el resumen del mes. Si no se especifica, se obtiene al comenzar el recorrido.
+        :param _reversed: Un booleano que indica si se recorren desde la más antigua. El valor predeterminado es False.
+        :return: Un iterador de objetos Recharge.
+        """
+        summary = self.get_recharges_summary(year, month) if not summary else summary
+        if summary.count != 0:
+            yield from self.__iter_action(Action.GET_RECHARGES, summary, _reversed)
+
+    def iter_transfers(
+            self, year: int, month: int, summary: TransfersSummary = None, _reversed: bool = False
+    ) -> Iterator[Transfer]:
+        """
+        Recorre las transferencias de un año y mes específicos.
+
+        Cada página del listado se descarga solo cuando se han consumido las filas de la anterior, por lo que es
+        posible detener el recorrido sin descargar el resto.
+
+        :param year: El año del listado.
+        :param month: El mes del listado.
+        :param summary: Opcionalmente, el resumen del mes. Si no se especifica, se obtiene al comenzar el recorrido.
+        :param _reversed: Un booleano que indica si se recorren desde la más antigua. El valor predeterminado es False.
+        :return: Un iterador de objetos Transfer.
+        """
+        summary = self.get_transfers_summary(year, month) if not summary else summary
+        if summary.count != 0:
+            yield from self.__iter_action(Action.GET_TRANSFERS, summary, _reversed)
+
+    def iter_quotes_paid(
+            self, year: int, month: int, summary: QuotesPaidSummary = None, _reversed: bool = False
+    ) -> Iterator[QuotePaid]:
+        """
+        Recorre las cotizaciones pagadas de un año y mes específicos.
+
+        Cada página del listado se descarga solo cuando se han consumido las filas de la anterior, por lo que es
+        posible detener el recorrido sin descargar el resto.
+
+        :param year: El año del listado.
+        :param month: El mes del listado.
+        :param summary: Opcionalmente, el resumen del mes. Si no se especifica, se obtiene al comenzar el recorrido.
+        :param _reversed: Un booleano que indica si se recorren desde la más antigua. El valor predeterminado es False.
+        :return: Un iterador de objetos QuotePaid.
+        """
+        summary = self.get_quotes_paid_summary(year, month) if not summary else summary
+        if summary.count != 0:
+            yield from self.__iter_action(Action.GET_QUOTES_PAID, summary, _reversed)
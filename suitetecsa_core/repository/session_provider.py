@@ -10,25 +10,335 @@
 #  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
 #  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
+import re
+import threading
+import time
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
 from copy import copy
+from dataclasses import dataclass
+from typing import Callable
+from urllib.parse import urlencode
 
 from requests import Response, Session
+from requests.adapters import HTTPAdapter
 from requests.utils import dict_from_cookiejar, cookiejar_from_dict
+from urllib3.response import HTTPResponse
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
-from suitetecsa_core import Portal
+from suitetecsa_core import Portal, Action
 from suitetecsa_core.core.exceptions import ConnectionException
 
+HOOK_EVENTS = ("before_request", "after_request", "parse")
+# Tamaño de los fragmentos en que se leen las respuestas que se analizan mientras se descargan
+STREAM_CHUNK_SIZE = 1024
+# Codificación de las páginas de cada portal, que se usa cuando la respuesta no la declara en Content-Type
+PORTAL_ENCODINGS = {Portal.CONNECT: "utf-8", Portal.USER: "utf-8"}
+# Codificaciones de transferencia (Content-Encoding) que `urllib3` sabe descomprimir con las dependencias instaladas
+DECODABLE_ENCODINGS = frozenset(HTTPResponse.CONTENT_DECODERS) | {"identity"}
 
-class NautaSession(metaclass=ABCMeta):
+_list_url_pattern = re.compile(r"/\d{4}-\d{2}/\d+(/\d+)?/?$")
+
+
+def _transport_retries(response: Response) -> int:
     """
-    Clase abstracta que define los métodos y propiedades necesarios para manejar una sesión en Nauta.
+    Devuelve cuántas veces reintentó `urllib3` la petición de una respuesta.
+    """
+    retries = getattr(getattr(response, "raw", None), "retries", None)
+    return len(retries.history) if isinstance(retries, Retry) else 0
+
+
+def check_content_encoding(response: Response) -> None:
+    """
+    Comprueba que `urllib3` puede descomprimir el cuerpo de una respuesta. Si no puede, por ejemplo, con 'br' sin el
+    paquete `brotli` instalado, lo entrega comprimido sin avisar y el scrapper analizaría bytes sin sentido.
+
+    :param response: La respuesta.
+    :raises ConnectionException: Si la respuesta usa una codificación que no está en `DECODABLE_ENCODINGS`.
+    """
+    content_encoding = response.headers.get("Content-Encoding")
+    if not isinstance(content_encoding, str):
+        return
+    encodings = (encoding.strip().lower() for encoding in content_encoding.split(","))
+    if any(encoding and encoding not in DECODABLE_ENCODINGS for encoding in encodings):
+        raise ConnectionException(f"Unsupported Content-Encoding: {content_encoding}")
+
+
+def _head_size(start_line: str, headers) -> int:
+    """
+    Tamaño de la línea inicial y las cabeceras de un mensaje HTTP/1.1, con sus fin de línea y la línea en blanco.
+    """
+    return len(start_line) + 2 + sum(len(name) + len(value) + 4 for name, value in headers.items()) + 2
+
+
+def _size(value) -> int:
+    return len(value) if isinstance(value, (str, bytes)) else 0
+
+
+def measure_traffic(response: Response) -> tuple[int, int, int]:
+    """
+    Estima los bytes que se enviaron y recibieron en la red para obtener una respuesta, incluidas las redirecciones
+    que se siguieron.
+
+    Cada mensaje cuenta su línea inicial, sus cabeceras y su cuerpo tal como viajó: el cuerpo recibido es el que
+    `urllib3` leyó del socket, comprimido si la respuesta lo estaba, y solo la parte leída si se dejó de leer antes
+    del final. No se cuentan TCP, TLS ni las cabeceras que añade `http.client`, como Host.
+
+    :param response: La respuesta, ya leída.
+    :return: Los bytes enviados, los bytes recibidos y el tamaño de los cuerpos recibidos ya descomprimidos.
+    """
+    sent = received = decoded = 0
+    for message in (*response.history, response):
+        request = message.request
+        if request is not None:
+            sent += _head_size(f"{request.method} {request.path_url} HTTP/1.1", request.headers) + _size(request.body)
+        received += _head_size(f"HTTP/1.1 {message.status_code} {message.reason}", message.headers)
+        wire_bytes = getattr(message.raw, "tell", None)
+        wire_bytes = wire_bytes() if wire_bytes is not None else None
+        content_size = _size(message.content)
+        received += wire_bytes if isinstance(wire_bytes, int) else content_size
+        decoded += content_size
+    return sent, received, decoded
+
+
+def read_until(response: Response, consume: Callable[[bytes], bool], chunk_size: int = STREAM_CHUNK_SIZE) -> None:
+    """
+    Lee el cuerpo de una respuesta pedida con `stream=True` por fragmentos, pasándoselos a `consume`, hasta que esta
+    devuelve True o se acaba el cuerpo, y cierra la respuesta.
+
+    Si se deja de leer antes del final, la conexión se cierra sin descargar el resto y no vuelve al pool. En los dos
+    casos, `response.content` contiene la parte del cuerpo que se leyó.
+
+    :param response: La respuesta.
+    :param consume: Una función que recibe cada fragmento y devuelve True cuando ya no necesita más.
+    :param chunk_size: El tamaño máximo de cada fragmento.
+    """
+    chunks = []
+    try:
+        for chunk in response.iter_content(chunk_size):
+            chunks.append(chunk)
+            if consume(chunk):
+                break
+    finally:
+        response._content = b"".join(chunks)
+        response._content_consumed = True
+        response.close()
+
+
+def url_template(url: str) -> str:
+    """
+    Devuelve la URL sin la cadena de consulta y con el mes, el total y la página de los listados sustituidos por
+    marcadores, de forma que todas las peticiones a una misma página del portal compartan la plantilla.
+
+    >>> url_template("https://www.portal.nauta.cu/useraaa/service_detail_list/2023-03/42/3")
+    'https://www.portal.nauta.cu/useraaa/service_detail_list/{year_month}/{count}/{page}'
+    >>> url_template("https://secure.etecsa.net:8443/LogoutServlet?CSRFHW=abc&username=user")
+    'https://secure.etecsa.net:8443/LogoutServlet'
+    """
+    url = url.split("?", 1)[0]
+    match = _list_url_pattern.search(url)
+    if match:
+        url = f"{url[:match.start()]}/{{year_month}}/{{count}}" + ("/{page}" if match.group(1) else "")
+    return url
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """
+    Configuración del transporte HTTP de uno de los portales.
+
+    :param pool_maxsize: Conexiones persistentes que se conservan por servidor. Es el número de peticiones simultáneas
+    a un mismo portal que pueden reutilizar una conexión.
+    :param pool_block: Si es True, cuando todas las conexiones del pool están en uso las peticiones esperan a que se
+    libere una en lugar de abrir una conexión adicional que se cierra al terminar.
+    :param connect_timeout: Segundos de espera para establecer la conexión.
+    :param read_timeout: Segundos de espera entre dos fragmentos de la respuesta.
+    :param retries: Reintentos de las peticiones GET y HEAD que fallan al conectar, al leer la respuesta o con uno de
+    los códigos de `retry_statuses`. Las peticiones POST no se reintentan, ya que no son idempotentes (recargas,
+    transferencias, inicio de sesión).
+    :param backoff_factor: Los reintentos esperan `backoff_factor * 2 ** (reintento - 1)` segundos.
+    :param retry_statuses: Códigos de estado que provocan un reintento.
+    """
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    connect_timeout: float = 10.0
+    read_timeout: float = 60.0
+    retries: int = 2
+    backoff_factor: float = 0.5
+    retry_statuses: tuple[int, ...] = (502, 503, 504)
+
+    @property
+    def timeout(self) -> tuple[float, float]:
+        return self.connect_timeout, self.read_timeout
+
+    def make_adapter(self) -> "PortalAdapter":
+        return PortalAdapter(
+            timeout=self.timeout,
+            pool_connections=1,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=Retry(
+                total=self.retries, backoff_factor=self.backoff_factor, status_forcelist=self.retry_statuses,
+                allowed_methods=frozenset({"GET", "HEAD"}), raise_on_status=False
+            )
+        )
+
+
+class PortalAdapter(HTTPAdapter):
+    """
+    `HTTPAdapter` con un tiempo de espera por defecto para las peticiones que no lo especifican.
+    """
+
+    def __init__(self, timeout: float | tuple[float, float] = None, **kwargs) -> None:
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        return super().send(request, timeout=self.timeout if timeout is None else timeout, **kwargs)
+
+
+@dataclass(slots=True)
+class RequestEvent:
+    """
+    Datos de una petición a uno de los portales, que reciben los hooks `before_request` y `after_request`.
+
+    Los hooks `before_request` reciben el evento antes de enviar la petición, solo con el portal, el método, la URL,
+    la acción y los reintentos. Los hooks `after_request` reciben el mismo objeto completo, también cuando la petición
+    falla, con la excepción en `exception` (incluida la `ConnectionException` de una respuesta con error).
+    `bytes_sent` es el tamaño del formulario enviado y `bytes_received` el del cuerpo de la respuesta ya
+    descomprimido; ninguno incluye las cabeceras. `retries` suma los intentos anteriores indicados por quien hace la
+    petición y los reintentos automáticos del transporte.
+    """
+    portal: Portal
+    method: str
+    url: str
+    action: Action | None = None
+    retries: int = 0
+    status_code: int | None = None
+    elapsed: float = 0.0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    exception: BaseException | None = None
+
+    @property
+    def url_template(self) -> str:
+        return url_template(self.url)
+
+
+@dataclass(slots=True)
+class Traffic:
+    """
+    Tráfico acumulado de las peticiones de una acción, estimado con `measure_traffic`.
+
+    `sent` y `received` son los bytes que viajaron por la red, con las cabeceras y los cuerpos comprimidos.
+    `decoded` es el tamaño de los cuerpos recibidos ya descomprimidos: si es mayor que `received`, la compresión está
+    funcionando.
+    """
+    requests: int = 0
+    sent: int = 0
+    received: int = 0
+    decoded: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.sent + self.received
+
+
+@dataclass(slots=True)
+class ParseEvent:
+    """
+    Datos del análisis de una respuesta, que reciben los hooks `parse` una vez por respuesta. `items` es el número de
+    filas obtenidas, si el resultado es una lista, y `exception` la excepción lanzada, por ejemplo, cuando la página
+    contiene un error del portal.
+    """
+    portal: Portal
+    action: Action | None
+    elapsed: float
+    items: int | None = None
+    exception: BaseException | None = None
+
+
+class CsrfTokenCache:
+    """
+    Cache de tokens CSRF del portal de usuario, indexados por la URL de la página de la que se obtuvieron.
+
+    Cada token se considera válido durante `max_age` segundos desde que se obtuvo, o hasta que se invalida porque el
+    portal lo rechazó. Los contadores `hits`, `misses` e `invalidations` permiten saber cuántas peticiones GET se
+    ahorraron.
+    """
+
+    def __init__(self, max_age: float = 600) -> None:
+        """
+        Constructor de la clase.
+
+        :param max_age: Segundos durante los que un token se considera válido.
+        """
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.__tokens: dict[str, tuple[str, float]] = {}
+        self.__lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        """
+        Devuelve el token asociado a `key` si existe y sigue siendo válido.
+
+        :param key: La URL de la página de la que se obtuvo el token.
+        :return: El token o None si no hay un token válido.
+        """
+        with self.__lock:
+            token, fetched_at = self.__tokens.get(key, (None, 0.0))
+            if token is not None and time.monotonic() - fetched_at < self.max_age:
+                self.hits += 1
+                return token
+            self.__tokens.pop(key, None)
+            self.misses += 1
+            return None
+
+    def set(self, key: str, token: str) -> None:
+        with self.__lock:
+            self.__tokens[key] = (token, time.monotonic())
+
+    def invalidate(self, key: str = None) -> None:
+        """
+        Invalida el token asociado a `key` o, si no se especifica, todos los tokens.
+        """
+        with self.__lock:
+            if key is None:
+                self.invalidations += len(self.__tokens)
+                self.__tokens.clear()
+            elif self.__tokens.pop(key, None) is not None:
+                self.invalidations += 1
+
+    @property
+    def saved_requests(self) -> int:
+        """
+        Número de peticiones GET que se evitaron reutilizando un token.
+        """
+        return self.hits
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "saved_requests": self.saved_requests
+        }
+
+
+class BaseNautaSession:
+    """
+    Clase base con el estado de una sesión en Nauta, compartida por las sesiones síncronas y asíncronas.
     """
 
     _headers = {
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,'
                   'image/avif,image/webp,image/apng,*/*;q=0.8',
-        'Accept-Encoding': 'gzip, deflate, br',
+        # Solo las codificaciones que `urllib3` puede descomprimir: 'br' y 'zstd' si sus paquetes están instalados
+        'Accept-Encoding': ACCEPT_ENCODING,
         'Accept-Language': 'es-419,es;q=0.6',
         'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) '
                       'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36',
@@ -41,6 +351,129 @@ class NautaSession(metaclass=ABCMeta):
     _wlan_user_ip: str = None
     _csrf_hw: str = None
     _attribute_uuid: str = None
+    _csrf_cache: CsrfTokenCache = None
+    _hooks: dict[str, list[Callable]] = None
+
+    @staticmethod
+    def parse_response(response: Response) -> None:
+        if not response.ok:
+            raise ConnectionException(
+                f"{response.status_code} :: {response.reason}"
+            )
+
+    @staticmethod
+    def set_encoding(portal_manager: Portal, response: Response) -> None:
+        """
+        Fija la codificación de una respuesta: la declarada en su cabecera Content-Type o, si no declara ninguna, la
+        del portal en `PORTAL_ENCODINGS`. Así `requests` no tiene que adivinarla analizando el cuerpo y el scrapper
+        puede decodificar `response.content` directamente.
+
+        :param portal_manager: El portal al que se hizo la petición.
+        :param response: La respuesta.
+        """
+        if "charset=" not in (response.headers.get("Content-Type") or "").lower():
+            response.encoding = PORTAL_ENCODINGS[portal_manager]
+
+    @property
+    def is_logged_in(self):
+        return self._attribute_uuid is not None
+
+    @property
+    def is_user_logged_in(self) -> bool:
+        return self._username is not None
+
+    @property
+    def wlan_user_ip(self):
+        return self._wlan_user_ip
+
+    @property
+    def csrf_hw(self):
+        return self._csrf_hw
+
+    @property
+    def username(self):
+        return self._username
+
+    @property
+    def attribute_uuid(self):
+        return self._attribute_uuid
+
+    @property
+    def csrf(self):
+        return self._csrf
+
+    @csrf.setter
+    def csrf(self, value):
+        self._csrf = value
+
+    @property
+    def login_action(self):
+        return self._login_action
+
+    @property
+    def csrf_cache(self) -> CsrfTokenCache:
+        """
+        Cache de tokens CSRF de esta sesión.
+        """
+        if self._csrf_cache is None:
+            self._csrf_cache = CsrfTokenCache()
+        return self._csrf_cache
+
+    @staticmethod
+    def is_csrf_rejected(response: Response) -> bool:
+        """
+        Indica si el portal de usuario rechazó una petición por un token CSRF inválido o caducado.
+        """
+        return response.status_code == 403
+
+    @property
+    def hooks(self) -> dict[str, list[Callable]]:
+        """
+        Los hooks registrados en la sesión, indexados por evento (`HOOK_EVENTS`).
+        """
+        if self._hooks is None:
+            self._hooks = {event: [] for event in HOOK_EVENTS}
+        return self._hooks
+
+    def register_hook(self, event: str, hook: Callable) -> None:
+        """
+        Registra una función que se llamará en cada evento `event` con un `RequestEvent` (`before_request` y
+        `after_request`) o un `ParseEvent` (`parse`).
+
+        Los hooks se llaman en el hilo que realiza la petición, así que deben ser rápidos y, si la sesión se comparte
+        entre hilos, seguros ante llamadas concurrentes. Mientras no haya ninguno registrado, las peticiones no crean
+        eventos ni miden tiempos.
+
+        :raises ValueError: Si `event` no es uno de `HOOK_EVENTS`.
+        """
+        if event not in HOOK_EVENTS:
+            raise ValueError(f"Unsupported hook event: {event}")
+        self.hooks[event].append(hook)
+
+    def deregister_hook(self, event: str, hook: Callable) -> bool:
+        """
+        Elimina un hook registrado con `register_hook`.
+
+        :return: True si el hook estaba registrado.
+        """
+        try:
+            self.hooks[event].remove(hook)
+            return True
+        except (KeyError, ValueError):
+            return False
+
+    def has_hooks(self, event: str) -> bool:
+        return self._hooks is not None and bool(self._hooks[event])
+
+    def dispatch_hook(self, event: str, data: RequestEvent | ParseEvent) -> None:
+        for hook in self._hooks[event]:
+            hook(data)
+
+
+class NautaSession(BaseNautaSession, metaclass=ABCMeta):
+    """
+    Clase abstracta que define los métodos y propiedades necesarios para manejar una sesión en Nauta.
+    """
 
     @property
     @abstractmethod
@@ -83,7 +516,10 @@ class NautaSession(metaclass=ABCMeta):
         pass
 
     @abstractmethod
-    def get(self, portal_manager: Portal, url: str, data: dict = None, parse_response: bool = True) -> Response:
+    def get(
+            self, portal_manager: Portal, url: str, data: dict = None, parse_response: bool = True,
+            action: Action = None, retries: int = 0, consume: Callable[[bytes], bool] = None
+    ) -> Response:
         """
         Realiza una petición HTTP GET a la URL especificada, utilizando la sesión de usuario o de conexión según 
         corresponda.
@@ -92,12 +528,19 @@ class NautaSession(metaclass=ABCMeta):
         :param portal_manager: Un objeto `Portal` que indica si se debe usar la sesión de usuario o de conexión.
         :param url: La URL a la que se hará la petición.
         :param data: Opcionalmente, los datos que se enviarán con la petición.
+        :param action: Opcionalmente, la acción a la que corresponde la petición, para los hooks.
+        :param retries: El número de intentos anteriores de la misma petición, para los hooks.
+        :param consume: Opcionalmente, una función a la que se pasa el cuerpo de la respuesta por fragmentos a medida
+        que se descarga, y que devuelve True cuando ya no necesita más (ver `read_until`).
         :return: Un objeto `Response` con la respuesta a la petición.
         """
         pass
 
     @abstractmethod
-    def post(self, portal_manager: Portal, url: str, data: dict = None, parse_response: bool = True) -> Response:
+    def post(
+            self, portal_manager: Portal, url: str, data: dict = None, parse_response: bool = True,
+            action: Action = None, retries: int = 0, consume: Callable[[bytes], bool] = None
+    ) -> Response:
         """
         Realiza una petición HTTP POST a la URL especificada, utilizando la sesión de usuario o de conexión según
         corresponda.
@@ -106,68 +549,126 @@ class NautaSession(metaclass=ABCMeta):
         :param portal_manager: Un objeto `Portal` que indica si se debe usar la sesión de usuario o de conexión.
         :param url: La URL a la que se hará la petición.
         :param data: Opcionalmente, los datos que se enviarán con la petición.
+        :param action: Opcionalmente, la acción a la que corresponde la petición, para los hooks.
+        :param retries: El número de intentos anteriores de la misma petición, para los hooks.
+        :param consume: Opcionalmente, una función a la que se pasa el cuerpo de la respuesta por fragmentos a medida
+        que se descarga, y que devuelve True cuando ya no necesita más (ver `read_until`).
         :return: Un objeto `Response` con la respuesta a la petición.
         """
         pass
 
-    @staticmethod
-    def parse_response(response: Response) -> None:
-        if not response.ok:
-            raise ConnectionException(
-                f"{response.status_code} :: {response.reason}"
-            )
-
-    @property
-    def is_logged_in(self):
-        return self._attribute_uuid is not None
-
-    @property
-    def is_user_logged_in(self) -> bool:
-        return self._username is not None
-
-    @property
-    def wlan_user_ip(self):
-        return self._wlan_user_ip
-
-    @property
-    def csrf_hw(self):
-        return self._csrf_hw
-
-    @property
-    def username(self):
-        return self._username
-
-    @property
-    def attribute_uuid(self):
-        return self._attribute_uuid
-
-    @property
-    def csrf(self):
-        return self._csrf
-
-    @csrf.setter
-    def csrf(self, value):
-        self._csrf = value
+    @abstractmethod
+    def head(
+            self, portal_manager: Portal, url: str, parse_response: bool = True, action: Action = None, retries: int = 0
+    ) -> Response:
+        """
+        Realiza una petición HTTP HEAD a la URL especificada, sin seguir las redirecciones, utilizando la sesión de
+        usuario o de conexión según corresponda.
 
-    @property
-    def login_action(self):
-        return self._login_action
+        :param parse_response:
+        :param portal_manager: Un objeto `Portal` que indica si se debe usar la sesión de usuario o de conexión.
+        :param url: La URL a la que se hará la petición.
+        :param action: Opcionalmente, la acción a la que corresponde la petición, para los hooks.
+        :param retries: El número de intentos anteriores de la misma petición, para los hooks.
+        :return: Un objeto `Response` con la respuesta a la petición.
+        """
+        pass
 
 
 class DefaultNautaSession(NautaSession):
     """
     Implementación concreta de `NautaSession` que maneja la sesión del usuario y la sesión de conexión.
+
+    Cada portal tiene su propio transporte, configurado con un `TransportConfig`: un pool de conexiones persistentes
+    independiente, tiempos de espera de conexión y de lectura y reintentos con espera exponencial de las peticiones
+    GET. Las dos sesiones comparten las cookies.
+
+    Una misma sesión puede usarse desde varios hilos, por ejemplo, con `DefaultNautaScrapper(max_workers=N)` o con
+    varios scrappers sobre la misma sesión: los pools de `urllib3`, el almacén de cookies y la cache de tokens CSRF
+    admiten accesos concurrentes. Hasta `pool_maxsize` peticiones simultáneas a un portal reutilizan conexiones; las
+    demás abren una conexión nueva que se descarta al terminar o, con `pool_block=True`, esperan a que se libere una.
+    El estado de la sesión (usuario, token CSRF, datos de la conexión) es único, así que los hilos que compartan una
+    sesión deben operar sobre la misma cuenta; para varias cuentas, use una sesión por cuenta.
+
+    Con `count_traffic`, la sesión lleva la cuenta de los bytes que envía y recibe, por acción (`traffic`) y en total
+    (`bytes_total`), de forma que el consumo del propio SDK, que en Nauta se factura, pueda medirse. Sin ella, las
+    peticiones no miden nada.
     """
 
-    def __init__(self, session: Session) -> None:
+    def __init__(
+            self, session: Session, transports: dict[Portal, TransportConfig] = None, count_traffic: bool = False
+    ) -> None:
         """
         Constructor de la clase.
 
         :param session: Una sesión de `requests.Session`.
+        :param transports: Opcionalmente, la configuración del transporte de cada portal. Los portales que no
+        aparecen usan un `TransportConfig` con los valores por defecto.
+        :param count_traffic: Si es True, se acumula el tráfico de cada petición en `traffic`. Puede cambiarse después
+        con el atributo del mismo nombre.
         """
         self.__user_session = session
         self.__user_session.headers = self._headers
         self.__connect_session = copy(session)
+        # La copia comparte las cookies pero no los adaptadores, de modo que cada portal tiene su propio pool
+        self.__connect_session.adapters = OrderedDict()
+        self.__transports = {portal: (transports or {}).get(portal, TransportConfig()) for portal in Portal}
+        for portal, http_session in ((Portal.USER, self.__user_session), (Portal.CONNECT, self.__connect_session)):
+            for prefix in ("https://", "http://"):
+                http_session.mount(prefix, self.__transports[portal].make_adapter())
+        self.count_traffic = count_traffic
+        self.__traffic: dict[Action | None, Traffic] = {}
+        self.__traffic_lock = threading.Lock()
+
+    def transport(self, portal_manager: Portal) -> TransportConfig:
+        """
+        Devuelve la configuración del transporte de un portal.
+        """
+        return self.__transports[portal_manager]
+
+    def close(self) -> None:
+        """
+        Cierra las conexiones persistentes de los dos portales.
+        """
+        self.__user_session.close()
+        self.__connect_session.close()
+
+    @property
+    def traffic(self) -> dict[Action | None, Traffic]:
+        """
+        Una copia del tráfico acumulado de cada acción desde que se creó la sesión o desde el último `reset_traffic`.
+        Las peticiones que se hicieron sin indicar la acción se acumulan en la clave None. Solo se cuentan las
+        peticiones hechas con `count_traffic` activado.
+        """
+        with self.__traffic_lock:
+            return {action: copy(traffic) for action, traffic in self.__traffic.items()}
+
+    @property
+    def bytes_total(self) -> int:
+        """
+        Bytes enviados y recibidos por la sesión, en todas las acciones.
+        """
+        with self.__traffic_lock:
+            return sum(traffic.total for traffic in self.__traffic.values())
+
+    def reset_traffic(self) -> dict[Action | None, Traffic]:
+        """
+        Pone a cero el tráfico acumulado.
+
+        :return: El tráfico acumulado hasta ahora.
+        """
+        with self.__traffic_lock:
+            traffic, self.__traffic = self.__traffic, {}
+        return traffic
+
+    def __count_traffic(self, action: Action | None, response: Response) -> None:
+        sent, received, decoded = measure_traffic(response)
+        with self.__traffic_lock:
+            traffic = self.__traffic.setdefault(action, Traffic())
+            traffic.requests += 1
+            traffic.sent += sent
+            traffic.received += received
+            traffic.decoded += decoded
 
     @property
     def user_cookies(self) -> dict:
@@ -205,7 +706,71 @@ class DefaultNautaSession(NautaSession):
         """
         self.__connect_session.cookies = cookiejar_from_dict(value)
 
-    def get(self, portal_manager: Portal, url: str, data: dict = None, parse_response: bool = True) -> Response:
+    def __request(
+            self, method: str, portal_manager: Portal, url: str, data: dict, parse_response: bool, action: Action,
+            retries: int, consume: Callable[[bytes], bool]
+    ) -> Response:
+        session = self.__user_session if portal_manager == Portal.USER else self.__connect_session
+        send = getattr(session, method.lower())
+        if self._hooks is not None and (self._hooks["before_request"] or self._hooks["after_request"]):
+            return self.__instrumented_request(
+                send, method, portal_manager, url, data, parse_response, action, retries, consume
+            )
+        response = self.__send(send, portal_manager, url, data, action, consume)
+        if parse_response:
+            NautaSession.parse_response(response)
+        return response
+
+    def __send(
+            self, send: Callable, portal_manager: Portal, url: str, data: dict, action: Action,
+            consume: Callable[[bytes], bool]
+    ) -> Response:
+        response = send(url, data=data) if consume is None else send(url, data=data, stream=True)
+        try:
+            check_content_encoding(response)
+            NautaSession.set_encoding(portal_manager, response)
+            if consume is not None:
+                read_until(response, consume)
+        except ConnectionException:
+            if consume is not None and not response._content_consumed:
+                # No se descarga un cuerpo que no se podría leer
+                response._content, response._content_consumed = b"", True
+                response.close()
+            raise
+        finally:
+            if self.count_traffic:
+                self.__count_traffic(action, response)
+        return response
+
+    def __instrumented_request(
+            self, send: Callable, method: str, portal_manager: Portal, url: str, data: dict, parse_response: bool,
+            action: Action, retries: int, consume: Callable[[bytes], bool]
+    ) -> Response:
+        event = RequestEvent(
+            portal_manager, method, url, action, retries, bytes_sent=len(urlencode(data, doseq=True)) if data else 0
+        )
+        self.dispatch_hook("before_request", event)
+        start = time.perf_counter()
+        try:
+            response = self.__send(send, portal_manager, url, data, action, consume)
+            event.elapsed = time.perf_counter() - start
+            event.status_code = response.status_code
+            event.bytes_received = len(response.content)
+            event.retries += _transport_retries(response)
+            if parse_response:
+                NautaSession.parse_response(response)
+        except Exception as e:
+            event.elapsed = event.elapsed or time.perf_counter() - start
+            event.exception = e
+            raise
+        finally:
+            self.dispatch_hook("after_request", event)
+        return response
+
+    def get(
+            self, portal_manager: Portal, url: str, data: dict = None, parse_response: bool = True,
+            action: Action = None, retries: int = 0, consume: Callable[[bytes], bool] = None
+    ) -> Response:
         """
         Realiza una petición HTTP GET a la URL especificada, utilizando la sesión de usuario o de conexión según
         corresponda.
@@ -214,16 +779,18 @@ class DefaultNautaSession(NautaSession):
         :param portal_manager: Un objeto `Portal` que indica si se debe usar la sesión de usuario o de conexión.
         :param url: La URL a la que se hará la petición.
         :param data: Opcionalmente, los datos que se enviarán con la petición.
+        :param action: Opcionalmente, la acción a la que corresponde la petición, para los hooks.
+        :param retries: El número de intentos anteriores de la misma petición, para los hooks.
+        :param consume: Opcionalmente, una función a la que se pasa el cuerpo de la respuesta por fragmentos a medida
+        que se descarga, y que devuelve True cuando ya no necesita más (ver `read_until`).
         :return: Un objeto `Response` con la respuesta a la petición.
         """
-        response = self.__user_session.get(url,
-                                           data=data) if portal_manager == Portal.USER else self.__connect_session.get(
-            url, data=data)
-        if parse_response:
-            NautaSession.parse_response(response)
-        return response
+        return self.__request("GET", portal_manager, url, data, parse_response, action, retries, consume)
 
-    def post(self, portal_manager: Portal, url: str, data: dict = None, parse_response: bool = True) -> Response:
+    def post(
+            self, portal_manager: Portal, url: str, data: dict = None, parse_response: bool = True,
+            action: Action = None, retries: int = 0, consume: Callable[[bytes], bool] = None
+    ) -> Response:
         """
         Realiza una petición HTTP POST a la URL especificada, utilizando la sesión de usuario o de conexión según
         corresponda.
@@ -232,16 +799,26 @@ class DefaultNautaSession(NautaSession):
         :param portal_manager: Un objeto `Portal` que indica si se debe usar la sesión de usuario o de conexión.
         :param url: La URL a la que se hará la petición.
         :param data: Opcionalmente, los datos que se enviarán con la petición.
+        :param action: Opcionalmente, la acción a la que corresponde la petición, para los hooks.
+        :param retries: El número de intentos anteriores de la misma petición, para los hooks.
+        :param consume: Opcionalmente, una función a la que se pasa el cuerpo de la respuesta por fragmentos a medida
+        que se descarga, y que devuelve True cuando ya no necesita más (ver `read_until`).
         :return: Un objeto `Response` con la respuesta a la petición.
         """
-        response = self.__user_session.post(
-            url,
-            data=data
-        ) if portal_manager == Portal.USER else self.__connect_session.post(
-            url, data=data
-        )
+        return self.__request("POST", portal_manager, url, data, parse_response, action, retries, consume)
 
-        if parse_response:
-            NautaSession.parse_response(response)
+    def head(
+            self, portal_manager: Portal, url: str, parse_response: bool = True, action: Action = None, retries: int = 0
+    ) -> Response:
+        """
+        Realiza una petición HTTP HEAD a la URL especificada, sin seguir las redirecciones, utilizando la sesión de
+        usuario o de conexión según corresponda.
 
-        return response
+        :param parse_response:
+        :param portal_manager: Un objeto `Portal` que indica si se debe usar la sesión de usuario o de conexión.
+        :param url: La URL a la que se hará la petición.
+        :param action: Opcionalmente, la acción a la que corresponde la petición, para los hooks.
+        :param retries: El número de intentos anteriores de la misma petición, para los hooks.
+        :return: Un objeto `Response` con la respuesta a la petición.
+        """
+        return self.__request("HEAD", portal_manager, url, None, parse_response, action, retries, None)
@@ -0,0 +1,280 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import calendar
+import datetime
+import math
+import random
+from html import escape
+
+from suitetecsa_core import Action, Portal
+from suitetecsa_core.domain.model import Connection, ConnectionsSummary, QuotePaid, QuotesPaidSummary, Recharge, \
+    RechargesSummary, Transfer, TransfersSummary
+from suitetecsa_core.repository.scrapper_provider import BaseNautaScrapper
+from suitetecsa_core.utils.nauta import convert_to_bytes, seconds_to_time_string, str_to_float, \
+    time_string_to_seconds, to_string_datetime
+
+HISTORY_ACTIONS = (Action.GET_CONNECTIONS, Action.GET_RECHARGES, Action.GET_TRANSFERS, Action.GET_QUOTES_PAID)
+
+_models = {
+    Action.GET_CONNECTIONS: Connection,
+    Action.GET_RECHARGES: Recharge,
+    Action.GET_TRANSFERS: Transfer,
+    Action.GET_QUOTES_PAID: QuotePaid
+}
+_summaries = {
+    Action.GET_RECHARGES: RechargesSummary,
+    Action.GET_TRANSFERS: TransfersSummary,
+    Action.GET_QUOTES_PAID: QuotesPaidSummary
+}
+_headers = {
+    Action.GET_CONNECTIONS: ("Inicio de sesión", "Fin de sesión", "Tiempo consumido", "Subida", "Descarga", "Importe"),
+    Action.GET_RECHARGES: ("Fecha", "Importe", "Canal", "Tipo"),
+    Action.GET_TRANSFERS: ("Fecha", "Importe", "Cuenta destino"),
+    Action.GET_QUOTES_PAID: ("Fecha", "Importe", "Canal", "Oficina", "Tipo")
+}
+# Título e icono de la primera tarjeta del resumen de cada listado
+_count_cards = {
+    Action.GET_CONNECTIONS: ("Conexiones", "mdi-device-signal-wifi-1-bar"),
+    Action.GET_RECHARGES: ("Recargas", "mdi-action-trending-up"),
+    Action.GET_TRANSFERS: ("Transferencias", "mdi-action-swap-vert"),
+    Action.GET_QUOTES_PAID: ("Pagos realizados", "mdi-action-swap-vert")
+}
+_recharge_channels = (("PV ETECSA", "Efectivo"), ("Transfermóvil", "Efectivo"), ("EnZona", "Efectivo"),
+                      ("Oficina Comercial", "Tarjeta"))
+_quote_paid_channels = (("Oficina Comercial", "PV Sala de Navegación MTC"), ("Transfermóvil", "Transfermóvil"),
+                        ("EnZona", "EnZona"))
+_byte_units = ("bytes", "KB", "MB", "GB", "TB")
+
+_csrf_html = '<input name="csrf" type="hidden" value="{}" />'
+_card_html = """        <div class="col s12 m6 l4">
+            <div class="card">
+                <div class="card-content {color} white-text">
+                    <div class="card-stats-title"><i class="{icon} small"></i> {title}</div>
+                    <h5 class="card-stats-number">{value}</h5>{inputs}
+                </div>
+            </div>
+        </div>
+"""
+_count_inputs = """
+                    <input name="count" type="hidden" value="{count}" />
+                    <input name="year_month_selected" type="hidden" value="{year_month}" />"""
+_table_html = """<table cellpadding="3" cellspacing="0" class="striped bordered highlight responsive-table" \
+style="width:100%">
+    <thead>
+        <tr>
+{headers}
+        </tr>
+    </thead>
+
+    <tbody>
+{rows}
+    </tbody>
+</table>"""
+
+
+def format_money(cents: int) -> str:
+    """
+    Convierte una cantidad de centavos en un importe con el formato del portal, por ejemplo, '$46,52'.
+    """
+    return f"${cents // 100},{cents % 100:02d}"
+
+
+def format_bytes(size: int) -> str:
+    """
+    Convierte una cantidad de bytes en un tamaño con el formato del portal, por ejemplo, '16,63 MB'.
+    """
+    unit = 0
+    value = float(size)
+    while value >= 1024 and unit < len(_byte_units) - 1:
+        value /= 1024
+        unit += 1
+    return f"{value:.2f}".replace(".", ",") + f" {_byte_units[unit]}"
+
+
+class SyntheticHistory:
+    """
+    Generador de las páginas del historial de un mes del portal de usuario, con el número de filas que se quiera.
+
+    Produce el resumen (`*_detail_summary`) y las páginas del listado (`*_detail_list/{aaaa-mm}/{count}/{page}`) de
+    conexiones, recargas, transferencias y pagos de cuota, con el mismo marcado que el portal real y las filas de la
+    más reciente a la más antigua, 14 por página. Las filas se generan a partir de `seed`, así que dos instancias con
+    los mismos argumentos producen exactamente las mismas páginas.
+    """
+
+    def __init__(self, year: int, month: int, counts: dict[Action, int] | int = 0, seed: int = 0) -> None:
+        """
+        Constructor de la clase.
+
+        :param year: El año del historial.
+        :param month: El mes del historial.
+        :param counts: El número de filas de cada listado, o un entero con el número de filas de todos ellos.
+        :param seed: La semilla del generador de filas.
+        """
+        self.year = year
+        self.month = month
+        self.seed = seed
+        self.counts = dict.fromkeys(HISTORY_ACTIONS, counts) if isinstance(counts, int) else {
+            action: counts.get(action, 0) for action in HISTORY_ACTIONS
+        }
+        self.__rows: dict[Action, list[tuple[str, ...]]] = {}
+
+    @property
+    def year_month(self) -> str:
+        return f"{self.year}-{self.month:02d}"
+
+    @property
+    def pages(self) -> dict[Action, int]:
+        """
+        Número de páginas del listado de cada acción.
+        """
+        return {
+            action: math.ceil(count / BaseNautaScrapper._rows_per_page) for action, count in self.counts.items()
+        }
+
+    def rows(self, action: Action) -> list[tuple[str, ...]]:
+        """
+        Devuelve las filas del listado de la acción, como tuplas con el texto de cada celda, de la más reciente a la
+        más antigua.
+        """
+        if action not in self.__rows:
+            self.__rows[action] = self.__generate_rows(action)
+        return self.__rows[action]
+
+    def expected(self, action: Action) -> list:
+        """
+        Devuelve los modelos que corresponden a las filas del listado de la acción, en el orden del portal.
+        """
+        return [_models[action].from_cells(cells) for cells in self.rows(action)]
+
+    def expected_summary(self, action: Action):
+        """
+        Devuelve el resumen que corresponde al listado de la acción.
+        """
+        cards = self.__summary_cards(action)
+        count, year_month = self.counts[action], self.year_month
+        if action == Action.GET_CONNECTIONS:
+            return ConnectionsSummary(
+                count, year_month, time_string_to_seconds(cards[1][2]), str_to_float(cards[2][2]),
+                convert_to_bytes(cards[3][2]), convert_to_bytes(cards[4][2]), convert_to_bytes(cards[5][2])
+            )
+        return _summaries[action](count, year_month, str_to_float(cards[1][2]))
+
+    def summary_html(self, action: Action) -> str:
+        """
+        Devuelve el HTML del resumen del listado de la acción.
+        """
+        cards = "".join(
+            _card_html.format(
+                color=color, icon=icon, title=title, value=value,
+                inputs=_count_inputs.format(count=self.counts[action], year_month=self.year_month) if not index else ""
+            ) for index, (title, icon, value, color) in enumerate(self.__summary_cards(action))
+        )
+        return f'<div class="container" id="content">\n    <div class="row">\n{cards}    </div>\n</div>'
+
+    def list_html(self, action: Action, page: int = 1) -> str:
+        """
+        Devuelve el HTML de una página del listado de la acción.
+
+        :param action: La acción del listado.
+        :param page: El número de la página, empezando por 1.
+        """
+        rows_per_page = BaseNautaScrapper._rows_per_page
+        rows = self.rows(action)[(page - 1) * rows_per_page:page * rows_per_page]
+        return _table_html.format(
+            headers="\n".join(f"            <th>{escape(header)}</th>" for header in _headers[action]),
+            rows="".join(
+                "        <tr>\n" + "".join(f"            <td>{escape(cell)}</td>\n" for cell in cells) +
+                "        </tr>\n" for cells in rows
+            )
+        )
+
+    def list_path(self, action: Action, page: int = 1) -> str:
+        """
+        Devuelve la ruta, relativa a la dirección del portal de usuario, de una página del listado de la acción. La
+        primera página no lleva el número de página, igual que en el portal.
+        """
+        list_url = BaseNautaScrapper._portals_urls[Portal.USER][action]["list"]
+        path = f"{list_url}{self.year_month}/{self.counts[action]}"
+        return path if page == 1 else f"{path}/{page}"
+
+    def routes(self, base_url: str = None, csrf: str = "security0000000000000") -> tuple[dict, dict]:
+        """
+        Devuelve las páginas del historial indexadas por su URL, separadas por método.
+
+        :param base_url: La dirección del portal de usuario. Si no se especifica se utiliza la del portal real.
+        :param csrf: El token CSRF de las páginas de cada listado.
+        :return: Una tupla con los diccionarios de las páginas que se obtienen con GET (la página de cada listado, con
+        el token CSRF, y las páginas de los listados) y con POST (los resúmenes).
+        """
+        base_url = base_url or BaseNautaScrapper._base_url[Portal.USER]
+        get_routes, post_routes = {}, {}
+        for action in HISTORY_ACTIONS:
+            urls = BaseNautaScrapper._portals_urls[Portal.USER][action]
+            get_routes[f"{base_url}{urls['base']}"] = _csrf_html.format(csrf)
+            post_routes[f"{base_url}{urls['summary']}"] = self.summary_html(action)
+            for page in range(1, self.pages[action] + 1):
+                get_routes[f"{base_url}{self.list_path(action, page)}"] = self.list_html(action, page)
+        return get_routes, post_routes
+
+    def __summary_cards(self, action: Action) -> list[tuple[str, str, str, str]]:
+        rows = self.rows(action)
+        title, icon = _count_cards[action]
+        total_import = format_money(sum(round(str_to_float(cells[-1 if action == Action.GET_CONNECTIONS else 1]) * 100)
+                                        for cells in rows))
+        if action != Action.GET_CONNECTIONS:
+            return [
+                (title, icon, str(len(rows)), "orange darken-2"),
+                ("Importe Total", "mdi-editor-attach-money", total_import, "teal darken-1")
+            ]
+        uploaded = sum(convert_to_bytes(cells[3]) for cells in rows)
+        downloaded = sum(convert_to_bytes(cells[4]) for cells in rows)
+        return [
+            (title, icon, str(len(rows)), "orange darken-2"),
+            ("Tiempo total", "mdi-action-alarm",
+             seconds_to_time_string(sum(time_string_to_seconds(cells[2]) for cells in rows)), "green"),
+            ("Importe Total", "mdi-editor-attach-money", total_import, "teal darken-1"),
+            ("Subida", "mdi-file-cloud-upload", format_bytes(uploaded), "deep-purple darken-1"),
+            ("Descarga", "mdi-file-cloud-download", format_bytes(downloaded), "blue darken-1"),
+            ("Tráfico total", "mdi-file-cloud-queue", format_bytes(uploaded + downloaded), "purple darken-1")
+        ]
+
+    def __generate_rows(self, action: Action) -> list[tuple[str, ...]]:
+        rng = random.Random(f"{self.seed}:{action.value}:{self.year_month}")
+        first_day = datetime.datetime(self.year, self.month, 1)
+        month_seconds = calendar.monthrange(self.year, self.month)[1] * 86400
+        starts = sorted((rng.randrange(month_seconds) for _ in range(self.counts[action])), reverse=True)
+        rows = []
+        for start in starts:
+            date = first_day + datetime.timedelta(seconds=start)
+            if action == Action.GET_CONNECTIONS:
+                duration = min(int(rng.expovariate(1 / 2400)) + 1, 6 * 3600)
+                uploaded = int(duration * rng.uniform(256, 4096))
+                downloaded = int(uploaded * rng.uniform(4, 16))
+                # Una parte de las conexiones se cobra a 0,20 el minuto y el resto se consume de la bolsa
+                cents = 0 if rng.random() < 0.4 else round(duration * 20 / 60)
+                rows.append((
+                    to_string_datetime(date), to_string_datetime(date + datetime.timedelta(seconds=duration)),
+                    seconds_to_time_string(duration), format_bytes(uploaded), format_bytes(downloaded),
+                    format_money(cents)
+                ))
+            elif action == Action.GET_RECHARGES:
+                rows.append((to_string_datetime(date), format_money(rng.choice((25, 50, 100, 200, 250, 500)) * 100),
+                             *rng.choice(_recharge_channels)))
+            elif action == Action.GET_TRANSFERS:
+                rows.append((to_string_datetime(date), format_money(rng.randrange(1, 200) * 100),
+                             f"user{rng.randrange(1000)}@nauta.com.cu"))
+            else:
+                channel, office = rng.choice(_quote_paid_channels)
+                rows.append((to_string_datetime(date), format_money(rng.choice((300, 500, 750, 1125)) * 100), channel,
+                             office, "Pago de Cuota"))
+        return rows
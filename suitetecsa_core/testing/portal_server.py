@@ -0,0 +1,618 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+Servidor HTTP(S) local que emula el portal cautivo (`secure.etecsa.net:8443`) y el portal de usuario
+(`www.portal.nauta.cu`) para probar y medir el SDK sin conexión a la red.
+
+Uso: python -m suitetecsa_core.testing.portal_server [--accounts N] [--rows N] [--latency S] [--jitter S]
+[--error-rate P] [--compress] [--connect-port N] [--user-port N] [--certfile RUTA --keyfile RUTA]
+"""
+import argparse
+import gzip
+import random
+import secrets
+import ssl
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from html import escape
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from suitetecsa_core import Action, Portal
+from suitetecsa_core.repository.scrapper_provider import BaseNautaScrapper
+from suitetecsa_core.testing.history import HISTORY_ACTIONS, SyntheticHistory
+
+_user_urls = BaseNautaScrapper._portals_urls[Portal.USER]
+_connect_urls = BaseNautaScrapper._portals_urls[Portal.CONNECT]
+
+_connect_cookie = "JSESSIONID"
+_user_cookie = "PHPSESSID"
+_check_connection_path = "check_connection"
+_online_path = "online.do"
+_success_html = '<div id="success"></div>'
+_user_information_labels = (
+    ("username", "Usuario"), ("blocking_date", "Fecha de bloqueo"), ("date_of_elimination", "Fecha de eliminación"),
+    ("account_type", "Tipo de cuenta"), ("service_type", "Tipo de servicio"), ("credit", "Saldo disponible"),
+    ("time", "Tiempo disponible de la cuenta"), ("mail_account", "Cuenta de correo"), ("offer", "Oferta"),
+    ("monthly_fee", "Cuota mensual"), ("download_speeds", "Velocidad de bajada"),
+    ("upload_speeds", "Velocidad de subida"), ("phone", "Teléfono"), ("link_identifiers", "Identificador del enlace"),
+    ("link_status", "Estado del enlace"), ("activation_date", "Fecha de activación"),
+    ("blocking_date_home", "Fecha de bloqueo"), ("date_of_elimination_home", "Fecha de eliminación"),
+    ("quote_paid", "Fondo de cuota pagada"), ("voucher", "Bono"), ("debt", "Deuda")
+)
+_default_information = {
+    "blocking_date": "30/11/2037",
+    "date_of_elimination": "31/12/2037",
+    "account_type": "Prepago recargable",
+    "service_type": "Navegación Internacional con Correo Internacional",
+    "credit": "$59,02 CUP",
+    "time": "04:43:17",
+    "mail_account": ""
+}
+_default_home_information = {
+    "offer": "NH RESIDENCIAL 1024/512 (40h) - RP",
+    "monthly_fee": "$300,00 CUP",
+    "download_speeds": "1024 kbps",
+    "upload_speeds": "512 kbps",
+    "phone": "########",
+    "link_identifiers": "H ED######",
+    "link_status": "HABILITADO",
+    "activation_date": "25/02/2021",
+    "blocking_date_home": "10/04/2037",
+    "date_of_elimination_home": "10/05/2037",
+    "quote_paid": "$0,81 CUP",
+    "voucher": "$0,00 CUP",
+    "debt": "$0,00 CUP"
+}
+# PNG de 1x1 píxeles que hace de imagen del captcha
+_captcha_png = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000" "1f15c4890000000d49444154789c6360000002000001"
+    "e221bc330000000049454e44ae426082"
+)
+
+
+@dataclass
+class PortalAccount:
+    """
+    Una cuenta del servidor, con sus credenciales, su información y el tamaño de su historial.
+
+    `history` indica las filas de cada listado en los meses que se quieran, como un entero para los cuatro listados o
+    un diccionario por acción; los meses que no aparecen tienen `default_rows` filas en cada listado.
+    """
+    username: str
+    password: str
+    information: dict[str, str] = field(default_factory=dict)
+    nauta_home: bool = False
+    remaining_time: str = "04:43:17"
+    history: dict[tuple[int, int], int | dict[Action, int]] = field(default_factory=dict)
+    default_rows: int = 0
+    seed: int = 0
+
+    @property
+    def user_information(self) -> dict[str, str]:
+        """
+        Los campos de la página `user_info` de la cuenta, en el orden del portal.
+        """
+        information = {"username": self.username, **_default_information}
+        if self.nauta_home:
+            information.update(_default_home_information)
+        information.update(self.information)
+        return information
+
+    def history_counts(self, year: int, month: int) -> int | dict[Action, int]:
+        return self.history.get((year, month), self.default_rows)
+
+
+def make_accounts(count: int, rows: int = 0, password: str = "password", seed: int = 0) -> list[PortalAccount]:
+    """
+    Crea `count` cuentas, `user0@nauta.com.cu`, `user1@nauta.com.cu`, etc., con la misma contraseña y `rows` filas en
+    cada listado de cada mes.
+    """
+    return [
+        PortalAccount(f"user{index}@nauta.com.cu", password, default_rows=rows, seed=seed + index)
+        for index in range(count)
+    ]
+
+
+class NautaPortalServer:
+    """
+    Emulación local de los dos portales de Nauta, cada uno en su propio puerto, con latencia, variación de la latencia
+    y tasa de errores configurables y un conjunto de datos por cuenta.
+
+    El portal cautivo atiende la página de aterrizaje, `LoginServlet`, `EtecsaQueryServlet` (información de la cuenta y
+    `getLeftTime`) y `LogoutServlet`. El portal de usuario atiende el inicio de sesión con token CSRF y captcha,
+    `user_info`, los formularios de recarga, transferencia y cambio de contraseña, y los resúmenes y listados
+    paginados del historial, generados con `SyntheticHistory`. La URL de comprobación de la conexión la atiende el
+    portal de usuario: redirige al portal cautivo mientras la sesión no se haya conectado.
+
+    Las sesiones se identifican con cookies de nombre distinto en cada portal, ya que las cookies no distinguen
+    puertos. Use `configure` para que un scrapper use el servidor::
+
+        with NautaPortalServer(make_accounts(10, rows=500), latency=0.05) as server:
+            scrapper = DefaultNautaScrapper(BeautifulSoup(), DefaultNautaSession(Session()))
+            server.configure(scrapper)
+    """
+
+    def __init__(
+            self, accounts: list[PortalAccount] = (), latency: float = 0.0, jitter: float = 0.0,
+            error_rate: float = 0.0, host: str = "127.0.0.1", connect_port: int = 0, user_port: int = 0,
+            certfile: str = None, keyfile: str = None, seed: int = None, compress: bool = False
+    ) -> None:
+        """
+        Constructor de la clase.
+
+        :param accounts: Las cuentas del servidor.
+        :param latency: Segundos que se retrasa cada respuesta.
+        :param jitter: Variación máxima, en segundos y en ambos sentidos, del retraso de cada respuesta.
+        :param error_rate: Proporción de peticiones que se responden con un error 503.
+        :param host: La dirección en la que escuchan los dos portales.
+        :param connect_port: El puerto del portal cautivo. 0 para elegir uno libre.
+        :param user_port: El puerto del portal de usuario. 0 para elegir uno libre.
+        :param certfile: Si se especifica junto con `keyfile`, los portales se sirven por HTTPS con este certificado.
+        :param keyfile: La clave privada del certificado.
+        :param seed: La semilla de la latencia y de los errores.
+        :param compress: Si es True, las respuestas con cuerpo se comprimen con gzip cuando la petición lo acepta.
+        """
+        self.accounts = {account.username: account for account in accounts}
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.compress = compress
+        self.requests: Counter = Counter()
+        self.injected_errors = 0
+        self.__random = random.Random(seed)
+        self.__lock = threading.Lock()
+        self.__connect_sessions: dict[str, dict] = {}
+        self.__user_sessions: dict[str, dict] = {}
+        self.__histories: dict[tuple[str, int, int], SyntheticHistory] = {}
+        self.__context = None
+        if certfile is not None:
+            self.__context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            self.__context.load_cert_chain(certfile, keyfile)
+        self.__servers = {
+            Portal.CONNECT: self.__make_server(host, connect_port, Portal.CONNECT),
+            Portal.USER: self.__make_server(host, user_port, Portal.USER)
+        }
+        self.__threads: list[threading.Thread] = []
+
+    def __make_server(self, host: str, port: int, portal: Portal) -> ThreadingHTTPServer:
+        server = ThreadingHTTPServer((host, port), type(f"{portal.name.title()}Handler", (_PortalHandler,), {
+            "portal_server": self, "portal": portal
+        }))
+        server.daemon_threads = True
+        if self.__context is not None:
+            server.socket = self.__context.wrap_socket(server.socket, server_side=True)
+        return server
+
+    def __enter__(self) -> "NautaPortalServer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """
+        Empieza a atender peticiones en segundo plano.
+        """
+        for portal, server in self.__servers.items():
+            thread = threading.Thread(target=server.serve_forever, name=f"nauta-{portal.name.lower()}", daemon=True)
+            thread.start()
+            self.__threads.append(thread)
+
+    def stop(self) -> None:
+        for server in self.__servers.values():
+            server.shutdown()
+            server.server_close()
+        for thread in self.__threads:
+            thread.join()
+        self.__threads.clear()
+
+    @property
+    def base_urls(self) -> dict[Portal, str]:
+        """
+        La dirección base de cada portal, terminada en '/'.
+        """
+        scheme = "https" if self.__context is not None else "http"
+        return {
+            portal: f"{scheme}://{server.server_address[0]}:{server.server_address[1]}/"
+            for portal, server in self.__servers.items()
+        }
+
+    @property
+    def check_connection_url(self) -> str:
+        return f"{self.base_urls[Portal.USER]}{_check_connection_path}"
+
+    def configure(self, scrapper: BaseNautaScrapper) -> None:
+        """
+        Dirige las peticiones de un scrapper, síncrono o asíncrono, a este servidor.
+        """
+        scrapper.override_base_urls(self.base_urls, self.check_connection_url)
+
+    def add_account(self, account: PortalAccount) -> None:
+        with self.__lock:
+            self.accounts[account.username] = account
+
+    def history(self, username: str, year: int, month: int) -> SyntheticHistory:
+        """
+        Devuelve el historial de un mes de una cuenta, generándolo la primera vez que se pide.
+        """
+        key = (username, year, month)
+        with self.__lock:
+            if key not in self.__histories:
+                account = self.accounts[username]
+                self.__histories[key] = SyntheticHistory(
+                    year, month, account.history_counts(year, month), seed=account.seed
+                )
+            return self.__histories[key]
+
+    def expire_csrf_tokens(self) -> None:
+        """
+        Invalida los tokens CSRF de todas las sesiones del portal de usuario, como cuando caducan en el portal real.
+        El siguiente formulario que se envíe con un token anterior se rechaza con un error 403.
+        """
+        with self.__lock:
+            for session in self.__user_sessions.values():
+                session.pop("csrf", None)
+
+    def is_connected(self, connect_session_id: str | None) -> bool:
+        session = self.__connect_sessions.get(connect_session_id)
+        return session is not None and session.get("attribute_uuid") is not None
+
+    def _delay(self) -> bool:
+        """
+        Aplica la latencia configurada y devuelve True si la petición debe responderse con un error.
+        """
+        with self.__lock:
+            delay = max(0.0, self.latency + self.__random.uniform(-self.jitter, self.jitter))
+            fail = self.__random.random() < self.error_rate
+            if fail:
+                self.injected_errors += 1
+        if delay:
+            time.sleep(delay)
+        return fail
+
+    def _count(self, portal: Portal, route: str) -> None:
+        with self.__lock:
+            self.requests[(portal.name.lower(), route)] += 1
+
+    def _session(self, portal: Portal, session_id: str | None) -> tuple[str, dict, bool]:
+        """
+        Devuelve el identificador y los datos de la sesión de un portal, creando una nueva si no existe.
+        """
+        sessions = self.__connect_sessions if portal == Portal.CONNECT else self.__user_sessions
+        with self.__lock:
+            if session_id in sessions:
+                return session_id, sessions[session_id], False
+            session_id = secrets.token_hex(16)
+            sessions[session_id] = {}
+            return session_id, sessions[session_id], True
+
+
+class _PortalHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Las cabeceras y el cuerpo se escriben por separado; sin esto, Nagle y el ACK retardado añaden ~40 ms por petición
+    disable_nagle_algorithm = True
+    portal_server: NautaPortalServer
+    portal: Portal
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self.__handle("GET")
+
+    def do_POST(self) -> None:
+        self.__handle("POST")
+
+    def do_HEAD(self) -> None:
+        self.__handle("HEAD")
+
+    def __handle(self, method: str) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode() if length else ""
+        url = urlsplit(self.path)
+        self.form = {key: values[-1] for key, values in parse_qs(body, keep_blank_values=True).items()}
+        self.query = {key: values[-1] for key, values in parse_qs(url.query, keep_blank_values=True).items()}
+        self.method = method
+        cookie_name = _connect_cookie if self.portal == Portal.CONNECT else _user_cookie
+        cookies = SimpleCookie(self.headers.get("Cookie", ""))
+        self.session_id, self.session, new_session = self.portal_server._session(
+            self.portal, cookies[cookie_name].value if cookie_name in cookies else None
+        )
+        self.set_cookie = f"{cookie_name}={self.session_id}; Path=/" if new_session else None
+        self.connect_session_id = cookies[_connect_cookie].value if _connect_cookie in cookies else None
+        path = url.path.lstrip("/")
+        route, handler = self.__route(method, path)
+        self.portal_server._count(self.portal, route)
+        if self.portal_server._delay():
+            self.send_text("Service Unavailable", 503)
+        elif handler is None:
+            self.send_text("Not Found", 404)
+        else:
+            handler(path)
+
+    def __route(self, method: str, path: str):
+        if self.portal == Portal.CONNECT:
+            routes = {
+                ("GET", ""): self.connect_landing,
+                ("POST", ""): self.connect_login_page,
+                ("POST", "LoginServlet"): self.connect_login,
+                ("GET", _online_path): self.connect_online,
+                ("POST", _connect_urls[Action.LOAD_USER_INFORMATION]): self.connect_query,
+                ("POST", _connect_urls[Action.LOGOUT]): self.connect_logout,
+                ("GET", _connect_urls[Action.LOGOUT]): self.connect_logout
+            }
+            return path, routes.get((method if method != "HEAD" else "GET", path))
+        routes = {
+            ("GET", _check_connection_path): self.check_connection,
+            ("GET", _user_urls[Action.LOGIN]): self.user_login_page,
+            ("POST", _user_urls[Action.LOGIN]): self.user_login,
+            ("GET", "captcha/"): self.user_captcha,
+            ("GET", _user_urls[Action.LOAD_USER_INFORMATION]): self.user_information,
+        }
+        for action in (
+                Action.RECHARGE, Action.TRANSFER, Action.NAUTA_HOGAR_PAID, Action.CHANGE_PASSWORD,
+                Action.CHANGE_EMAIL_PASSWORD
+        ):
+            routes[("GET", _user_urls[action])] = self.user_csrf_page
+            routes[("POST", _user_urls[action])] = self.user_form
+        for action in HISTORY_ACTIONS:
+            routes[("GET", _user_urls[action]["base"])] = self.user_csrf_page
+            routes[("POST", _user_urls[action]["summary"])] = self.user_summary
+            if path.startswith(_user_urls[action]["list"]):
+                return _user_urls[action]["list"], self.user_list if method == "GET" else None
+        return path, routes.get((method if method != "HEAD" else "GET", path))
+
+    def send_text(self, text: str | bytes, status: int = 200, content_type: str = "text/html; charset=utf-8",
+                  headers: dict[str, str] = None) -> None:
+        content = text.encode() if isinstance(text, str) else text
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        if content and self.portal_server.compress and "gzip" in self.headers.get("Accept-Encoding", ""):
+            content = gzip.compress(content)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(content)))
+        if self.set_cookie:
+            self.send_header("Set-Cookie", self.set_cookie)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.method != "HEAD":
+            self.wfile.write(content)
+
+    def redirect(self, location: str) -> None:
+        self.send_text(b"", 302, headers={"Location": location})
+
+    @property
+    def base_urls(self) -> dict[Portal, str]:
+        return self.portal_server.base_urls
+
+    # Portal cautivo
+
+    def connect_landing(self, path: str) -> None:
+        self.session.setdefault("wlanuserip", f"10.190.{secrets.randbelow(256)}.{secrets.randbelow(256)}")
+        self.send_text(
+            f'<form name="CMCCWLANFORM" method="post" action="{self.base_urls[Portal.CONNECT]}">\n'
+            f'    <input type="hidden" name="wlanuserip" value="{self.session["wlanuserip"]}">\n'
+            f'    <input type="hidden" name="wlanparameter" value="{secrets.token_hex(24)}">\n'
+            f'</form>\n<script language=\'javascript\'>    CMCCWLANFORM.submit();</script>'
+        )
+
+    def connect_login_page(self, path: str) -> None:
+        self.session["wlanuserip"] = self.form.get("wlanuserip") or self.session.get("wlanuserip", "10.190.0.1")
+        self.session["csrf_hw"] = secrets.token_hex(16)
+        self.send_text(
+            f'<form class="form" action="{self.base_urls[Portal.CONNECT]}/LoginServlet" method="post" '
+            f'id="formulario">\n'
+            f'    <input type="hidden" name="wlanuserip" id="wlanuserip" value="{self.session["wlanuserip"]}" />\n'
+            f'    <input type="hidden" name="lang" id="lang" value="es_ES" />\n'
+            f'    <input name="username" id="username" maxlength="253" class="input_text cred" type="text">\n'
+            f'    <input name="password" id="password" class="input_text cred" value="" type="password">\n'
+            f"    <input type='hidden' name='CSRFHW' value='{self.session['csrf_hw']}' />\n"
+            f'</form>'
+        )
+
+    def connect_login(self, path: str) -> None:
+        account = self.portal_server.accounts.get(self.form.get("username"))
+        if self.form.get("CSRFHW") != self.session.get("csrf_hw"):
+            self.send_text('<script type="text/javascript">alert("Su sesión ha expirado")</script>')
+        elif account is None or account.password != self.form.get("password"):
+            self.send_text('<script type="text/javascript">alert("El nombre de usuario o contraseña son '
+                           'incorrectos.")</script>')
+        else:
+            self.session["username"] = account.username
+            self.session["attribute_uuid"] = secrets.token_hex(16).upper()
+            self.redirect(f"{self.base_urls[Portal.CONNECT]}{_online_path}?{secrets.token_hex(8)}")
+
+    def connect_online(self, path: str) -> None:
+        if self.session.get("attribute_uuid") is None:
+            return self.redirect(self.base_urls[Portal.CONNECT])
+        self.send_text(
+            '<script type="text/javascript">\n'
+            f'    var urlParam = "ATTRIBUTE_UUID={self.session["attribute_uuid"]}&CSRFHW={self.session["csrf_hw"]}"\n'
+            f'        + "&wlanuserip={self.session["wlanuserip"]}"\n'
+            f'        + "&username={self.session["username"]}";\n'
+            '</script>\n<div id="onlineTime">00:00:00</div>'
+        )
+
+    def connect_query(self, path: str) -> None:
+        if self.form.get("op") == "getLeftTime":
+            if self.form.get("ATTRIBUTE_UUID") != self.session.get("attribute_uuid") or not self.session.get(
+                    "attribute_uuid"):
+                return self.send_text("errorop", content_type="text/plain; charset=utf-8")
+            account = self.portal_server.accounts[self.session["username"]]
+            return self.send_text(account.remaining_time, content_type="text/plain; charset=utf-8")
+        account = self.portal_server.accounts.get(self.form.get("username"))
+        if account is None or account.password != self.form.get("password"):
+            return self.send_text('<script type="text/javascript">alert("El nombre de usuario o contraseña son '
+                                  'incorrectos.")</script>')
+        information = account.user_information
+        rows = "".join(
+            f'            <tr>\n                <td class="key">{label}</td>\n'
+            f'                <td>{escape(value)}</td>\n            </tr>\n'
+            for label, value in (
+                ("Estado de la cuenta:", "Activa"), ("Crédito:", information["credit"]),
+                ("Fecha de expiración:", "No especificada"),
+                ("Áreas de acceso:", "Acceso desde todas las áreas de Internet")
+            )
+        )
+        sessions = "".join(
+            f'            <tr>\n                <td>{start}</td>\n                <td>{end}</td>\n'
+            f'                <td>{duration}</td>\n            </tr>\n'
+            for start, end, duration in (
+                ("2022/05/21 07:07:17", "2022/05/21 07:15:42", "00:08:25"),
+                ("2022/05/21 05:43:48", "2022/05/21 06:36:15", "00:52:27")
+            )
+        )
+        self.send_text(
+            f'<div id="userinfo">\n    <table id="sessioninfo">\n        <tbody>\n{rows}        </tbody>\n'
+            f'    </table>\n'
+            f'    <table id="sesiontraza">\n        <tbody>\n{sessions}        </tbody>\n    </table>\n</div>'
+        )
+
+    def connect_logout(self, path: str) -> None:
+        params = {**self.query, **self.form}
+        if not self.session.get("attribute_uuid") or params.get("ATTRIBUTE_UUID") != self.session["attribute_uuid"]:
+            return self.send_text("logoutcallback('FAILURE');", content_type="text/plain; charset=utf-8")
+        self.session.pop("attribute_uuid")
+        self.send_text("logoutcallback('SUCCESS');", content_type="text/plain; charset=utf-8")
+
+    # Portal de usuario
+
+    def check_connection(self, path: str) -> None:
+        if self.portal_server.is_connected(self.connect_session_id):
+            self.send_text("<html><body>Conectado</body></html>")
+        else:
+            self.redirect(self.base_urls[Portal.CONNECT])
+
+    def __csrf(self) -> str:
+        return self.session.setdefault("csrf", f"security{secrets.token_hex(7)}")
+
+    def __csrf_rejected(self) -> bool:
+        if self.form.get("csrf") != self.session.get("csrf"):
+            self.send_text("Forbidden", 403)
+            return True
+        return False
+
+    def __logged_in(self) -> bool:
+        if self.session.get("username") is None:
+            self.redirect(f"{self.base_urls[Portal.USER]}{_user_urls[Action.LOGIN]}")
+            return False
+        return True
+
+    def user_login_page(self, path: str) -> None:
+        self.send_text(
+            f'<form action="{self.base_urls[Portal.USER]}{_user_urls[Action.LOGIN]}" method="post">\n'
+            f'    <input name="csrf" type="hidden" value="{self.__csrf()}" />\n'
+            f'    <input name="login_user" type="text" />\n    <input name="password_user" type="password" />\n'
+            f'    <input name="captcha" type="text" />\n</form>'
+        )
+
+    def user_captcha(self, path: str) -> None:
+        self.send_text(_captcha_png, content_type="image/png")
+
+    def user_login(self, path: str) -> None:
+        if self.__csrf_rejected():
+            return
+        account = self.portal_server.accounts.get(self.form.get("login_user"))
+        if not self.form.get("captcha"):
+            return self.send_text(_error_html("El código de la imagen es incorrecto"))
+        if account is None or account.password != self.form.get("password_user"):
+            return self.send_text(_error_html("Usuario desconocido o contraseña incorrecta"))
+        self.session["username"] = account.username
+        self.send_text(_user_information_html(account))
+
+    def user_information(self, path: str) -> None:
+        if self.__logged_in():
+            self.send_text(_user_information_html(self.portal_server.accounts[self.session["username"]]))
+
+    def user_csrf_page(self, path: str) -> None:
+        if self.__logged_in():
+            self.send_text(
+                f'<form method="post">\n    <input name="csrf" type="hidden" value="{self.__csrf()}" />\n</form>'
+            )
+
+    def user_form(self, path: str) -> None:
+        if self.__logged_in() and not self.__csrf_rejected():
+            self.send_text(_success_html)
+
+    def user_summary(self, path: str) -> None:
+        if not self.__logged_in() or self.__csrf_rejected():
+            return
+        action = next(action for action in HISTORY_ACTIONS if _user_urls[action]["summary"] == path)
+        year, month = map(int, self.form.get("year_month", "").split("-"))
+        history = self.portal_server.history(self.session["username"], year, month)
+        self.send_text(history.summary_html(action))
+
+    def user_list(self, path: str) -> None:
+        if not self.__logged_in():
+            return
+        action = next(action for action in HISTORY_ACTIONS if path.startswith(_user_urls[action]["list"]))
+        parts = path[len(_user_urls[action]["list"]):].strip("/").split("/")
+        year, month = map(int, parts[0].split("-"))
+        page = int(parts[2]) if len(parts) > 2 else 1
+        history = self.portal_server.history(self.session["username"], year, month)
+        self.send_text(history.list_html(action, page))
+
+
+def _error_html(message: str) -> str:
+    return f'<script type="text/javascript">toastr.error(\'<ul><li class="msg_error">{escape(message)}</li></ul>\');' \
+           f'</script>'
+
+
+def _user_information_html(account: PortalAccount) -> str:
+    information = account.user_information
+    fields = "".join(
+        f'        <div class="col s12 m6">\n            <h5>{label}</h5>\n'
+        f'            <p>{escape(information[key])}</p>\n        </div>\n'
+        for key, label in _user_information_labels if key in information
+    )
+    return f'<div class="z-depth-1 card-panel">\n    <div class="row">\n{fields}    </div>\n</div>'
+
+
+def main():
+    args_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    args_parser.add_argument("--accounts", type=int, default=10, help="Número de cuentas")
+    args_parser.add_argument("--rows", type=int, default=100, help="Filas de cada listado en cada mes")
+    args_parser.add_argument("--password", default="password", help="Contraseña de todas las cuentas")
+    args_parser.add_argument("--latency", type=float, default=0.0, help="Retraso de cada respuesta, en segundos")
+    args_parser.add_argument("--jitter", type=float, default=0.0, help="Variación máxima del retraso, en segundos")
+    args_parser.add_argument("--error-rate", type=float, default=0.0, help="Proporción de respuestas con error 503")
+    args_parser.add_argument("--compress", action="store_true", help="Comprime las respuestas con gzip")
+    args_parser.add_argument("--host", default="127.0.0.1")
+    args_parser.add_argument("--connect-port", type=int, default=8443)
+    args_parser.add_argument("--user-port", type=int, default=8080)
+    args_parser.add_argument("--certfile", help="Certificado para servir los portales por HTTPS")
+    args_parser.add_argument("--keyfile", help="Clave privada del certificado")
+    args = args_parser.parse_args()
+
+    server = NautaPortalServer(
+        make_accounts(args.accounts, args.rows, args.password), args.latency, args.jitter, args.error_rate, args.host,
+        args.connect_port, args.user_port, args.certfile, args.keyfile, compress=args.compress
+    )
+    server.start()
+    print(f"Portal cautivo: {server.base_urls[Portal.CONNECT]}")
+    print(f"Portal de usuario: {server.base_urls[Portal.USER]}")
+    print(f"Comprobación de la conexión: {server.check_connection_url}")
+    print(f"Cuentas: user0@nauta.com.cu ... user{args.accounts - 1}@nauta.com.cu, contraseña '{args.password}'")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,192 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import re
+from itertools import repeat
+from operator import itemgetter
+from typing import Sequence
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from suitetecsa_core.utils.nauta import (
+    _bytes_units,
+    convert_to_bytes,
+    parse_datetime,
+    str_to_float,
+    time_string_to_seconds
+)
+
+# Una línea por valor, con el formato exacto que usa el portal. Los valores que no lo cumplen se convierten uno a uno
+# con los conversores de `suitetecsa_core.utils.nauta`, de modo que los resultados y errores son siempre los mismos
+_bytes_line = re.compile(r'^([0-9]+(?:\.[0-9]*)?|\.[0-9]+) ([a-z]+)$', re.MULTILINE | re.ASCII)
+_currency_line = re.compile(r'^\$([0-9]+(?:,[0-9]*)?|,[0-9]+)(?: [A-Z]+)?$', re.MULTILINE | re.ASCII)
+# Posiciones de los dígitos de día, mes, año, hora, minutos y segundos en "dd/mm/aaaa hh:mm:ss"
+_datetime_fields = ((0, 2), (3, 5), (6, 10), (11, 13), (14, 16), (17, 19))
+
+
+def _join_lines(values: Sequence[str]) -> str | None:
+    text = "\n".join(values)
+    # Un valor con saltos de línea se convierte con los conversores escalares
+    return text if text.count("\n") == len(values) - 1 else None
+
+
+def _ascii_matrix(text: str, width: int):
+    return numpy.frombuffer(text.encode("ascii"), dtype=numpy.uint8).reshape(-1, width)
+
+
+def _digits(matrix, start: int, end: int):
+    """
+    Devuelve el número formado por los dígitos de las columnas `start` a `end` de cada fila, o None si alguna de ellas
+    no es un dígito.
+    """
+    digits = matrix[:, start:end] - ord("0")
+    if (digits > 9).any():
+        return None
+    return digits.astype(numpy.int64) @ 10 ** numpy.arange(end - start - 1, -1, -1, dtype=numpy.int64)
+
+
+def _fallback(converter, values: Sequence[str], dtype):
+    return numpy.array([converter(value) for value in values], dtype=dtype)
+
+
+def _fast_time_string_to_seconds(values: Sequence[str]):
+    lengths = set(map(len, values))
+    width = max(lengths)
+    # Las horas ocupan al menos un dígito y como mucho 15, de modo que `hours * 3600` cabe en un entero de 64 bits
+    if min(lengths) < 7 or width > 21:
+        return None
+    matrix = _ascii_matrix("".join(map(str.rjust, values, repeat(width), repeat("0"))), width)
+    if (matrix[:, width - 6] != ord(":")).any() or (matrix[:, width - 3] != ord(":")).any():
+        return None
+    hours, minutes, seconds = (
+        _digits(matrix, 0, width - 6), _digits(matrix, width - 5, width - 3), _digits(matrix, width - 2, width)
+    )
+    if hours is None or minutes is None or seconds is None or (minutes > 59).any() or (seconds > 59).any():
+        return None
+    return hours * 3600 + minutes * 60 + seconds
+
+
+def _fast_convert_to_bytes(values: Sequence[str]):
+    text = _join_lines(values)
+    if text is None:
+        return None
+    rows = _bytes_line.findall(text.replace(",", ".").lower())
+    if len(rows) != len(values):
+        return None
+    amounts = numpy.fromiter(map(float, map(itemgetter(0), rows)), dtype=numpy.float64, count=len(rows))
+    factors = numpy.fromiter(map(_bytes_units.__getitem__, map(itemgetter(1), rows)), dtype=numpy.int64,
+                             count=len(rows))
+    result = amounts * factors
+    if (numpy.abs(result) >= 2 ** 63).any():
+        return None
+    return result.astype(numpy.int64)
+
+
+def _fast_str_to_float(values: Sequence[str]):
+    text = _join_lines(values)
+    if text is None:
+        return None
+    amounts = _currency_line.findall(text)
+    if len(amounts) != len(values):
+        return None
+    return numpy.fromiter(
+        (float(amount.replace(",", ".")) for amount in amounts), dtype=numpy.float64, count=len(amounts)
+    )
+
+
+def _fast_parse_datetime(values: Sequence[str]):
+    if set(map(len, values)) != {19}:
+        return None
+    matrix = _ascii_matrix("".join(values), 19)
+    if (
+            (matrix[:, [2, 5]] != ord("/")).any() or (matrix[:, 10] != ord(" ")).any()
+            or (matrix[:, [13, 16]] != ord(":")).any()
+    ):
+        return None
+    fields = [_digits(matrix, start, end) for start, end in _datetime_fields]
+    if any(field is None for field in fields):
+        return None
+    day, month, year, hour, minute, second = fields
+    if (
+            (year < 1).any() or (month < 1).any() or (month > 12).any() or (day < 1).any()
+            or (hour > 23).any() or (minute > 59).any() or (second > 59).any()
+    ):
+        return None
+    months = ((year - 1970) * 12 + month - 1).astype("datetime64[M]")
+    first_day = months.astype("datetime64[D]")
+    if (day > ((months + 1).astype("datetime64[D]") - first_day).astype(numpy.int64)).any():
+        return None
+    return (first_day + (day - 1)).astype("datetime64[s]") + (hour * 3600 + minute * 60 + second)
+
+
+def _batch(fast, converter, values: Sequence[str], dtype):
+    if numpy is None:
+        return [converter(value) for value in values]
+    values = list(values)
+    if not values:
+        return numpy.array([], dtype=dtype)
+    try:
+        result = fast(values)
+    except (TypeError, ValueError, KeyError):
+        result = None
+    return _fallback(converter, values, dtype) if result is None else result
+
+
+def batch_time_string_to_seconds(values: Sequence[str]):
+    """
+    Versión por lotes de `time_string_to_seconds`.
+
+    :param values: Las cadenas de duración en formato "HH:MM:SS", por ejemplo, la columna de duración de un mes de
+    conexiones.
+    :return: Un array de NumPy de tipo int64 con los segundos. Si NumPy no está instalado, una lista de enteros.
+    :raises ValueError: Si alguna cadena no tiene el formato correcto.
+    :raises OverflowError: Si, con NumPy, algún resultado no cabe en un entero de 64 bits.
+    """
+    return _batch(_fast_time_string_to_seconds, time_string_to_seconds, values, numpy and numpy.int64)
+
+
+def batch_convert_to_bytes(values: Sequence[str]):
+    """
+    Versión por lotes de `convert_to_bytes`.
+
+    :param values: Los tamaños en formato "X unidad", por ejemplo, la columna de tráfico descargado de un mes de
+    conexiones.
+    :return: Un array de NumPy de tipo int64 con los bytes. Si NumPy no está instalado, una lista de enteros.
+    :raises ValueError: Si algún tamaño no tiene el formato correcto.
+    """
+    return _batch(_fast_convert_to_bytes, convert_to_bytes, values, numpy and numpy.int64)
+
+
+def batch_str_to_float(values: Sequence[str]):
+    """
+    Versión por lotes de `str_to_float`.
+
+    :param values: Los importes con formato '$46,52' o '$46,52 CUP'.
+    :return: Un array de NumPy de tipo float64 con los importes. Si NumPy no está instalado, una lista de `float`.
+    :raises ValueError: Si algún importe no tiene el formato correcto.
+    """
+    return _batch(_fast_str_to_float, str_to_float, values, numpy and numpy.float64)
+
+
+def batch_parse_datetime(values: Sequence[str]):
+    """
+    Versión por lotes de `parse_datetime`.
+
+    :param values: Las fechas en formato "dd/mm/aaaa hh:mm:ss".
+    :return: Un array de NumPy de tipo datetime64[s]. Si NumPy no está instalado, una lista de objetos
+    `datetime.datetime`.
+    :raises ValueError: Si alguna fecha no tiene el formato correcto o no es válida.
+    """
+    return _batch(_fast_parse_datetime, parse_datetime, values, numpy and "datetime64[s]")
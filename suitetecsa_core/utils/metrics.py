@@ -0,0 +1,226 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+Métricas de las peticiones a los portales y del análisis de sus respuestas, a partir de los hooks de las sesiones.
+
+`NautaMetrics` cuenta las peticiones, los errores por tipo de excepción y los bytes enviados y recibidos, y guarda
+histogramas de la latencia, del tiempo de análisis y del tamaño de las respuestas, todo por portal y acción. Se puede
+exportar en el formato de texto de Prometheus o como un diccionario.
+
+Cada hilo escribe en sus propios contadores, sin bloqueos; solo se toma un bloqueo cuando un hilo registra su primera
+medida y al leer las métricas, que suman los contadores de todos los hilos.
+"""
+import bisect
+import math
+import threading
+
+from suitetecsa_core.repository.session_provider import BaseNautaSession, ParseEvent, RequestEvent
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+DEFAULT_PARSE_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+DEFAULT_SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+_COUNTERS = {
+    "requests_total": ("Peticiones a los portales.", ("portal", "action", "method", "status")),
+    "errors_total": (
+        "Errores por tipo de excepción, en la petición (request) o en el análisis de la respuesta (parse).",
+        ("portal", "action", "stage", "exception")
+    ),
+    "sent_bytes_total": ("Bytes de los formularios enviados.", ("portal", "action")),
+    "received_bytes_total": ("Bytes de los cuerpos de las respuestas.", ("portal", "action")),
+}
+_HISTOGRAMS = {
+    "request_duration_seconds": ("Latencia de las peticiones.", ("portal", "action")),
+    "parse_duration_seconds": ("Tiempo de análisis de las respuestas.", ("portal", "action")),
+    "response_size_bytes": ("Tamaño de los cuerpos de las respuestas.", ("portal", "action")),
+}
+
+
+def _label(value) -> str:
+    return value.name.lower() if value is not None else "unknown"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class NautaMetrics:
+    """
+    Contadores e histogramas de las peticiones a los portales, por portal y acción.
+
+    Para medir una sesión, regístrelas con `attach`; una misma instancia puede medir las sesiones de muchas cuentas::
+
+        metrics = NautaMetrics()
+        metrics.attach(session)
+        ...
+        print(metrics.to_prometheus())
+    """
+
+    def __init__(
+            self, latency_buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+            parse_buckets: tuple[float, ...] = DEFAULT_PARSE_BUCKETS,
+            size_buckets: tuple[float, ...] = DEFAULT_SIZE_BUCKETS, prefix: str = "suitetecsa"
+    ) -> None:
+        """
+        Constructor de la clase.
+
+        :param latency_buckets: Los límites superiores de los intervalos del histograma de latencia, en segundos.
+        :param parse_buckets: Los límites superiores de los intervalos del histograma del tiempo de análisis, en
+        segundos.
+        :param size_buckets: Los límites superiores de los intervalos del histograma del tamaño de las respuestas, en
+        bytes.
+        :param prefix: El prefijo de los nombres de las métricas en el formato de Prometheus.
+        """
+        self.prefix = prefix
+        self.__buckets = {
+            "request_duration_seconds": tuple(sorted(latency_buckets)),
+            "parse_duration_seconds": tuple(sorted(parse_buckets)),
+            "response_size_bytes": tuple(sorted(size_buckets))
+        }
+        self.__local = threading.local()
+        self.__shards: list[dict] = []
+        self.__lock = threading.Lock()
+
+    def attach(self, session: BaseNautaSession) -> None:
+        """
+        Registra los hooks de las métricas en una sesión.
+        """
+        session.register_hook("after_request", self.observe_request)
+        session.register_hook("parse", self.observe_parse)
+
+    def detach(self, session: BaseNautaSession) -> None:
+        session.deregister_hook("after_request", self.observe_request)
+        session.deregister_hook("parse", self.observe_parse)
+
+    def __shard(self) -> dict:
+        try:
+            return self.__local.shard
+        except AttributeError:
+            shard = self.__local.shard = {}
+            with self.__lock:
+                self.__shards.append(shard)
+            return shard
+
+    def __increment(self, shard: dict, key: tuple, amount: int = 1) -> None:
+        shard[key] = shard.get(key, 0) + amount
+
+    def __observe(self, shard: dict, name: str, labels: tuple, value: float) -> None:
+        key = (name, labels)
+        histogram = shard.get(key)
+        if histogram is None:
+            # Un contador por intervalo, más el de +Inf, la suma y el número de observaciones
+            histogram = shard[key] = [0] * (len(self.__buckets[name]) + 1) + [0.0, 0]
+        histogram[bisect.bisect_left(self.__buckets[name], value)] += 1
+        histogram[-2] += value
+        histogram[-1] += 1
+
+    def observe_request(self, event: RequestEvent) -> None:
+        """
+        Hook `after_request` que registra una petición.
+        """
+        shard = self.__shard()
+        labels = (_label(event.portal), _label(event.action))
+        status = str(event.status_code) if event.status_code is not None else "none"
+        self.__increment(shard, ("requests_total", labels + (event.method, status)))
+        if event.exception is not None:
+            self.__increment(shard, ("errors_total", labels + ("request", type(event.exception).__name__)))
+        if event.bytes_sent:
+            self.__increment(shard, ("sent_bytes_total", labels), event.bytes_sent)
+        if event.status_code is not None:
+            self.__increment(shard, ("received_bytes_total", labels), event.bytes_received)
+            self.__observe(shard, "response_size_bytes", labels, event.bytes_received)
+        self.__observe(shard, "request_duration_seconds", labels, event.elapsed)
+
+    def observe_parse(self, event: ParseEvent) -> None:
+        """
+        Hook `parse` que registra el análisis de una respuesta.
+        """
+        shard = self.__shard()
+        labels = (_label(event.portal), _label(event.action))
+        if event.exception is not None:
+            self.__increment(shard, ("errors_total", labels + ("parse", type(event.exception).__name__)))
+        self.__observe(shard, "parse_duration_seconds", labels, event.elapsed)
+
+    def __merged(self) -> dict:
+        with self.__lock:
+            shards = list(self.__shards)
+        merged = {}
+        for shard in shards:
+            # `dict.copy` no se interrumpe por otros hilos, así que la copia es consistente aunque el hilo siga midiendo
+            for key, value in shard.copy().items():
+                if isinstance(value, list):
+                    current = merged.setdefault(key, [0] * (len(value) - 1) + [0])
+                    for index, item in enumerate(value):
+                        current[index] += item
+                else:
+                    merged[key] = merged.get(key, 0) + value
+        return merged
+
+    def reset(self) -> None:
+        """
+        Pone a cero todas las métricas.
+        """
+        with self.__lock:
+            for shard in self.__shards:
+                shard.clear()
+
+    def snapshot(self) -> dict[str, list[dict]]:
+        """
+        Devuelve las métricas como un diccionario que se puede serializar en JSON. Cada métrica es una lista de series
+        con sus etiquetas y su valor o, en los histogramas, los contadores acumulados por límite superior (`buckets`),
+        la suma (`sum`) y el número de observaciones (`count`).
+        """
+        result = {name: [] for name in (*_COUNTERS, *_HISTOGRAMS)}
+        for (name, labels), value in sorted(self.__merged().items()):
+            if name in _COUNTERS:
+                result[name].append({"labels": dict(zip(_COUNTERS[name][1], labels)), "value": value})
+                continue
+            cumulative, buckets = 0, {}
+            for bound, count in zip(self.__buckets[name] + (math.inf,), value[:-2]):
+                cumulative += count
+                buckets[_format_number(bound)] = cumulative
+            result[name].append({
+                "labels": dict(zip(_HISTOGRAMS[name][1], labels)), "buckets": buckets, "sum": value[-2],
+                "count": value[-1]
+            })
+        return result
+
+    def to_prometheus(self) -> str:
+        """
+        Devuelve las métricas en el formato de texto de exposición de Prometheus (versión 0.0.4).
+        """
+        lines = []
+        for name, series in self.snapshot().items():
+            metric = f"{self.prefix}_{name}"
+            if name in _COUNTERS:
+                lines += [f"# HELP {metric} {_COUNTERS[name][0]}", f"# TYPE {metric} counter"]
+                for item in series:
+                    lines.append(f"{metric}{{{self.__labels(item['labels'])}}} {_format_number(item['value'])}")
+                continue
+            lines += [f"# HELP {metric} {_HISTOGRAMS[name][0]}", f"# TYPE {metric} histogram"]
+            for item in series:
+                labels = self.__labels(item["labels"])
+                for bound, count in item["buckets"].items():
+                    lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f"{metric}_sum{{{labels}}} {_format_number(item['sum'])}")
+                lines.append(f"{metric}_count{{{labels}}} {item['count']}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def __labels(labels: dict[str, str]) -> str:
+        return ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
@@ -10,6 +10,7 @@
 #  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
 #  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
+import importlib.util
 import json
 import os
 import random
@@ -25,14 +26,53 @@ from bs4 import BeautifulSoup
 
 from suitetecsa_core import Portal
 
+DEFAULT_PARSER = "html.parser"
+PARSERS = ("html.parser", "lxml", "html5lib")
+
 __various_errors_text = "Se han detectado algunos errores."
+
+# Patrones de los conversores, compilados una sola vez
+_date_pattern = re.compile(r'^\d{2}/\d{2}/\d{4}$')
+_time_pattern = re.compile(r'^(\d+):([0-5]\d):([0-5]\d)$')
+_currency_pattern = re.compile(r'^\$([0-9,]+)(\s[A-Z]+)?$')
+_bytes_units = {"bytes": 1, "kb": 1024, "mb": 1024 ** 2, "gb": 1024 ** 3, "tb": 1024 ** 4}
 __re_fail_reason = {
     Portal.USER: re.compile(r"toastr\.error\('(?P<reason>[^']*?)'\)"),
     Portal.CONNECT: re.compile(r'alert\("(?P<reason>[^"]*?)"\)')
 }
 
 
-def parse_errors(soup: BeautifulSoup, portal: Portal = Portal.USER) -> list[str] | str | None:
+def check_parser(parser: str) -> str:
+    """
+    Verifica que el backend de análisis HTML indicado sea soportado y esté instalado.
+
+    :param parser: El nombre del backend: 'html.parser', 'lxml' o 'html5lib'.
+    :return: El nombre del backend.
+    :raises ValueError: Si el backend no es soportado o no está instalado.
+    """
+    if parser not in PARSERS:
+        raise ValueError(f"El backend '{parser}' no es soportado. Debe ser uno de {PARSERS}.")
+    if parser != "html.parser" and importlib.util.find_spec(parser) is None:
+        raise ValueError(f"El backend '{parser}' no está instalado.")
+    return parser
+
+
+def make_soup(markup: str | bytes, parser: str = None, encoding: str = None) -> BeautifulSoup:
+    """
+    Construye un objeto BeautifulSoup con el backend de análisis HTML indicado.
+
+    :param markup: El contenido HTML a analizar.
+    :param parser: El nombre del backend. Si no se especifica se utiliza `DEFAULT_PARSER`.
+    :param encoding: La codificación de `markup` cuando se recibe en bytes. Si se especifica, el contenido se decodifica
+    directamente con ella en lugar de dejar que BeautifulSoup la detecte.
+    :return: Un objeto BeautifulSoup que representa el contenido HTML.
+    """
+    if encoding is not None and isinstance(markup, bytes):
+        markup = markup.decode(encoding, errors="replace")
+    return BeautifulSoup(markup, parser or DEFAULT_PARSER)
+
+
+def parse_errors(soup: BeautifulSoup, portal: Portal = Portal.USER, parser: str = None) -> list[str] | str | None:
     """
     Toma la última etiqueta de script en el HTML, extrae el texto y luego usa una expresión regular para encontrar el
     mensaje de error.
@@ -41,22 +81,38 @@ def parse_errors(soup: BeautifulSoup, portal: Portal = Portal.USER) -> list[str]
     :type soup: bs4.BeautifulSoup
     :param portal: El portal para buscar errores en
     :type portal: str
+    :param parser: El backend con el que se analiza el fragmento HTML del error. Si no se especifica se utiliza
+    `DEFAULT_PARSER`.
+    :type parser: str
     :return: Una lista de errores.
     """
     tag_script = soup.find_all("script")
     if tag_script:
-        script_text = tag_script[-1].contents[0].strip()
-        match = __re_fail_reason[portal].match(script_text)
-        if match:
-            soup = BeautifulSoup(match.group("reason"), "html5lib")
-            if portal == Portal.USER:
-                error = soup.select_one('li:is(.msg_error)')
-                if error:
-                    return [
-                        msg.text for msg in error.select('li:is(.sub-message)')
-                    ] if soup.text.startswith(__various_errors_text) else error.text
-            else:
-                match.group("reason")
+        return parse_error_script(tag_script[-1].contents[0].strip(), portal, parser)
+
+
+def parse_error_script(
+        script_text: str, portal: Portal = Portal.USER, parser: str = None
+) -> list[str] | str | None:
+    """
+    Extrae el mensaje de error del texto de la última etiqueta de script de una página (ver `parse_errors`).
+
+    :param script_text: El texto del script, sin espacios al principio ni al final.
+    :param portal: El portal al que pertenece la página.
+    :param parser: El backend con el que se analiza el fragmento HTML del error.
+    :return: Una lista de errores, el error o None si el script no contiene ninguno.
+    """
+    match = __re_fail_reason[portal].match(script_text)
+    if match:
+        soup = make_soup(match.group("reason"), parser)
+        if portal == Portal.USER:
+            error = soup.select_one('li:is(.msg_error)')
+            if error:
+                return [
+                    msg.text for msg in error.select('li:is(.sub-message)')
+                ] if soup.text.startswith(__various_errors_text) else error.text
+        else:
+            return match.group("reason")
 
 
 def is_valid_date_format(date_str):
@@ -68,8 +124,7 @@ def is_valid_date_format(date_str):
     :return: True si la cadena tiene el formato correcto, False en caso contrario.
     :rtype: bool
     """
-    pattern = r'^\d{2}/\d{2}/\d{4}$'
-    return bool(re.match(pattern, date_str))
+    return bool(_date_pattern.match(date_str))
 
 
 def is_valid_time_format(time_str):
@@ -113,15 +168,7 @@ def is_valid_time_format(time_str):
     >>> is_valid_time_format('12:34:56 PM')
     False
     """
-
-    # Definimos el patrón regex para el formato "HH:MM:SS"
-    regex_pattern = r'^(\d+):([0-5]\d):([0-5]\d)$'
-
-    # Intentamos hacer match del string con el patrón regex
-    match = re.match(regex_pattern, time_str)
-
-    # Si hay match, la función devuelve True, si no, devuelve False
-    return match is not None
+    return _time_pattern.match(time_str) is not None
 
 
 def str_to_date(date_str):
@@ -134,13 +181,15 @@ def str_to_date(date_str):
     :rtype: datetime.date
     :raises ValueError: Si la cadena proporcionada no tiene el formato correcto o si la fecha no es válida.
     """
-    if not is_valid_date_format(date_str):
+    if not _date_pattern.match(date_str):
         raise ValueError("El formato de la fecha no es válido. Debe ser 'dd/mm/yyyy'.")
     try:
-        date = datetime.datetime.strptime(date_str, '%d/%m/%Y').date()
+        # El patrón también acepta un salto de línea final, que `strptime` rechazaba
+        if len(date_str) != 10:
+            raise ValueError
+        return datetime.date(int(date_str[6:10]), int(date_str[3:5]), int(date_str[:2]))
     except ValueError:
         raise ValueError("La fecha proporcionada no es válida.")
-    return date
 
 
 def date_to_str(date_obj):
@@ -167,8 +216,7 @@ def str_to_float(currency_str):
     :rtype: float
     :raises ValueError: Si la cadena proporcionada no tiene el formato correcto.
     """
-    pattern = r'^\$([0-9,]+)(\s[A-Z]+)?$'
-    match = re.match(pattern, currency_str)
+    match = _currency_pattern.match(currency_str)
     if not match:
         raise ValueError("El formato de la cadena no es válido.")
     amount_str = match.group(1).replace(',', '.')
@@ -186,11 +234,11 @@ def time_string_to_seconds(time_string: str) -> int:
 
     Lanza una excepción ValueError si el formato de tiempo es inválido.
     """
-    if is_valid_time_format(time_string):
-        # Devolver la cantidad total de segundos utilizando una expresión generadora y la función sum()
-        return sum(int(x) * 60 ** i for i, x in enumerate(reversed(time_string.split(":"))))
-    else:
+    match = _time_pattern.match(time_string)
+    if match is None:
         raise ValueError("Invalid time format. The format should be HH:MM:SS.")
+    hours, minutes, seconds = match.groups()
+    return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
 
 
 def seconds_to_time_string(seconds: int) -> str:
@@ -218,15 +266,21 @@ def parse_datetime(string_datetime: str) -> datetime.datetime:
     :raises ValueError: Si la cadena no está en el formato correcto o si la fecha y hora son inválidas.
     """
     try:
-        # Verificar si el formato de la cadena es válido
-        datetime_obj = datetime.datetime.strptime(string_datetime, '%d/%m/%Y %H:%M:%S')
-
-        # Verificar si la fecha y hora son válidas
-        datetime.datetime(datetime_obj.year, datetime_obj.month, datetime_obj.day,
-                          datetime_obj.hour, datetime_obj.minute, datetime_obj.second)
-
-        return datetime_obj
-
+        # Las fechas del portal siempre tienen el formato fijo "dd/mm/aaaa hh:mm:ss", que se lee por posiciones. Las
+        # demás cadenas se delegan en `strptime`, que admite variantes como los campos de una cifra
+        if (
+                len(string_datetime) == 19 and string_datetime.isascii()
+                and string_datetime[2] == string_datetime[5] == "/" and string_datetime[10] == " "
+                and string_datetime[13] == string_datetime[16] == ":"
+                and string_datetime[:2].isdigit() and string_datetime[3:5].isdigit()
+                and string_datetime[6:10].isdigit() and string_datetime[11:13].isdigit()
+                and string_datetime[14:16].isdigit() and string_datetime[17:].isdigit()
+        ):
+            return datetime.datetime(
+                int(string_datetime[6:10]), int(string_datetime[3:5]), int(string_datetime[:2]),
+                int(string_datetime[11:13]), int(string_datetime[14:16]), int(string_datetime[17:])
+            )
+        return datetime.datetime.strptime(string_datetime, '%d/%m/%Y %H:%M:%S')
     except (ValueError, TypeError):
         raise ValueError('Formato de fecha y hora inválido')
 
@@ -241,6 +295,43 @@ def to_string_datetime(datetime_obj: datetime.datetime) -> str:
     return datetime_obj.strftime('%d/%m/%Y %H:%M:%S')
 
 
+def datetime_range(
+        start: datetime.date | datetime.datetime, end: datetime.date | datetime.datetime
+) -> tuple[datetime.datetime, datetime.datetime]:
+    """
+    Convierte los extremos de un rango de fechas en objetos datetime.datetime. Si un extremo es una fecha sin hora,
+    el rango incluye el día completo.
+
+    :param start: La fecha o fecha y hora de inicio del rango.
+    :param end: La fecha o fecha y hora de fin del rango.
+    :return: Una tupla con la fecha y hora de inicio y de fin del rango, ambas incluidas.
+    :raises ValueError: Si el inicio del rango es posterior al fin.
+    """
+    if not isinstance(start, datetime.datetime):
+        start = datetime.datetime.combine(start, datetime.time.min)
+    if not isinstance(end, datetime.datetime):
+        end = datetime.datetime.combine(end, datetime.time.max)
+    if start > end:
+        raise ValueError('El inicio del rango es posterior al fin')
+    return start, end
+
+
+def months_between(start: datetime.date, end: datetime.date) -> list[tuple[int, int]]:
+    """
+    Devuelve los meses comprendidos entre dos fechas, ambos incluidos, en orden cronológico.
+
+    :param start: La fecha de inicio.
+    :param end: La fecha de fin.
+    :return: Una lista de tuplas (año, mes).
+    """
+    months = []
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        months.append((year, month))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
 def convert_from_bytes(size: int) -> str:
     """
     Esta función recibe una cantidad de datos en bytes y la convierte a un formato legible para el usuario,
@@ -294,11 +385,9 @@ def convert_to_bytes(size: str) -> int:
     >>> convert_to_bytes("542.47 KB")
     555008
     """
-    units = {"bytes": 1, "kb": 1024, "mb": 1024 **
-             2, "gb": 1024**3, "tb": 1024**4}
     size = size.split()
     try:
-        return int(float(size[0].replace(",", ".")) * units[size[1].lower()])
+        return int(float(size[0].replace(",", ".")) * _bytes_units[size[1].lower()])
     except (IndexError, KeyError, ValueError):
         raise ValueError(
             "El formato del parámetro size es incorrecto. Debe ser en formato 'X unidad', donde unidad puede ser "
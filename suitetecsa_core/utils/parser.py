@@ -10,10 +10,505 @@
 #  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
 #  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
-import re
-import bs4
+import codecs
+from html.parser import HTMLParser
+from typing import Type
 
-from suitetecsa_core import Portal
+from bs4 import BeautifulSoup, Tag
 
+from suitetecsa_core import Portal, Action
+from suitetecsa_core.core.exceptions import GetInfoException
+from suitetecsa_core.domain.model import ConnectionsSummary, RechargesSummary, TransfersSummary, QuotesPaidSummary, \
+    Connection, Recharge, Transfer, QuotePaid
+from suitetecsa_core.utils.nauta import str_to_float, convert_to_bytes, parse_errors, parse_error_script, \
+    time_string_to_seconds, make_soup
 
+_user_information_keys = [
+    'username', 'blocking_date', 'date_of_elimination',
+    'account_type', 'service_type', 'credit', 'time',
+    'mail_account', 'offer', 'monthly_fee', 'download_speeds',
+    'upload_speeds', 'phone', 'link_identifiers',
+    'link_status', 'activation_date', 'blocking_date_home',
+    'date_of_elimination_home', 'quote_paid', 'voucher', 'debt'
+]
+_connect_information_keys = [
+    "account_status",
+    "credit",
+    "expiration_date",
+    "access_areas",
+    "from",
+    "to",
+    "time"
+]
 
+
+def find_errors(
+        soup: BeautifulSoup, portal_manager: Portal, exception: Type[Exception], message: str, parser: str = None
+) -> None:
+    """
+    Busca errores en una página web y lanza la excepción indicada si los encuentra.
+
+    :param soup: El objeto BeautifulSoup que representa la página web.
+    :param portal_manager: El portal al que pertenece la página web.
+    :param exception: El tipo de excepción que se lanzará.
+    :param message: El mensaje que acompañará a los errores encontrados.
+    :param parser: El backend de análisis HTML a utilizar con el fragmento del error.
+    """
+    errors = parse_errors(soup, portal_manager, parser)
+    if errors:
+        raise exception(f"{message} :: {errors}")
+
+
+def find_script_errors(
+        script_text: str | None, portal_manager: Portal, exception: Type[Exception], message: str, parser: str = None
+) -> None:
+    """
+    Como `find_errors`, pero a partir del texto de la última etiqueta de script de la página, por ejemplo, el
+    `last_script` de un `FormScanner`.
+
+    :param script_text: El texto del script o None si la página no tiene ninguno.
+    """
+    errors = parse_error_script(script_text, portal_manager, parser) if script_text is not None else None
+    if errors:
+        raise exception(f"{message} :: {errors}")
+
+
+def get_inputs(form_soup: Tag) -> dict:
+    """
+    Obtiene los valores de entrada de un formulario HTML dado y los devuelve en un diccionario.
+
+    :param form_soup: El objeto BeautifulSoup que representa el formulario HTML.
+    :type form_soup: bs4.Tag
+    :return: Un diccionario que contiene los valores de entrada del formulario.
+    :rtype: dict
+    """
+    return {
+        _["name"]: _.get("value", default=None)
+        for _ in form_soup.select("input[name]")
+    }
+
+
+def get_csrf(soup: BeautifulSoup) -> str:
+    """
+    Obtiene el valor del token CSRF de una página web y lo devuelve como una cadena.
+
+    :param soup: El objeto BeautifulSoup que representa la página web.
+    :type soup: BeautifulSoup
+    :return: El valor del token CSRF de la página web.
+    :rtype: str
+    """
+    return soup.select_one('input[name=csrf]').attrs["value"]
+
+
+def parse_user_information(soup: BeautifulSoup) -> dict[str, str]:
+    """
+    Extrae la información del usuario de la página `user_info` del portal de usuario.
+
+    :param soup: El objeto BeautifulSoup que representa la página web.
+    :return: Un diccionario con los valores, sin convertir, de cada uno de los campos de la cuenta.
+    """
+    return {
+        _user_information_keys[_index]: attr.select_one('p').text.strip()
+        for _index, attr in enumerate(soup.select_one('.z-depth-1').select('.m6'))
+    }
+
+
+def parse_connect_information(soup: BeautifulSoup) -> dict:
+    """
+    Extrae la información de la cuenta y las últimas conexiones de la respuesta de `EtecsaQueryServlet`. Las filas se
+    buscan tanto dentro de `<tbody>` como directamente bajo la tabla, ya que no todos los backends de análisis HTML
+    insertan el `<tbody>` implícito.
+
+    :param soup: El objeto BeautifulSoup que representa la página web.
+    :return: Un diccionario con las claves `account_info` y `lasts_connections`.
+    """
+    return {
+        'account_info': {
+            _connect_information_keys[count]: value.text.strip()
+            for count, value in enumerate(soup.select(
+                ':is(#sessioninfo > tbody > tr, #sessioninfo > tr) > :not(td.key)'
+            ))
+        },
+        'lasts_connections': [
+            {
+                _connect_information_keys[count + 4]: value.text.strip()
+                for count, value in enumerate(tr.select('td'))
+            } for tr in soup.select(
+                '#sesiontraza > tbody > tr, #sesiontraza > tr'
+            )
+        ]
+    }
+
+
+def get_summary_cards(soup: BeautifulSoup) -> list[Tag]:
+    """
+    Devuelve los divs con la clase card-content de una página de resumen.
+
+    :param soup: El objeto BeautifulSoup que representa la página web.
+    :return: Una lista de elementos div con la clase card-content.
+    """
+    return soup.select_one('#content').select('.card-content')
+
+
+def __get_card_value(card: Tag) -> str:
+    return card.select_one('.card-stats-number').text.strip()
+
+
+def get_summary_cells(summary_html: list[Tag]) -> tuple[str, ...]:
+    """
+    Devuelve los valores, sin convertir, de los divs de una página de resumen: el número de filas del listado, el mes
+    seleccionado y el valor de cada tarjeta, en orden.
+
+    :param summary_html: Los divs con la clase card-content de la página de resumen.
+    :return: Una tupla con el texto de cada valor.
+    """
+    return (
+        summary_html[0].select_one("input[name=count]").attrs["value"],
+        summary_html[0].select_one("input[name=year_month_selected]").attrs["value"],
+        *(__get_card_value(card) for card in summary_html[1:])
+    )
+
+
+def parse_connections_summary_cells(cells: tuple[str, ...]) -> ConnectionsSummary:
+    return ConnectionsSummary(
+        count=int(cells[0]),
+        year_month_selected=cells[1],
+        total_time=time_string_to_seconds(cells[2]),
+        total_import=str_to_float(cells[3]),
+        uploaded=convert_to_bytes(cells[4]),
+        downloaded=convert_to_bytes(cells[5]),
+        total_traffic=convert_to_bytes(cells[6])
+    )
+
+
+def parse_recharges_summary_cells(cells: tuple[str, ...]) -> RechargesSummary:
+    return RechargesSummary(count=int(cells[0]), year_month_selected=cells[1], total_import=str_to_float(cells[2]))
+
+
+def parse_transfers_summary_cells(cells: tuple[str, ...]) -> TransfersSummary:
+    return TransfersSummary(count=int(cells[0]), year_month_selected=cells[1], total_import=str_to_float(cells[2]))
+
+
+def parse_quotes_paid_summary_cells(cells: tuple[str, ...]) -> QuotesPaidSummary:
+    return QuotesPaidSummary(count=int(cells[0]), year_month_selected=cells[1], total_import=str_to_float(cells[2]))
+
+
+def parse_connections_summary(summary_html: list[Tag]) -> ConnectionsSummary:
+    return parse_connections_summary_cells(get_summary_cells(summary_html))
+
+
+def parse_recharges_summary(summary_html: list[Tag]) -> RechargesSummary:
+    return parse_recharges_summary_cells(get_summary_cells(summary_html))
+
+
+def parse_transfers_summary(summary_html: list[Tag]) -> TransfersSummary:
+    return parse_transfers_summary_cells(get_summary_cells(summary_html))
+
+
+def parse_quotes_paid_summary(summary_html: list[Tag]) -> QuotesPaidSummary:
+    return parse_quotes_paid_summary_cells(get_summary_cells(summary_html))
+
+
+class _StopTokenizing(Exception):
+    pass
+
+
+class TableRowsExtractor(HTMLParser):
+    """
+    Extractor incremental de las filas de `.responsive-table`. Emite cada fila como una tupla con el texto de sus
+    celdas y deja de tokenizar en cuanto se cierra el cuerpo de la tabla, sin construir el árbol del documento. Las
+    filas fuera de `<tbody>` se tratan como filas del cuerpo, salvo las de `<thead>` y `<tfoot>`.
+
+    Con `scripts`, se guarda además en `last_script` el texto de la última etiqueta de script, donde el portal de
+    usuario muestra sus errores (ver `parse_error_script`). Como el error va después de la tabla, en ese caso la
+    lectura sigue hasta `</body>`, aunque ya no se recogen más filas.
+    """
+
+    def __init__(self, scripts: bool = False):
+        super().__init__(convert_charrefs=True)
+        self.scripts = scripts
+        self.rows: list[tuple[str, ...]] = []
+        self.found = False
+        self.last_script: str | None = None
+        self.__in_table = False
+        self.__in_tbody = False
+        self.__in_section = False
+        self.__row: list[str] | None = None
+        self.__cell: list[str] | None = None
+        self.__script: list[str] | None = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "script" and self.scripts:
+            self.__script = []
+        elif tag == "table" and not (self.found and self.scripts):
+            self.__in_table = self.found = "responsive-table" in (dict(attrs).get("class") or "").split()
+        elif tag == "tbody" and self.__in_table:
+            self.__in_tbody = True
+        elif tag in ("thead", "tfoot") and self.__in_table:
+            self.__in_section = True
+        elif tag == "tr" and self.__in_table and not self.__in_section:
+            self.__row = []
+        elif tag == "td" and self.__row is not None:
+            self.__cell = []
+
+    def handle_data(self, data):
+        if self.__script is not None:
+            self.__script.append(data)
+        elif self.__cell is not None:
+            self.__cell.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == "script" and self.__script is not None:
+            self.last_script = "".join(self.__script).strip()
+            self.__script = None
+        elif tag == "td" and self.__cell is not None:
+            self.__row.append("".join(self.__cell).strip())
+            self.__cell = None
+        elif tag == "tr" and self.__row is not None:
+            self.rows.append(tuple(self.__row))
+            self.__row = None
+        elif tag in ("thead", "tfoot") and self.__in_section:
+            self.__in_section = False
+        elif (tag == "tbody" and self.__in_tbody) or (tag == "table" and self.__in_table):
+            if not self.scripts:
+                raise _StopTokenizing
+            self.__in_table = self.__in_tbody = False
+            self.__row = self.__cell = None
+        elif tag == "body" and self.scripts:
+            raise _StopTokenizing
+
+
+class FormScanner(HTMLParser):
+    """
+    Lector incremental de los campos `<input>` y la acción de un formulario. Se alimenta con el cuerpo de una respuesta
+    por fragmentos con `scan` y deja de tokenizar en cuanto tiene lo que se le pidió, de modo que el resto del cuerpo
+    puede no descargarse.
+
+    Con `form`, solo se leen los campos del formulario indicado (True para el primero de la página o su id) y la
+    lectura termina al cerrarse el formulario o, antes, en cuanto se tienen su acción y todos los `fields`. Sin `form`,
+    se leen los campos de toda la página y la lectura termina en cuanto se tienen todos los `fields`.
+
+    Con `scripts`, se guarda además en `last_script` el texto de la última etiqueta de script, donde el portal de
+    usuario muestra sus errores (ver `parse_error_script`). Como el error va después del formulario, la lectura sigue
+    aunque ya se tengan los `fields` y termina al llegar a `</body>`.
+    """
+
+    def __init__(
+            self, fields: tuple[str, ...] = (), form: bool | str = False, encoding: str = "utf-8", scripts: bool = False
+    ):
+        """
+        Constructor de la clase.
+
+        :param fields: Los nombres de los campos necesarios.
+        :param form: True para leer el primer formulario de la página, su id para leer uno concreto o False para leer
+        los campos de toda la página.
+        :param encoding: La codificación de los fragmentos que se pasan a `scan`.
+        :param scripts: Si es True, se lee la página hasta `</body>` y se guarda el texto de la última etiqueta de
+        script.
+        """
+        super().__init__(convert_charrefs=True)
+        self.fields = fields
+        self.form = form
+        self.scripts = scripts
+        self.action: str | None = None
+        self.inputs: dict[str, str | None] = {}
+        self.last_script: str | None = None
+        self.done = False
+        self.__decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self.__in_form = False
+        self.__script: list[str] | None = None
+
+    def handle_data(self, data):
+        if self.__script is not None:
+            self.__script.append(data)
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "script" and self.scripts:
+            self.__script = []
+        elif tag == "form" and self.form and self.action is None:
+            attrs = dict(attrs)
+            if self.form is True or attrs.get("id") == self.form:
+                self.__in_form = True
+                self.action = attrs.get("action") or ""
+        elif tag == "input" and (self.__in_form or not self.form):
+            attrs = dict(attrs)
+            if attrs.get("name"):
+                self.inputs[attrs["name"]] = attrs.get("value")
+                if not self.scripts and self.fields and all(field in self.inputs for field in self.fields) and (
+                        not self.form or self.action is not None
+                ):
+                    raise _StopTokenizing
+
+    def handle_endtag(self, tag):
+        if tag == "script" and self.__script is not None:
+            self.last_script = "".join(self.__script).strip()
+            self.__script = None
+        elif tag == "form" and self.__in_form:
+            raise _StopTokenizing
+        elif tag == "body" and self.scripts:
+            raise _StopTokenizing
+
+    def scan(self, chunk: bytes) -> bool:
+        """
+        Analiza el siguiente fragmento del cuerpo.
+
+        :param chunk: El fragmento, en bytes.
+        :return: True si ya se tiene todo lo necesario y no hace falta leer más.
+        """
+        if not self.done:
+            try:
+                self.feed(self.__decoder.decode(chunk))
+            except _StopTokenizing:
+                self.done = True
+        return self.done
+
+
+def extract_table_rows(
+        content: bytes | str, encoding: str = "utf-8", chunk_size: int = 4096, exception: Type[Exception] = None,
+        message: str = None, parser: str = None
+) -> list[tuple[str, ...]] | None:
+    """
+    Extrae las filas de `.responsive-table` de una página de listado sin construir el árbol del documento.
+
+    Si se indica `exception`, se lee también el script de errores del portal de usuario y, si la página contiene
+    alguno, se lanza aunque la página tenga la tabla.
+
+    :param content: El cuerpo de la respuesta, en bytes o ya decodificado.
+    :param encoding: La codificación del cuerpo cuando se recibe en bytes.
+    :param chunk_size: El tamaño de los fragmentos con los que se alimenta el tokenizador.
+    :param exception: La excepción a lanzar si la página contiene un error del portal.
+    :param message: El mensaje de la excepción.
+    :param parser: El backend con el que se analiza el fragmento HTML del error.
+    :return: Una lista de tuplas con el texto de las celdas de cada fila, o None si la página no contiene la tabla.
+    """
+    extractor = TableRowsExtractor(scripts=exception is not None)
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace") if isinstance(content, bytes) else None
+    try:
+        for start in range(0, len(content), chunk_size):
+            chunk = content[start:start + chunk_size]
+            extractor.feed(decoder.decode(chunk) if decoder else chunk)
+        if decoder:
+            extractor.feed(decoder.decode(b"", final=True))
+        extractor.close()
+    except _StopTokenizing:
+        pass
+    if exception is not None:
+        find_script_errors(extractor.last_script, Portal.USER, exception, message, parser)
+    return extractor.rows if extractor.found else None
+
+
+def get_table_rows(table_body: Tag | None, _reversed: bool = False) -> list[tuple[str, ...]]:
+    """
+    Devuelve las filas del cuerpo de una tabla como tuplas con el texto de sus celdas, opcionalmente en orden inverso.
+    Acepta tanto el `<tbody>` como la propia tabla, en cuyo caso se toman también las filas que no estén dentro de un
+    `<tbody>`, como las deja `html.parser` cuando el HTML lo omite.
+
+    :param table_body: El cuerpo de la tabla o la tabla. Si es None se devuelve una lista vacía.
+    :param _reversed: Un valor booleano que indica si las filas deben ser devueltas en orden inverso.
+    :return: Una lista de tuplas con el texto de las celdas de cada fila.
+    """
+    if not table_body:
+        return []
+    rows = [
+        tuple(cell.text.strip() for cell in row.select('td'))
+        for row in table_body.select(':scope > tr, :scope > tbody > tr')
+    ]
+    return [row for row in reversed(rows)] if _reversed else rows
+
+
+def parse_list_page(content: bytes, encoding: str = "utf-8", parser: str = None) -> list[tuple[str, ...]]:
+    """
+    Extrae las filas de una página de listado a partir del cuerpo de la respuesta. El script de errores del portal se
+    comprueba siempre, aunque la página contenga la tabla; si no la contiene, se analiza completa.
+
+    Como el resto de funciones `parse_*_page`, recibe y devuelve solo tipos básicos, de modo que puede ejecutarse en
+    otro proceso.
+
+    :param content: El cuerpo de la respuesta.
+    :param encoding: La codificación del cuerpo.
+    :param parser: El backend de análisis HTML a utilizar si la página no contiene la tabla.
+    :return: Una lista de tuplas con el texto de las celdas de cada fila.
+    :raises GetInfoException: Si la página contiene un error del portal.
+    """
+    rows = extract_table_rows(content, encoding, exception=GetInfoException, message="Fail to obtain information",
+                              parser=parser)
+    if rows is None:
+        soup = make_soup(content, parser, encoding)
+        find_errors(soup, Portal.USER, GetInfoException, "Fail to obtain information", parser)
+        rows = get_table_rows(soup.select_one(".responsive-table"))
+    return rows
+
+
+def parse_summary_page(
+        content: bytes, encoding: str, parser: str, exception: Type[Exception], message: str
+) -> tuple[str, ...]:
+    """
+    Extrae los valores, sin convertir, de una página de resumen a partir del cuerpo de la respuesta.
+
+    :param content: El cuerpo de la respuesta.
+    :param encoding: La codificación del cuerpo.
+    :param parser: El backend de análisis HTML.
+    :param exception: La excepción a lanzar si la página contiene un error del portal.
+    :param message: El mensaje de la excepción.
+    :return: Una tupla como la de `get_summary_cells`.
+    """
+    soup = make_soup(content, parser, encoding)
+    find_errors(soup, Portal.USER, exception, message, parser)
+    return get_summary_cells(get_summary_cards(soup))
+
+
+def parse_user_information_page(
+        content: bytes, encoding: str, parser: str, exception: Type[Exception], message: str
+) -> dict[str, str]:
+    """
+    Extrae la información del usuario a partir del cuerpo de la respuesta de la página `user_info` o del inicio de
+    sesión.
+
+    :param content: El cuerpo de la respuesta.
+    :param encoding: La codificación del cuerpo.
+    :param parser: El backend de análisis HTML.
+    :param exception: La excepción a lanzar si la página contiene un error del portal.
+    :param message: El mensaje de la excepción.
+    :return: Un diccionario como el de `parse_user_information`.
+    """
+    soup = make_soup(content, parser, encoding)
+    find_errors(soup, Portal.USER, exception, message, parser)
+    return parse_user_information(soup)
+
+
+def parse_connection(cells: tuple[str, ...]) -> Connection:
+    return Connection.from_cells(cells)
+
+
+def parse_recharge(cells: tuple[str, ...]) -> Recharge:
+    return Recharge.from_cells(cells)
+
+
+def parse_transfer(cells: tuple[str, ...]) -> Transfer:
+    return Transfer.from_cells(cells)
+
+
+def parse_quote_paid(cells: tuple[str, ...]) -> QuotePaid:
+    return QuotePaid.from_cells(cells)
+
+
+summaries_parsers = {
+    Action.GET_CONNECTIONS: parse_connections_summary,
+    Action.GET_RECHARGES: parse_recharges_summary,
+    Action.GET_TRANSFERS: parse_transfers_summary,
+    Action.GET_QUOTES_PAID: parse_quotes_paid_summary
+}
+
+summaries_cells_parsers = {
+    Action.GET_CONNECTIONS: parse_connections_summary_cells,
+    Action.GET_RECHARGES: parse_recharges_summary_cells,
+    Action.GET_TRANSFERS: parse_transfers_summary_cells,
+    Action.GET_QUOTES_PAID: parse_quotes_paid_summary_cells
+}
+
+rows_parsers = {
+    Action.GET_CONNECTIONS: parse_connection,
+    Action.GET_RECHARGES: parse_recharge,
+    Action.GET_TRANSFERS: parse_transfer,
+    Action.GET_QUOTES_PAID: parse_quote_paid
+}
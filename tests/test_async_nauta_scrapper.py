@@ -0,0 +1,146 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>.
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import datetime
+import json
+import os
+import unittest
+from unittest.mock import patch
+
+from suitetecsa_core import Portal
+from suitetecsa_core.core.exceptions import GetInfoException
+from suitetecsa_core.domain.model import NautaUser, ConnectionsSummary, Connection, Recharge, QuotePaid
+from suitetecsa_core.domain.service.async_nauta_client import AsyncNautaClient
+from suitetecsa_core.repository.async_scrapper_provider import DefaultAsyncNautaScrapper
+from suitetecsa_core.repository.async_session_provider import AsyncNautaSession, AsyncNautaResponse
+from tests.test_default_nauta_scrapper import get_responses, post_responses, _assets_dir, sdl_2023_03_47_html, \
+    recharge_fail_html
+
+
+class FakeAsyncNautaSession(AsyncNautaSession):
+
+    def __init__(self):
+        self.requests = []
+        self.__cookies = {Portal.USER: {}, Portal.CONNECT: {}}
+
+    @property
+    def user_cookies(self) -> dict:
+        return self.__cookies[Portal.USER]
+
+    @user_cookies.setter
+    def user_cookies(self, value: dict):
+        self.__cookies[Portal.USER] = value or {}
+
+    @property
+    def connect_cookies(self) -> dict:
+        return self.__cookies[Portal.CONNECT]
+
+    @connect_cookies.setter
+    def connect_cookies(self, value: dict):
+        self.__cookies[Portal.CONNECT] = value or {}
+
+    async def get(self, portal_manager, url, data=None, parse_response=True):
+        self.requests.append(("GET", url))
+        return AsyncNautaResponse(200, "OK", "https://secure.etecsa.net:8443", get_responses[url].encode())
+
+    async def post(self, portal_manager, url, data=None, parse_response=True):
+        self.requests.append(("POST", url))
+        return AsyncNautaResponse(
+            200, "OK", "http://secure.etecsa.net:8443/online.do?fooo", post_responses[url].encode()
+        )
+
+    async def close(self):
+        pass
+
+
+def load_asset_json(asset_name):
+    with open(os.path.join(_assets_dir, asset_name), "r") as file:
+        return json.load(file)
+
+
+class TestDefaultAsyncNautaScrapper(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.session = FakeAsyncNautaSession()
+        self.nauta_scrapper = DefaultAsyncNautaScrapper(self.session)
+
+    async def test_connect_success(self):
+        await self.nauta_scrapper.connect("user.name@nauta.com.cu", "some_password")
+        self.assertEqual(self.session.csrf_hw, "1fe3ee0634195096337177a0994723fb")
+        self.assertEqual(self.nauta_scrapper.data_session["ATTRIBUTE_UUID"], "B2F6AAB9A9868BABC0BDC6B7A235ABE2")
+
+    async def test_login_success(self):
+        result = await self.nauta_scrapper.login("user.name@nauta.com.cu", "some_password", "some_captcha_code")
+        self.assertEqual(self.session.csrf, "security6416bea61ad2b")
+        self.assertEqual(result, NautaUser.from_dict(load_asset_json("user_info.json")))
+        self.assertTrue(self.nauta_scrapper.is_nauta_home)
+
+    async def test_get_connect_information_success(self):
+        result = await self.nauta_scrapper.get_connect_information("user.name@nauta.com.cu", "some_password")
+        self.assertEqual(result, load_asset_json("user_info_connect.json"))
+
+    async def test_actions_success(self):
+        await self.nauta_scrapper.to_up("1234567890123456")
+        await self.nauta_scrapper.transfer(25.0, "some_password", "user_two.name@nauta.com.cu")
+        await self.nauta_scrapper.change_password("old_password", "new_password")
+        await self.nauta_scrapper.change_email_password("old_password", "new_password")
+
+    async def test_summaries_reuse_cached_csrf(self):
+        await self.nauta_scrapper.get_connections_summary(2023, 3)
+        await self.nauta_scrapper.get_connections_summary(2023, 2)
+        self.assertEqual([method for method, _ in self.session.requests], ["GET", "POST", "POST"])
+
+    async def test_get_connections_summary_success(self):
+        result = await self.nauta_scrapper.get_connections_summary(2023, 3)
+        self.assertEqual(result, ConnectionsSummary.from_dict(load_asset_json("connects_summary_2023_03.json")))
+
+    async def test_get_connections_success(self):
+        result = await self.nauta_scrapper.get_connections(2023, 3)
+        expected_result = [Connection.from_dict(_) for _ in load_asset_json("connects_2023_03.json")]
+        self.assertEqual(result, expected_result)
+
+    async def test_get_connections_reversed_large(self):
+        result = await self.nauta_scrapper.get_connections(2023, 3, large=20, _reversed=True)
+        expected_result = [Connection.from_dict(_) for _ in load_asset_json("connects_2023_03.json")]
+        self.assertEqual(result, list(reversed(expected_result))[:20])
+
+    async def test_get_connections_between(self):
+        expected_result = [Connection.from_dict(_) for _ in load_asset_json("connects_2023_03.json")][::-1]
+        client = AsyncNautaClient(self.nauta_scrapper)
+        result = await client.get_connections_between(datetime.date(2023, 3, 1), datetime.date(2023, 3, 31))
+        self.assertEqual(result, expected_result)
+        result = await client.get_connections_between(expected_result[3].start_session, datetime.date(2023, 3, 31))
+        self.assertEqual(result, expected_result[3:])
+
+    async def test_list_page_with_table_and_portal_error(self):
+        list_url = "https://www.portal.nauta.cu/useraaa/service_detail_list/2023-03/47"
+        with patch.dict(get_responses, {list_url: sdl_2023_03_47_html + recharge_fail_html}):
+            with self.assertRaises(GetInfoException):
+                await self.nauta_scrapper.get_connections(2023, 3)
+
+    async def test_iter_connections_stops_early(self):
+        client = AsyncNautaClient(self.nauta_scrapper)
+        async for connection in client.iter_connections(2023, 3):
+            break
+        expected_result = Connection.from_dict(load_asset_json("connects_2023_03.json")[0])
+        self.assertEqual(connection, expected_result)
+        self.assertEqual(len([url for _, url in self.session.requests if "_list/" in url]), 1)
+
+    async def test_client_get_recharges_and_quotes_paid(self):
+        client = AsyncNautaClient(self.nauta_scrapper)
+        recharges = await client.get_recharges(2023, 3)
+        quotes_paid = await client.get_quotes_paid(2023, 3)
+        self.assertEqual(recharges, [Recharge.from_dict(_) for _ in load_asset_json("recharges_2023_03.json")])
+        self.assertEqual(quotes_paid, [QuotePaid.from_dict(_) for _ in load_asset_json("quotes_paid_2023_03.json")])
+
+
+if __name__ == '__main__':
+    unittest.main()
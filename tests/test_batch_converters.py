@@ -0,0 +1,95 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>.
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import json
+import os
+import unittest
+from unittest.mock import patch
+
+from suitetecsa_core.utils import batch
+from suitetecsa_core.utils.nauta import convert_to_bytes, parse_datetime, str_to_float, time_string_to_seconds
+
+_assets_dir = os.path.join(
+    os.path.dirname(__file__),
+    "assets"
+)
+
+_cases = {
+    "time_string_to_seconds": (
+        time_string_to_seconds, "duration", ["1:00:00", "720:05:09", "01:02:03\n", "999999999999999:59:59"]
+    ),
+    "convert_to_bytes": (convert_to_bytes, "uploaded", ["542.47 KB", "5 mb", "1e3 bytes", "5 MB extra", "\t2 GB"]),
+    "str_to_float": (str_to_float, "import_", ["$46,52 CUP", "$,5", "$46,52\n", "$46", "$1,"]),
+    "parse_datetime": (parse_datetime, "start_session", ["1/3/2023 1:02:03", "29/02/2024 23:59:59"])
+}
+_invalid_values = {
+    "time_string_to_seconds": [":00:00", "00:60:00", "-1:00:00"],
+    "convert_to_bytes": ["5 PB", "MB", "5"],
+    "str_to_float": ["$1,2,3", "46,52", "$46,52 cup", "$46.52", "$.5", "$,", "$46.52 CUP"],
+    "parse_datetime": ["29/02/2023 10:20:30", "01/03/2023 24:00:00", "01/03/2023 10:20:60", "+1/03/2023 10:20:30"]
+}
+
+
+class TestBatchConverters(unittest.TestCase):
+
+    def setUp(self):
+        with open(os.path.join(_assets_dir, "connects_2023_03.json"), "r") as file:
+            self.rows = json.load(file)
+
+    def run_with_and_without_numpy(self, test):
+        backends = [("numpy", batch.numpy), ("python", None)] if batch.numpy else [("python", None)]
+        for name, module in backends:
+            with self.subTest(backend=name), patch.object(batch, "numpy", module):
+                test()
+
+    def test_same_results_as_scalar_converters(self):
+        for name, (converter, key, extra_values) in _cases.items():
+            values = [row[key] for row in self.rows]
+            for case_values in (values, values + extra_values, []):
+                def test():
+                    self.assertEqual(
+                        list(getattr(batch, f"batch_{name}")(case_values)), [converter(value) for value in case_values]
+                    )
+                with self.subTest(converter=name, values=case_values[-1:]):
+                    self.run_with_and_without_numpy(test)
+
+    def test_numpy_dtypes(self):
+        if batch.numpy is None:
+            self.skipTest("numpy is not installed")
+        self.assertEqual(batch.batch_time_string_to_seconds(["00:06:18"]).dtype, batch.numpy.int64)
+        self.assertEqual(batch.batch_convert_to_bytes(["16,63 MB"]).dtype, batch.numpy.int64)
+        self.assertEqual(batch.batch_str_to_float(["$1,26"]).dtype, batch.numpy.float64)
+        self.assertEqual(
+            batch.batch_parse_datetime(["18/03/2023 12:58:10"])[0], batch.numpy.datetime64("2023-03-18T12:58:10")
+        )
+
+    def test_invalid_values_raise_scalar_errors(self):
+        for name, (converter, key, _) in _cases.items():
+            for value in _invalid_values[name]:
+                with self.assertRaises(ValueError) as expected:
+                    converter(value)
+
+                def test():
+                    with self.assertRaises(ValueError) as context:
+                        getattr(batch, f"batch_{name}")([self.rows[0][key], value])
+                    self.assertEqual(str(context.exception), str(expected.exception))
+                with self.subTest(converter=name, value=value):
+                    self.run_with_and_without_numpy(test)
+
+    def test_large_hours_do_not_overflow(self):
+        if batch.numpy is None:
+            self.skipTest("numpy is not installed")
+        with self.assertRaises(OverflowError):
+            batch.batch_time_string_to_seconds(["999999999999999999:00:00"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>.
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import json
+import unittest
+from unittest.mock import patch
+
+from benchmarks import decoding, load, parse_executor, pipeline, suite, traffic
+from suitetecsa_core.repository.session_provider import TransportConfig
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+
+    def test_every_case_runs(self):
+        for name, func in suite.make_cases().items():
+            with self.subTest(case=name):
+                self.assertIsNotNone(func())
+
+    def test_report_is_json_serializable(self):
+        report = json.loads(json.dumps(suite.run(number=1, repeat=1, selected="summary")))
+        self.assertEqual(len(report["results"]), 4)
+        for result in report["results"].values():
+            self.assertGreater(result["ops_per_sec"], 0)
+            self.assertGreater(result["alloc_peak_bytes"], 0)
+
+    def test_compare_detects_regressions(self):
+        baseline = {"results": {"a": {"ops_per_sec": 100.0}, "b": {"ops_per_sec": 100.0}}}
+        report = {"results": {"a": {"ops_per_sec": 95.0}, "b": {"ops_per_sec": 80.0}, "c": {"ops_per_sec": 1.0}}}
+        self.assertEqual(suite.compare(report, baseline, 0.1), ["b"])
+
+
+class TestLoadHarness(unittest.TestCase):
+
+    def test_report(self):
+        report = json.loads(json.dumps(load.run(accounts=3, concurrency=2, iterations=2, rows=20)))
+        self.assertEqual(report["totals"]["errors"], 0)
+        self.assertEqual(report["results"]["connect"]["count"], 6)
+        self.assertEqual(report["results"]["remaining_time"]["count"], 6 * load.DEFAULT_MIX["remaining_time"])
+        self.assertEqual(report["results"]["history"]["count"], 6 * load.DEFAULT_MIX["history"])
+        for result in report["results"].values():
+            self.assertLessEqual(result["p50_seconds"], result["p95_seconds"])
+            self.assertLessEqual(result["p95_seconds"], result["p99_seconds"])
+
+    def test_errors_are_counted(self):
+        report = load.run(accounts=1, concurrency=1, iterations=1, error_rate=1.0, transport=TransportConfig(retries=0))
+        self.assertEqual(report["results"]["connect"]["errors"], 1)
+        self.assertNotIn("remaining_time", report["results"])
+
+    def test_percentile(self):
+        self.assertIsNone(load.percentile([], 0.5))
+        self.assertEqual(load.percentile([1.0, 2.0, 3.0, 4.0, 5.0], 0.5), 3.0)
+        self.assertAlmostEqual(load.percentile([1.0, 2.0], 0.95), 1.95)
+
+    def test_compare_detects_regressions(self):
+        baseline = {"totals": {"ops_per_sec": 100.0}, "results": {"login": {"p95_seconds": 0.1}}}
+        report = {"totals": {"ops_per_sec": 95.0}, "results": {"login": {"p95_seconds": 0.2}}}
+        self.assertEqual(load.compare(report, baseline, 0.1), ["login p95"])
+
+
+class TestPipelineBenchmark(unittest.TestCase):
+
+    def test_report(self):
+        report = json.loads(json.dumps(pipeline.run(rows=60, latency=0.0, prefetch=[1, 2], repeat=1)))
+        self.assertEqual(report["environment"]["pages"], 5)
+        self.assertEqual(list(report["results"]), ["sequential", "pipeline_1", "pipeline_2"])
+        self.assertEqual(report["results"]["sequential"]["speedup"], 1.0)
+
+
+class TestParseExecutorBenchmark(unittest.TestCase):
+
+    def test_report(self):
+        report = json.loads(json.dumps(parse_executor.run(accounts=2, threads=2, rows=20, workers=[1])))
+        self.assertEqual(list(report["results"]), ["threads", "processes_1"])
+        self.assertGreater(report["results"]["processes_1"]["accounts_per_sec"], 0)
+
+    def test_default_workers(self):
+        for cpus, expected_result in ((1, [1]), (2, [1, 2]), (6, [1, 2, 4, 6]), (8, [1, 2, 4, 8])):
+            with self.subTest(cpus=cpus), patch("os.cpu_count", return_value=cpus):
+                self.assertEqual(parse_executor.default_workers(), expected_result)
+
+
+class TestDecodingBenchmark(unittest.TestCase):
+
+    def test_report(self):
+        report = json.loads(json.dumps(decoding.run(number=1)))
+        self.assertIn("user_info.html", report["results"])
+        for result in report["results"].values():
+            self.assertEqual(set(decoding.VARIANTS) - set(result), set())
+
+
+class TestTrafficBenchmark(unittest.TestCase):
+
+    def test_report(self):
+        results = json.loads(json.dumps(traffic.run(rows=20)))["results"]
+        self.assertEqual(list(results), ["get", "head", "get_gzip", "head_gzip"])
+        self.assertLess(
+            results["head"]["actions"]["check_connection"]["total"],
+            results["get"]["actions"]["check_connection"]["total"]
+        )
+        self.assertLess(results["get_gzip"]["bytes_total"], results["get"]["bytes_total"])
+        for result in results.values():
+            self.assertEqual(result["bytes_total"], sum(action["total"] for action in result["actions"].values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>.
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from suitetecsa_core import Action, NautaClient
+from suitetecsa_core.repository.cache_provider import MemoryCacheBackend, DiskCacheBackend, HistoryCache
+
+
+class TestCacheBackends(unittest.TestCase):
+
+    def test_memory_backend_evicts_least_recently_used(self):
+        backend = MemoryCacheBackend(max_size=2)
+        backend.set("a", 1)
+        backend.set("b", 2)
+        backend.get("a")
+        backend.set("c", 3)
+        self.assertEqual((backend.get("a"), backend.get("b"), backend.get("c")), (1, None, 3))
+
+    def test_memory_backend_expires_values(self):
+        backend = MemoryCacheBackend()
+        with patch("suitetecsa_core.repository.cache_provider.time.monotonic", return_value=100):
+            backend.set("a", 1, ttl=10)
+        with patch("suitetecsa_core.repository.cache_provider.time.monotonic", return_value=111):
+            self.assertIsNone(backend.get("a"))
+
+    def test_disk_backend_roundtrip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            DiskCacheBackend(directory).set("a", [1, 2, 3])
+            self.assertEqual(DiskCacheBackend(directory).get("a"), [1, 2, 3])
+            DiskCacheBackend(directory).clear()
+            self.assertIsNone(DiskCacheBackend(directory).get("a"))
+
+    def test_closed_months_do_not_expire(self):
+        cache = HistoryCache(current_month_ttl=60)
+        today = date.today()
+        self.assertIsNone(cache.ttl(today.year - 1, 12))
+        self.assertEqual(cache.ttl(today.year, today.month), 60)
+
+    def test_stats_are_thread_safe(self):
+        cache = HistoryCache()
+        cache.set("user", Action.GET_CONNECTIONS, 2023, 3, "summary", 1)
+
+        def lookups():
+            for _ in range(2000):
+                cache.get("user", Action.GET_CONNECTIONS, 2023, 3, "summary")
+                cache.get("user", Action.GET_CONNECTIONS, 2023, 4, "summary")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for future in [executor.submit(lookups) for _ in range(8)]:
+                future.result()
+        self.assertEqual(cache.stats, {"hits": 16000, "misses": 16000})
+
+
+class TestNautaClientCache(unittest.TestCase):
+
+    def setUp(self):
+        self.scrapper = MagicMock()
+        self.scrapper.get_connections_summary.return_value = MagicMock(count=3)
+        self.scrapper.get_connections.return_value = [1, 2, 3]
+        self.client = NautaClient(self.scrapper, HistoryCache())
+        self.client.credentials = ("user.name@nauta.com.cu", "some_password")
+
+    def test_closed_month_is_fetched_once(self):
+        for _ in range(3):
+            self.client.get_connections_summary(2023, 3)
+            self.assertEqual(self.client.get_connections(2023, 3), [1, 2, 3])
+        self.assertEqual(self.scrapper.get_connections_summary.call_count, 1)
+        self.assertEqual(self.scrapper.get_connections.call_count, 1)
+
+    def test_large_and_reversed_are_applied_to_cached_list(self):
+        self.client.get_connections(2023, 3)
+        self.assertEqual(self.client.get_connections(2023, 3, large=2, _reversed=True), [3, 2])
+        self.assertEqual(self.client.get_connections(2023, 3, large=2), [1, 2])
+        self.assertEqual(self.scrapper.get_connections.call_count, 1)
+
+    def test_keys_include_username(self):
+        self.client.get_connections_summary(2023, 3)
+        self.client.credentials = ("user_two.name@nauta.com.cu", "some_password")
+        self.client.get_connections_summary(2023, 3)
+        self.assertEqual(self.scrapper.get_connections_summary.call_count, 2)
+        self.assertIsNotNone(
+            self.client.cache.get("user.name@nauta.com.cu", Action.GET_CONNECTIONS, 2023, 3, "summary")
+        )
+
+    def test_clients_without_credentials_do_not_share_entries(self):
+        self.client.credentials = (None, None)
+        for _ in range(2):
+            self.client.get_connections(2023, 3)
+        self.assertEqual(self.scrapper.get_connections.call_count, 2)
+        with self.assertRaises(ValueError):
+            HistoryCache.make_key(None, Action.GET_CONNECTIONS, 2023, 3, "list")
+
+    def test_cached_models_are_copies(self):
+        self.scrapper.get_connections.return_value = [SimpleNamespace(uploaded=1), SimpleNamespace(uploaded=2)]
+        first = self.client.get_connections(2023, 3)
+        first[0].uploaded = 100
+        first.append(SimpleNamespace(uploaded=3))
+        second = self.client.get_connections(2023, 3)
+        self.assertEqual([row.uploaded for row in second], [1, 2])
+        second[1].uploaded = 200
+        self.assertEqual([row.uploaded for row in self.client.get_connections(2023, 3)], [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
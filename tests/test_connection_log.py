@@ -0,0 +1,78 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>.
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import datetime
+import json
+import os
+import unittest
+from unittest.mock import patch
+
+from suitetecsa_core.domain.model import Connection, ConnectionLog
+from suitetecsa_core.domain.model import connection_log
+
+_assets_dir = os.path.join(
+    os.path.dirname(__file__),
+    "assets"
+)
+
+
+class TestConnectionLog(unittest.TestCase):
+
+    def setUp(self):
+        with open(os.path.join(_assets_dir, "connects_2023_03.json"), "r") as file:
+            self.connections = [Connection.from_dict(connection_dict) for connection_dict in json.load(file)]
+        self.log = ConnectionLog.from_connections(self.connections)
+
+    def run_with_and_without_numpy(self, test):
+        backends = [("numpy", connection_log.numpy), ("python", None)] if connection_log.numpy else [("python", None)]
+        for name, module in backends:
+            with self.subTest(backend=name), patch.object(connection_log, "numpy", module):
+                test()
+
+    def test_roundtrip(self):
+        self.assertEqual(len(self.log), len(self.connections))
+        self.assertEqual(self.log.to_connections(), self.connections)
+
+    def test_totals(self):
+        def test():
+            self.assertEqual(self.log.total_duration, sum(c.duration for c in self.connections))
+            self.assertEqual(self.log.total_traffic, sum(c.uploaded + c.downloaded for c in self.connections))
+            self.assertIsInstance(self.log.total_traffic, int)
+            self.assertAlmostEqual(self.log.total_import, sum(c.import_ for c in self.connections))
+            self.assertEqual(ConnectionLog().total_import, 0)
+        self.run_with_and_without_numpy(test)
+
+    def test_between(self):
+        start = datetime.datetime(2023, 3, 10)
+        end = datetime.datetime(2023, 3, 20, 23, 59, 59)
+        expected_result = [c for c in self.connections if start <= c.start_session <= end]
+        self.run_with_and_without_numpy(
+            lambda: self.assertEqual(self.log.between(start, end).to_connections(), expected_result)
+        )
+
+    def test_group_by_day(self):
+        expected_result = {}
+        for c in self.connections:
+            group = expected_result.setdefault(c.start_session.date(), [0, 0])
+            group[0] += 1
+            group[1] += c.downloaded
+
+        def test():
+            groups = self.log.group_by_day()
+            self.assertEqual(list(groups), sorted(expected_result))
+            self.assertEqual(
+                {day: [group["count"], group["downloaded"]] for day, group in groups.items()}, expected_result
+            )
+        self.run_with_and_without_numpy(test)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,14 +9,25 @@
 #  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
 #  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
 #  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import datetime
 import json
 import os
+import re
 import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 from unittest.mock import MagicMock, patch
 
 from suitetecsa_core.domain.model import NautaUser, ConnectionsSummary, Connection, RechargesSummary, Recharge, \
     TransfersSummary, Transfer, QuotesPaidSummary, QuotePaid
 from suitetecsa_core.repository.session_provider import DefaultNautaSession
+from suitetecsa_core import Portal
+from suitetecsa_core.core.exceptions import LoginException, RechargeException, ChangePasswordException, \
+    ConnectionException, GetInfoException, PreLoginException
+from suitetecsa_core.utils.nauta import PARSERS, check_parser, parse_errors
+from suitetecsa_core.utils.parser import extract_table_rows, get_table_rows, get_inputs, FormScanner, \
+    parse_connect_information, TableRowsExtractor, _StopTokenizing
 
 myPath = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, myPath + '/../')
@@ -46,6 +57,7 @@ connect_info_html = read_asset("user_info_connect.html")
 
 # html content files for Portal.USER
 csrf_token_html = read_asset('csrf_token.html')
+csrf_token_fail_html = read_asset('csrf_token_fail.html')
 
 user_info_html = read_asset('user_info.html')
 
@@ -106,29 +118,34 @@ get_responses = {
 }
 
 
+def make_response(text: str, url: str, status_code: int = 200) -> MagicMock:
+    content = text.encode()
+    return MagicMock(
+        status_code=status_code, ok=status_code < 400, text=text, content=content, encoding="utf-8", url=url,
+        iter_content=lambda chunk_size=1: (content[i:i + chunk_size] for i in range(0, len(content), chunk_size))
+    )
+
+
 class TestDefaultNautaScrapper(unittest.TestCase):
 
     @patch('requests.Session')
     def setUp(self, MockSession):
         # Simulando comportamiento de la clase Session()
         session = MockSession()
-        response_post = MagicMock(status_code=200, text="", url="http://secure.etecsa.net:8443/online.do?fooo")
-        response_get = MagicMock(status_code=200, text="", url="https://secure.etecsa.net:8443")
 
-        def post_side_effect(url: str, data: dict = None):
-            response_post.text = post_responses[url]
-            return response_post
+        def post_side_effect(url: str, data: dict = None, stream: bool = False):
+            return make_response(post_responses[url], "http://secure.etecsa.net:8443/online.do?fooo")
 
-        def get_side_effect(url: str, data: dict = None):
-            response_get.text = get_responses[url]
-            return response_get
+        def get_side_effect(url: str, data: dict = None, stream: bool = False):
+            return make_response(get_responses[url], "https://secure.etecsa.net:8443")
 
         session.post = MagicMock(side_effect=post_side_effect)
         session.get = MagicMock(side_effect=get_side_effect)
 
-        nauta_session = DefaultNautaSession(session)
-        scrapper = BeautifulSoup()
-        self.nauta_scrapper = DefaultNautaScrapper(scrapper, nauta_session)
+        self.session = session
+        self.nauta_session = DefaultNautaSession(session)
+        self.scrapper = BeautifulSoup()
+        self.nauta_scrapper = DefaultNautaScrapper(self.scrapper, self.nauta_session)
 
         self.form_html = '<form><input type="text" name="username" value="John"><input type="password" ' \
                          'name="password"></form>'
@@ -159,6 +176,16 @@ class TestDefaultNautaScrapper(unittest.TestCase):
         result = self.nauta_scrapper._DefaultNautaScrapper__session._csrf
         self.assertEqual(result, expected_result, "El resultado no es el esperado.")
 
+    def test_csrf_pages_with_portal_errors(self):
+        login_url = "https://www.portal.nauta.cu/user/login/es-es"
+        recharge_url = "https://www.portal.nauta.cu/useraaa/recharge_account"
+        with patch.dict(get_responses, {login_url: csrf_token_fail_html, recharge_url: csrf_token_fail_html}):
+            with self.assertRaises(PreLoginException):
+                self.nauta_scrapper._DefaultNautaScrapper__user_session_init()
+            with self.assertRaises(RechargeException):
+                self.nauta_scrapper._DefaultNautaScrapper__get_cached_csrf(recharge_url, RechargeException, "Fail")
+        self.assertIsNone(self.nauta_session.csrf_cache.get(recharge_url))
+
     def test_connect_success(self):
         expected_result = "B2F6AAB9A9868BABC0BDC6B7A235ABE2"
         self.nauta_scrapper.connect("user.name@nauta.com.cu", "some_password")
@@ -193,6 +220,37 @@ class TestDefaultNautaScrapper(unittest.TestCase):
     def test_change_password_email_success(self):
         self.nauta_scrapper.change_email_password("old_password", "new_password")
 
+    def test_to_up_reuses_cached_csrf(self):
+        self.nauta_scrapper.to_up("1234567890123456")
+        self.nauta_scrapper.to_up("1234567890123456")
+        self.assertEqual(self.session.get.call_count, 1)
+        self.assertEqual(self.session.post.call_count, 2)
+        self.assertEqual(self.nauta_session.csrf_cache.saved_requests, 1)
+
+    def test_rejected_csrf_is_refreshed_once(self):
+        url = "https://www.portal.nauta.cu/useraaa/recharge_account"
+        self.nauta_scrapper.to_up("1234567890123456")
+        self.session.post.side_effect = [
+            make_response("The action you have requested is not allowed.", url, 403),
+            make_response(post_responses[url], url)
+        ]
+        self.nauta_scrapper.to_up("1234567890123456")
+        self.assertEqual(self.session.get.call_count, 2)
+        self.assertEqual(self.nauta_session.csrf_cache.invalidations, 1)
+
+    def test_rejected_csrf_is_not_retried_twice(self):
+        url = "https://www.portal.nauta.cu/useraaa/recharge_account"
+        self.session.post.side_effect = lambda *args, **kwargs: make_response("", url, 403)
+        with self.assertRaises(ConnectionException):
+            self.nauta_scrapper.to_up("1234567890123456")
+        self.assertEqual(self.session.post.call_count, 2)
+
+    def test_logout_invalidates_csrf_cache(self):
+        self.nauta_scrapper.to_up("1234567890123456")
+        self.nauta_scrapper.logout()
+        self.nauta_scrapper.to_up("1234567890123456")
+        self.assertEqual(self.session.get.call_count, 2)
+
     def test_get_connections_summary_success(self):
         result = self.nauta_scrapper.get_connections_summary(2023, 3)
         with open(os.path.join(_assets_dir, "connects_summary_2023_03.json"), "r") as file:
@@ -237,6 +295,398 @@ class TestDefaultNautaScrapper(unittest.TestCase):
             expected_result = [QuotePaid.from_dict(quote_paid_dict) for quote_paid_dict in json.load(file)]
             self.assertEqual(result, expected_result, "El resultado no es el esperado.")
 
+    def test_get_connections_concurrent_success(self):
+        nauta_scrapper = DefaultNautaScrapper(self.scrapper, self.nauta_session, max_workers=4)
+        result = nauta_scrapper.get_connections(2023, 3)
+        with open(os.path.join(_assets_dir, "connects_2023_03.json"), "r") as file:
+            expected_result = [Connection.from_dict(connection_dict) for connection_dict in json.load(file)]
+            self.assertEqual(result, expected_result, "El resultado no es el esperado.")
+
+    def test_get_connections_concurrent_reversed_large(self):
+        with open(os.path.join(_assets_dir, "connects_2023_03.json"), "r") as file:
+            expected_result = [Connection.from_dict(connection_dict) for connection_dict in json.load(file)]
+        nauta_scrapper = DefaultNautaScrapper(self.scrapper, self.nauta_session, max_workers=4)
+        result = nauta_scrapper.get_connections(2023, 3, large=20, _reversed=True)
+        self.assertEqual(result, list(reversed(expected_result))[:20], "El resultado no es el esperado.")
+
+    def test_get_connections_between(self):
+        with open(os.path.join(_assets_dir, "connects_2023_03.json"), "r") as file:
+            expected_result = [Connection.from_dict(connection_dict) for connection_dict in json.load(file)]
+        expected_result.reverse()
+        start, end = expected_result[3].start_session, expected_result[-3].start_session
+        for max_workers in (1, 4):
+            with self.subTest(max_workers=max_workers):
+                nauta_scrapper = DefaultNautaScrapper(self.scrapper, self.nauta_session, max_workers=max_workers)
+                self.assertEqual(
+                    nauta_scrapper.get_connections_between(datetime.date(2023, 3, 1), datetime.date(2023, 3, 31)),
+                    expected_result
+                )
+                self.assertEqual(nauta_scrapper.get_connections_between(start, end), expected_result[3:-2])
+
+    def test_iter_connections(self):
+        with open(os.path.join(_assets_dir, "connects_2023_03.json"), "r") as file:
+            expected_result = [Connection.from_dict(connection_dict) for connection_dict in json.load(file)]
+        self.assertEqual(list(self.nauta_scrapper.iter_connections(2023, 3)), expected_result)
+        self.assertEqual(list(self.nauta_scrapper.iter_connections(2023, 3, _reversed=True)), expected_result[::-1])
+
+    def test_iter_connections_fetches_pages_lazily(self):
+        connections = self.nauta_scrapper.iter_connections(2023, 3, _reversed=True)
+        self.assertEqual(self.session.get.call_count, 0)
+        next(connections)
+        list_calls = [call for call in self.session.get.call_args_list if "_list/" in call.args[0]]
+        self.assertEqual([call.args[0] for call in list_calls],
+                         ["https://www.portal.nauta.cu/useraaa/service_detail_list/2023-03/47/4"])
+
+    def test_get_pages_to_fetch(self):
+        get_pages_to_fetch = self.nauta_scrapper._get_pages_to_fetch
+        self.assertEqual(get_pages_to_fetch(47, 47), [1, 2, 3, 4])
+        self.assertEqual(get_pages_to_fetch(47, 15), [1, 2])
+        self.assertEqual(get_pages_to_fetch(47, 6, True), [4, 3])
+        self.assertEqual(get_pages_to_fetch(47, 5, True), [4])
+
+    def test_max_workers_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            DefaultNautaScrapper(self.scrapper, self.nauta_session, max_workers=0)
+
+    def test_pipeline_produces_identical_results(self):
+        sequential = DefaultNautaScrapper(self.scrapper, self.nauta_session, pipeline=False)
+        for prefetch_pages in (1, 2, 8):
+            with self.subTest(prefetch_pages=prefetch_pages):
+                nauta_scrapper = DefaultNautaScrapper(self.scrapper, self.nauta_session, prefetch_pages=prefetch_pages)
+                self.assertEqual(nauta_scrapper.get_connections(2023, 3), sequential.get_connections(2023, 3))
+                self.assertEqual(
+                    nauta_scrapper.get_connections(2023, 3, large=20, _reversed=True),
+                    sequential.get_connections(2023, 3, large=20, _reversed=True)
+                )
+                self.assertEqual(
+                    nauta_scrapper.get_connections_between(datetime.date(2023, 3, 1), datetime.date(2023, 3, 31)),
+                    sequential.get_connections_between(datetime.date(2023, 3, 1), datetime.date(2023, 3, 31))
+                )
+
+    def test_pipeline_keeps_one_request_in_flight(self):
+        in_flight, max_in_flight = [0], [0]
+        get_side_effect = self.session.get.side_effect
+
+        def slow_get(url: str, data: dict = None, **kwargs):
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+            time.sleep(0.01)
+            in_flight[0] -= 1
+            return get_side_effect(url, data, **kwargs)
+
+        self.session.get.side_effect = slow_get
+        self.nauta_scrapper.get_connections(2023, 3)
+        self.assertEqual(max_in_flight[0], 1)
+        self.assertFalse([thread for thread in threading.enumerate() if thread.name == "nauta-prefetch"])
+
+    def test_pipeline_raises_fetch_errors(self):
+        get_side_effect = self.session.get.side_effect
+        failing_url = "https://www.portal.nauta.cu/useraaa/service_detail_list/2023-03/47/2"
+
+        def get(url: str, data: dict = None, **kwargs):
+            if url == failing_url:
+                return make_response("", url, 500)
+            return get_side_effect(url, data, **kwargs)
+
+        self.session.get.side_effect = get
+        with self.assertRaises(ConnectionException):
+            self.nauta_scrapper.get_connections(2023, 3)
+        list_urls = [call.args[0] for call in self.session.get.call_args_list if "_list/" in call.args[0]]
+        self.assertEqual(list_urls[-1], failing_url)
+        self.assertFalse([thread for thread in threading.enumerate() if thread.name == "nauta-prefetch"])
+
+    def test_pipeline_stops_fetching_on_parse_errors(self):
+        list_url = "https://www.portal.nauta.cu/useraaa/service_detail_list/2023-03/47"
+        get_side_effect = self.session.get.side_effect
+
+        def get(url: str, data: dict = None, **kwargs):
+            if url == list_url:
+                return make_response(sdl_2023_03_47_html + recharge_fail_html, url)
+            return get_side_effect(url, data, **kwargs)
+
+        self.session.get.side_effect = get
+        nauta_scrapper = DefaultNautaScrapper(self.scrapper, self.nauta_session, prefetch_pages=1)
+        with self.assertRaises(GetInfoException):
+            nauta_scrapper.get_connections(2023, 3)
+        self.assertFalse([thread for thread in threading.enumerate() if thread.name == "nauta-prefetch"])
+
+    def test_prefetch_pages_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            DefaultNautaScrapper(self.scrapper, self.nauta_session, prefetch_pages=0)
+
+    def test_connection_probe_must_be_supported(self):
+        with self.assertRaises(ValueError):
+            DefaultNautaScrapper(self.scrapper, self.nauta_session, connection_probe="options")
+
+    def test_parse_executor_produces_identical_results(self):
+        def run(nauta_scrapper):
+            return [
+                nauta_scrapper.login("user.name@nauta.com.cu", "some_password", "some_captcha_code"),
+                nauta_scrapper.get_connections_summary(2023, 3),
+                nauta_scrapper.get_quotes_paid_summary(2023, 3),
+                nauta_scrapper.get_connections(2023, 3),
+                nauta_scrapper.get_recharges(2023, 3),
+                nauta_scrapper.get_connections_between(datetime.date(2023, 3, 1), datetime.date(2023, 3, 31))
+            ]
+
+        expected_result = run(self.nauta_scrapper)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            nauta_scrapper = DefaultNautaScrapper(self.scrapper, self.nauta_session, parse_executor=executor)
+            self.assertEqual(run(nauta_scrapper), expected_result)
+
+    def test_pages_are_parsed_from_content(self):
+        expected_result = [
+            self.nauta_scrapper.login("user.name@nauta.com.cu", "some_password", "some_captcha_code"),
+            self.nauta_scrapper.get_connections_summary(2023, 3),
+            self.nauta_scrapper.get_connections(2023, 3)
+        ]
+
+        def without_text(side_effect):
+            def request(url: str, data: dict = None, **kwargs):
+                response = side_effect(url, data, **kwargs)
+                response.text = "<html></html>"
+                return response
+            return request
+
+        self.session.get.side_effect = without_text(self.session.get.side_effect)
+        self.session.post.side_effect = without_text(self.session.post.side_effect)
+        self.nauta_session.csrf_cache.invalidate()
+        self.assertEqual([
+            self.nauta_scrapper.login("user.name@nauta.com.cu", "some_password", "some_captcha_code"),
+            self.nauta_scrapper.get_connections_summary(2023, 3),
+            self.nauta_scrapper.get_connections(2023, 3)
+        ], expected_result)
+
+    def test_parse_executor_raises_portal_errors(self):
+        summary_url = "https://www.portal.nauta.cu/useraaa/service_detail_summary/"
+        post_side_effect = self.session.post.side_effect
+
+        def post(url: str, data: dict = None, **kwargs):
+            if url == summary_url:
+                return make_response(recharge_fail_html, url)
+            return post_side_effect(url, data, **kwargs)
+
+        self.session.post.side_effect = post
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            nauta_scrapper = DefaultNautaScrapper(self.scrapper, self.nauta_session, parse_executor=executor)
+            with self.assertRaises(GetInfoException):
+                nauta_scrapper.get_connections_summary(2023, 3)
+
+    def test_parse_executor_raises_portal_errors_on_pages_with_content(self):
+        summary_url = "https://www.portal.nauta.cu/useraaa/service_detail_summary/"
+        list_url = "https://www.portal.nauta.cu/useraaa/service_detail_list/2023-03/47"
+        get_side_effect = self.session.get.side_effect
+        post_side_effect = self.session.post.side_effect
+
+        def get(url: str, data: dict = None, **kwargs):
+            if url == list_url:
+                return make_response(sdl_2023_03_47_html + recharge_fail_html, url)
+            return get_side_effect(url, data, **kwargs)
+
+        def post(url: str, data: dict = None, **kwargs):
+            if url == summary_url and data.get("year_month") == "2023-02":
+                return make_response(sd_summary + recharge_fail_html, url)
+            return post_side_effect(url, data, **kwargs)
+
+        self.session.get.side_effect = get
+        self.session.post.side_effect = post
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            nauta_scrapper = DefaultNautaScrapper(self.scrapper, self.nauta_session, parse_executor=executor)
+            with self.assertRaises(GetInfoException):
+                nauta_scrapper.get_connections(2023, 3)
+            with self.assertRaises(GetInfoException):
+                nauta_scrapper.get_connections_summary(2023, 2)
+
+    def test_list_page_with_table_and_portal_error(self):
+        list_url = "https://www.portal.nauta.cu/useraaa/service_detail_list/2023-03/47"
+        get_side_effect = self.session.get.side_effect
+
+        def get(url: str, data: dict = None, **kwargs):
+            if url == list_url:
+                return make_response(sdl_2023_03_47_html + recharge_fail_html, url)
+            return get_side_effect(url, data, **kwargs)
+
+        self.session.get.side_effect = get
+        with self.assertRaises(GetInfoException):
+            self.nauta_scrapper.get_connections(2023, 3)
+
+    def test_parsers_produce_identical_results(self):
+        for parser in PARSERS:
+            try:
+                check_parser(parser)
+            except ValueError:
+                continue
+            with self.subTest(parser=parser):
+                nauta_scrapper = DefaultNautaScrapper(self.scrapper, self.nauta_session, parser=parser)
+                nauta_scrapper.connect("user.name@nauta.com.cu", "some_password")
+                self.assertEqual(nauta_scrapper.data_session["ATTRIBUTE_UUID"], "B2F6AAB9A9868BABC0BDC6B7A235ABE2")
+                with open(os.path.join(_assets_dir, "user_info.json"), "r") as file:
+                    self.assertEqual(
+                        nauta_scrapper.login("user.name@nauta.com.cu", "some_password", "some_captcha_code"),
+                        NautaUser.from_dict(json.load(file))
+                    )
+                with open(os.path.join(_assets_dir, 'user_info_connect.json'), 'r') as file:
+                    self.assertEqual(
+                        nauta_scrapper.get_connect_information("user.name@nauta.com.cu", "some_password"),
+                        json.load(file)
+                    )
+                with open(os.path.join(_assets_dir, "connects_summary_2023_03.json"), "r") as file:
+                    self.assertEqual(
+                        nauta_scrapper.get_connections_summary(2023, 3), ConnectionsSummary.from_dict(json.load(file))
+                    )
+                with open(os.path.join(_assets_dir, "connects_2023_03.json"), "r") as file:
+                    self.assertEqual(
+                        nauta_scrapper.get_connections(2023, 3), [Connection.from_dict(_) for _ in json.load(file)]
+                    )
+                with open(os.path.join(_assets_dir, "quotes_paid_2023_03.json"), "r") as file:
+                    self.assertEqual(
+                        nauta_scrapper.get_quotes_paid(2023, 3), [QuotePaid.from_dict(_) for _ in json.load(file)]
+                    )
+
+    def test_parse_errors_with_every_parser(self):
+        cases = [
+            (login_fail_captcha_html, "login_fail_catpcha.json", LoginException, "Fail to login"),
+            (login_fail_user_or_password_html, "login_fail_cuser_or_password.json", LoginException, "Fail to login"),
+            (recharge_fail_html, "recharge_fail.json", RechargeException, "Fail to recharge the account credit"),
+            (change_password_fail_html, "change_password_fail.json", ChangePasswordException,
+             "Fail to change password")
+        ]
+        for parser in PARSERS:
+            try:
+                check_parser(parser)
+            except ValueError:
+                continue
+            for html, asset_name, exception, message in cases:
+                with self.subTest(parser=parser, asset=asset_name):
+                    with open(os.path.join(_assets_dir, asset_name), "r") as file:
+                        expected_result = json.load(file)
+                    errors = parse_errors(BeautifulSoup(html, parser), Portal.USER, parser)
+                    self.assertEqual(f"{message} :: {errors}", expected_result["reason"])
+                    self.assertEqual(exception.__name__, expected_result["exception"])
+
+    def test_unknown_parser(self):
+        with self.assertRaises(ValueError):
+            DefaultNautaScrapper(self.scrapper, self.nauta_session, parser="unknown")
+
+
+class TestTableRowsExtractor(unittest.TestCase):
+
+    def test_same_rows_as_soup(self):
+        for html in [sdl_2023_03_47_html, sdl_2023_03_2_html, sdl_2023_03_4_html, rdl_2023_03_2_html,
+                     qpl_2023_03_1_html]:
+            expected_result = get_table_rows(BeautifulSoup(html, "html5lib").select_one(".responsive-table > tbody"))
+            self.assertEqual(extract_table_rows(html), expected_result)
+            self.assertEqual(extract_table_rows(html.encode(), chunk_size=7), expected_result)
+
+    def test_stops_at_end_of_tbody(self):
+        html = '<table class="responsive-table"><tbody><tr><td> a </td><td>b&amp;c</td></tr></tbody>' \
+               '<tbody><tr><td>ignored</td></tr></tbody></table><p>unclosed <b'
+        self.assertEqual(extract_table_rows(html), [("a", "b&c")])
+
+    def test_page_without_table(self):
+        self.assertIsNone(extract_table_rows(recharge_fail_html.encode()))
+
+    def test_portal_errors_with_table(self):
+        html = sdl_2023_03_47_html + recharge_fail_html
+        self.assertEqual(extract_table_rows(html), extract_table_rows(sdl_2023_03_47_html))
+        self.assertEqual(
+            extract_table_rows(sdl_2023_03_47_html, exception=GetInfoException, message="Fail"),
+            extract_table_rows(sdl_2023_03_47_html)
+        )
+        with self.assertRaises(GetInfoException):
+            extract_table_rows(html, exception=GetInfoException, message="Fail")
+        with self.assertRaises(GetInfoException):
+            extract_table_rows(html.encode(), chunk_size=7, exception=GetInfoException, message="Fail")
+
+    def test_reading_stops_at_end_of_body_with_scripts(self):
+        html = '<body><table class="responsive-table"><tr><td>a</td></tr></table><table class="responsive-table">' \
+               '<tr><td>ignored</td></tr></table><script>first</script></body><script>ignored</script><p>unclosed <b'
+        extractor = TableRowsExtractor(scripts=True)
+        with self.assertRaises(_StopTokenizing):
+            extractor.feed(html)
+        self.assertEqual(extractor.rows, [("a",)])
+        self.assertEqual(extractor.last_script, "first")
+
+    def test_table_without_tbody(self):
+        html = re.sub(r"</?tbody>", "", sdl_2023_03_47_html)
+        expected_result = extract_table_rows(sdl_2023_03_47_html)
+        self.assertTrue(expected_result)
+        self.assertEqual(extract_table_rows(html), expected_result)
+        for parser in PARSERS:
+            with self.subTest(parser=parser):
+                soup = BeautifulSoup(html, parser)
+                self.assertEqual(get_table_rows(soup.select_one(".responsive-table")), expected_result)
+
+    def test_header_rows_are_skipped(self):
+        html = '<table class="responsive-table"><thead><tr><td>header</td></tr></thead>' \
+               '<tr><td>a</td></tr></table><table class="responsive-table"><tr><td>ignored</td></tr></table>'
+        self.assertEqual(extract_table_rows(html), [("a",)])
+
+
+class TestParseConnectInformation(unittest.TestCase):
+
+    def test_tables_without_tbody(self):
+        html = re.sub(r"</?tbody>", "", connect_info_html)
+        with open(os.path.join(_assets_dir, 'user_info_connect.json'), 'r') as file:
+            expected_result = json.load(file)
+        for parser in PARSERS:
+            with self.subTest(parser=parser):
+                self.assertEqual(parse_connect_information(BeautifulSoup(html, parser)), expected_result)
+
+
+class TestFormScanner(unittest.TestCase):
+
+    @staticmethod
+    def scan(scanner: FormScanner, html: str, chunk_size: int = 7) -> int:
+        content = html.encode()
+        for start in range(0, len(content), chunk_size):
+            if scanner.scan(content[start:start + chunk_size]):
+                return start + chunk_size
+        return len(content)
+
+    def test_same_fields_as_soup(self):
+        scanner = FormScanner(form=True)
+        self.scan(scanner, landing_html)
+        soup = BeautifulSoup(landing_html, "html.parser")
+        self.assertTrue(scanner.done)
+        self.assertEqual((scanner.action, scanner.inputs), (soup.form["action"], get_inputs(soup)))
+
+        scanner = FormScanner(("CSRFHW", "wlanuserip"), "formulario")
+        self.scan(scanner, login_html)
+        form_soup = BeautifulSoup(login_html, "html.parser").select_one("#formulario")
+        self.assertTrue(scanner.done)
+        self.assertEqual((scanner.action, scanner.inputs), (form_soup["action"], get_inputs(form_soup)))
+
+    def test_stops_as_soon_as_the_fields_are_found(self):
+        html = '<p>é</p><input name="csrf" type="hidden" value="abc123" />' + "<p>padding</p>" * 1000
+        scanner = FormScanner(("csrf",))
+        self.assertLess(self.scan(scanner, html), 100)
+        self.assertEqual(scanner.inputs, {"csrf": "abc123"})
+
+    def test_last_script_is_kept(self):
+        scanner = FormScanner(("csrf",), scripts=True)
+        self.scan(scanner, csrf_token_fail_html)
+        self.assertFalse(scanner.done)
+        self.assertEqual(scanner.inputs, {"csrf": "security6416bea61ad2b"})
+        soup = BeautifulSoup(csrf_token_fail_html, "html.parser")
+        self.assertEqual(scanner.last_script, soup.find_all("script")[-1].contents[0].strip())
+
+    def test_scripts_stop_at_end_of_body(self):
+        html = f"<html><body>{csrf_token_fail_html}</body>" + "<p>padding</p>" * 1000 + "</html>"
+        scanner = FormScanner(("csrf",), scripts=True)
+        self.assertLess(self.scan(scanner, html), len(csrf_token_fail_html) + 100)
+        self.assertTrue(scanner.done)
+        self.assertEqual(scanner.inputs, {"csrf": "security6416bea61ad2b"})
+        self.assertIn("toastr.error", scanner.last_script)
+
+    def test_page_without_fields(self):
+        scanner = FormScanner(("csrf",))
+        self.scan(scanner, recharge_fail_html)
+        self.assertFalse(scanner.done)
+        scanner = FormScanner(("CSRFHW",), "formulario")
+        self.scan(scanner, landing_html)
+        self.assertFalse(scanner.done)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,81 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>.
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import datetime
+import json
+import os
+import unittest
+from unittest.mock import MagicMock
+
+from suitetecsa_core import Action
+from suitetecsa_core.domain.model import Connection, Recharge
+from suitetecsa_core.repository.history_store_provider import HistoryStore
+
+_assets_dir = os.path.join(
+    os.path.dirname(__file__),
+    "assets"
+)
+
+
+def load_asset_json(asset_name):
+    with open(os.path.join(_assets_dir, asset_name), "r") as file:
+        return json.load(file)
+
+
+class TestHistoryStore(unittest.TestCase):
+
+    def setUp(self):
+        self.connections = [Connection.from_dict(_) for _ in load_asset_json("connects_2023_03.json")]
+        self.client = MagicMock()
+        self.client.credentials = ("user.name@nauta.com.cu", "some_password")
+        self.client.get_connections_summary.side_effect = lambda year, month: MagicMock(
+            count=len(self.connections) if (year, month) == (2023, 3) else 0
+        )
+        self.client.get_connections.side_effect = lambda year, month, summary, large=0: \
+            self.connections[:large or summary.count]
+        self.store = HistoryStore()
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_roundtrip(self):
+        self.store.add("user.name@nauta.com.cu", Action.GET_CONNECTIONS, 2023, 3, self.connections)
+        result = self.store.connections("user.name@nauta.com.cu")
+        self.assertEqual(result, sorted(self.connections, key=lambda connection: connection.start_session))
+
+    def test_query_by_range(self):
+        recharges = [Recharge.from_dict(_) for _ in load_asset_json("recharges_2023_03.json")]
+        self.store.add("user.name@nauta.com.cu", Action.GET_RECHARGES, 2023, 3, recharges)
+        start = min(recharge.date for recharge in recharges) + datetime.timedelta(seconds=1)
+        result = self.store.recharges("user.name@nauta.com.cu", start=start)
+        self.assertEqual(result, [recharge for recharge in recharges if recharge.date >= start])
+
+    def test_closed_months_are_synced_once(self):
+        since, until = datetime.date(2023, 2, 1), datetime.date(2023, 3, 31)
+        added = self.store.sync(self.client, since, (Action.GET_CONNECTIONS,), until)
+        self.assertEqual(added, {Action.GET_CONNECTIONS: len(self.connections)})
+        self.store.sync(self.client, since, (Action.GET_CONNECTIONS,), until)
+        self.assertEqual(self.client.get_connections_summary.call_count, 2)
+        self.assertEqual(self.client.get_connections.call_count, 1)
+
+    def test_open_month_fetches_only_missing_rows(self):
+        self.store.add("user.name@nauta.com.cu", Action.GET_CONNECTIONS, 2023, 3, self.connections[5:])
+        today = datetime.date(2023, 3, 1)
+        self.store.sync(self.client, today, (Action.GET_CONNECTIONS,), today)
+        self.client.get_connections.assert_called_once()
+        self.assertEqual(self.client.get_connections.call_args.args[3], 5)
+        self.assertEqual(
+            self.store.count("user.name@nauta.com.cu", Action.GET_CONNECTIONS, 2023, 3), len(self.connections)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>.
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import threading
+import unittest
+
+from bs4 import BeautifulSoup
+from requests import Session
+
+from suitetecsa_core import Action, Portal
+from suitetecsa_core.core.exceptions import LoginException
+from suitetecsa_core.repository.scrapper_provider import DefaultNautaScrapper
+from suitetecsa_core.repository.session_provider import DefaultNautaSession, RequestEvent
+from suitetecsa_core.testing import NautaPortalServer, make_accounts
+from suitetecsa_core.utils.metrics import NautaMetrics
+
+
+def series(snapshot: dict, name: str, **labels) -> list[dict]:
+    return [item for item in snapshot[name] if labels.items() <= item["labels"].items()]
+
+
+class TestNautaMetrics(unittest.TestCase):
+
+    def test_session_metrics(self):
+        metrics = NautaMetrics()
+        with NautaPortalServer(make_accounts(1, rows=20)) as server:
+            session = DefaultNautaSession(Session())
+            scrapper = DefaultNautaScrapper(BeautifulSoup(), session)
+            server.configure(scrapper)
+            metrics.attach(session)
+            scrapper.captcha_image
+            with self.assertRaises(LoginException):
+                scrapper.login("user0@nauta.com.cu", "wrong", "abcd")
+            scrapper.login("user0@nauta.com.cu", "password", "abcd")
+            scrapper.get_connections(2023, 3)
+            metrics.detach(session)
+            scrapper.get_connections(2023, 3)
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(
+            series(snapshot, "errors_total", action="login"),
+            [{"labels": {"portal": "user", "action": "login", "stage": "parse", "exception": "LoginException"},
+              "value": 1}]
+        )
+        # Página del token, resumen y dos páginas del listado
+        requests = series(snapshot, "requests_total", action="get_connections")
+        self.assertEqual(sum(item["value"] for item in requests), 4)
+        latency = series(snapshot, "request_duration_seconds", portal="user", action="get_connections")[0]
+        self.assertEqual(latency["count"], 4)
+        self.assertEqual(latency["buckets"]["+Inf"], 4)
+        parse = series(snapshot, "parse_duration_seconds", action="get_connections")[0]
+        self.assertGreater(parse["sum"], 0)
+        received = series(snapshot, "received_bytes_total", action="get_connections")[0]["value"]
+        self.assertEqual(series(snapshot, "response_size_bytes", action="get_connections")[0]["sum"], received)
+
+        text = metrics.to_prometheus()
+        self.assertIn("# TYPE suitetecsa_request_duration_seconds histogram", text)
+        self.assertIn(
+            'suitetecsa_request_duration_seconds_bucket{portal="user",action="get_connections",le="+Inf"} 4', text
+        )
+        self.assertIn(
+            'suitetecsa_errors_total{portal="user",action="login",stage="parse",exception="LoginException"} 1', text
+        )
+        self.assertIn(f'suitetecsa_received_bytes_total{{portal="user",action="get_connections"}} {received}', text)
+
+    def test_concurrent_observations(self):
+        metrics = NautaMetrics(latency_buckets=(0.1, 1.0))
+        event = RequestEvent(Portal.USER, "GET", "url", Action.LOGIN, status_code=200, elapsed=0.5, bytes_received=10)
+
+        def work():
+            for _ in range(1000):
+                metrics.observe_request(event)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["requests_total"][0]["value"], 8000)
+        self.assertEqual(snapshot["received_bytes_total"][0]["value"], 80000)
+        self.assertEqual(snapshot["request_duration_seconds"][0]["buckets"], {"0.1": 0, "1.0": 8000, "+Inf": 8000})
+        metrics.reset()
+        self.assertEqual(metrics.snapshot()["requests_total"], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
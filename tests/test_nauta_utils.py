@@ -0,0 +1,52 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>.
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import unittest
+
+from benchmarks.converters import CONVERTERS, load_values
+
+_invalid_values = {
+    "str_to_date": [
+        "01/03/2023\n", "31/02/2023", "00/01/2023", "01/13/2023", "01/01/0000", "1/3/2023", "01-03-2023", "", None
+    ],
+    "str_to_float": ["$46,52 CUP\n", "$1,2,3", "46,52", "$", "$46,52 cup", None],
+    "time_string_to_seconds": ["720:00:00\n", "00:60:00", "23:59", "12:34:56 PM", "-1:00:00", "", None],
+    "parse_datetime": [
+        "01/03/2023 10:20:30\n", "1/3/2023 1:02:03", " 1/03/2023 10:20:30", "+1/03/2023 10:20:30",
+        "31/02/2023 10:20:30", "01/03/2023 24:00:00", "01/03/2023 10:60:00", "01/03/2023 10:20:60",
+        "01/03/0000 10:20:30", "01/03/2023T10:20:30", "01/03/2023 10:20", "", None
+    ],
+    "convert_to_bytes": ["5 MB extra", "5,5 mb", "5 PB", "MB", "5", "", " 1024   bytes "]
+}
+
+
+class TestConverters(unittest.TestCase):
+
+    def assertSameResult(self, legacy, current, value):
+        try:
+            expected_result = legacy(value)
+        except (ValueError, TypeError) as e:
+            with self.assertRaises(type(e)) as context:
+                current(value)
+            self.assertEqual(str(context.exception), str(e))
+        else:
+            self.assertEqual(current(value), expected_result)
+
+    def test_same_results_as_legacy(self):
+        values = load_values()
+        for name, (legacy, current) in CONVERTERS.items():
+            for value in values[name] + _invalid_values[name]:
+                with self.subTest(converter=name, value=value):
+                    self.assertSameResult(legacy, current, value)
+
+
+if __name__ == '__main__':
+    unittest.main()
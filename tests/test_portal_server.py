@@ -0,0 +1,113 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>.
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import unittest
+
+from bs4 import BeautifulSoup
+from requests import Session
+
+from suitetecsa_core import Action, Portal
+from suitetecsa_core.core.exceptions import ConnectionException, LoginException
+from suitetecsa_core.domain.service.nauta_client import NautaClient
+from suitetecsa_core.repository.scrapper_provider import DefaultNautaScrapper
+from suitetecsa_core.repository.session_provider import DefaultNautaSession, TransportConfig
+from suitetecsa_core.testing import NautaPortalServer, PortalAccount, make_accounts
+from suitetecsa_core.testing.history import HISTORY_ACTIONS
+
+
+class TestNautaPortalServer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = NautaPortalServer(make_accounts(2, rows=20) + [
+            PortalAccount("home@nauta.com.cu", "secret", nauta_home=True, history={(2023, 3): 3})
+        ])
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def make_scrapper(self) -> DefaultNautaScrapper:
+        scrapper = DefaultNautaScrapper(BeautifulSoup(), DefaultNautaSession(Session()))
+        self.server.configure(scrapper)
+        return scrapper
+
+    def test_connect_flow(self):
+        client = NautaClient(self.make_scrapper())
+        client.credentials = ("user0@nauta.com.cu", "password")
+        self.assertFalse(client.is_connected)
+        self.assertTrue(client.check_portal_access())
+        self.assertEqual(client.connect_information["account_info"]["credit"], "$59,02 CUP")
+        client.connect()
+        self.assertTrue(client.is_connected)
+        self.assertEqual(client.remaining_time, 4 * 3600 + 43 * 60 + 17)
+        client.disconnect()
+        self.assertFalse(client.is_connected)
+
+    def test_connect_with_wrong_password(self):
+        scrapper = self.make_scrapper()
+        with self.assertRaises(LoginException):
+            scrapper.connect("user0@nauta.com.cu", "wrong")
+        self.assertFalse(scrapper.is_connected)
+
+    def test_user_portal(self):
+        scrapper = self.make_scrapper()
+        self.assertTrue(scrapper.captcha_image.startswith(b"\x89PNG"))
+        with self.assertRaises(LoginException):
+            scrapper.login("user1@nauta.com.cu", "wrong", "abcd")
+        user = scrapper.login("home@nauta.com.cu", "secret", "abcd")
+        self.assertEqual(user.username, "home@nauta.com.cu")
+        self.assertTrue(scrapper.is_nauta_home)
+        self.assertEqual(scrapper.user_information, user)
+        scrapper.to_up("1234567890123456")
+        scrapper.change_password("secret", "secret")
+
+    def test_history_matches_dataset(self):
+        scrapper = self.make_scrapper()
+        scrapper.captcha_image
+        scrapper.login("user1@nauta.com.cu", "password", "abcd")
+        history = self.server.history("user1@nauta.com.cu", 2023, 3)
+        for action in HISTORY_ACTIONS:
+            with self.subTest(action=action):
+                self.assertEqual(
+                    getattr(scrapper, f"get_{action.value}_summary")(2023, 3), history.expected_summary(action)
+                )
+                self.assertEqual(getattr(scrapper, f"get_{action.value}")(2023, 3), history.expected(action))
+
+    def test_expired_csrf_is_retried(self):
+        scrapper = self.make_scrapper()
+        scrapper.captcha_image
+        scrapper.login("user0@nauta.com.cu", "password", "abcd")
+        scrapper.get_recharges_summary(2023, 3)
+        self.server.expire_csrf_tokens()
+        rejected = self.server.requests[("user", "useraaa/recharge_detail/")]
+        self.assertEqual(scrapper.get_recharges_summary(2023, 3).count, 20)
+        self.assertEqual(self.server.requests[("user", "useraaa/recharge_detail/")], rejected + 1)
+
+    def test_error_rate_and_latency(self):
+        with NautaPortalServer(make_accounts(1), latency=0.02, error_rate=1.0, seed=1) as server:
+            transport = TransportConfig(retries=2, backoff_factor=0)
+            scrapper = DefaultNautaScrapper(
+                BeautifulSoup(), DefaultNautaSession(Session(), {Portal.USER: transport, Portal.CONNECT: transport})
+            )
+            server.configure(scrapper)
+            self.assertEqual(
+                scrapper._make_url(Portal.USER, Action.LOGIN), f"{server.base_urls[Portal.USER]}user/login/es-es"
+            )
+            with self.assertRaises(ConnectionException):
+                scrapper.captcha_image
+            # La petición GET se reintenta dos veces antes de fallar
+            self.assertEqual(server.injected_errors, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
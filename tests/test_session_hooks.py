@@ -0,0 +1,107 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>.
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import unittest
+
+from bs4 import BeautifulSoup
+from requests import Session
+from requests.exceptions import ConnectionError
+
+from suitetecsa_core import Action, Portal
+from suitetecsa_core.repository.scrapper_provider import DefaultNautaScrapper
+from suitetecsa_core.repository.session_provider import DefaultNautaSession, TransportConfig, url_template
+from suitetecsa_core.testing import NautaPortalServer, make_accounts
+
+
+class TestSessionHooks(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = NautaPortalServer(make_accounts(1, rows=30))
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        transport = TransportConfig(backoff_factor=0)
+        self.session = DefaultNautaSession(Session(), {Portal.USER: transport, Portal.CONNECT: transport})
+        self.scrapper = DefaultNautaScrapper(BeautifulSoup(), self.session)
+        self.server.configure(self.scrapper)
+        self.before, self.after, self.parsed = [], [], []
+        self.session.register_hook("before_request", lambda event: self.before.append(event.status_code))
+        self.session.register_hook("after_request", self.after.append)
+        self.session.register_hook("parse", self.parsed.append)
+
+    def test_request_events(self):
+        self.scrapper.connect("user0@nauta.com.cu", "password")
+        self.scrapper.remaining_time
+        self.assertEqual(self.before, [None] * len(self.after))
+        self.assertEqual(
+            [event.action for event in self.after],
+            [Action.CHECK_CONNECTION, Action.LOGIN, Action.LOGIN, Action.LOGIN, Action.LOAD_USER_INFORMATION]
+        )
+        for event in self.after:
+            self.assertEqual(event.portal, Portal.CONNECT)
+            self.assertEqual(event.status_code, 200)
+            self.assertGreater(event.elapsed, 0)
+            self.assertGreater(event.bytes_received, 0)
+        self.assertEqual(self.after[-1].bytes_received, len("04:43:17"))
+        self.assertGreater(self.after[-1].bytes_sent, 0)
+
+    def test_history_events(self):
+        self.scrapper.captcha_image
+        self.scrapper.login("user0@nauta.com.cu", "password", "abcd")
+        del self.after[:], self.parsed[:]
+        self.scrapper.get_connections(2023, 3)
+        self.assertEqual({event.action for event in self.after}, {Action.GET_CONNECTIONS})
+        self.assertEqual(
+            [event.url_template for event in self.after if "list" in event.url][-1],
+            f"{self.server.base_urls[Portal.USER]}useraaa/service_detail_list/{{year_month}}/{{count}}/{{page}}"
+        )
+        # Un evento con las filas de cada una de las tres páginas
+        self.assertEqual([event.items for event in self.parsed if event.items is not None], [14, 14, 2])
+
+    def test_csrf_retry_and_errors(self):
+        self.scrapper.captcha_image
+        self.scrapper.login("user0@nauta.com.cu", "password", "abcd")
+        self.scrapper.get_recharges_summary(2023, 3)
+        self.server.expire_csrf_tokens()
+        del self.after[:]
+        self.scrapper.get_recharges_summary(2023, 3)
+        self.assertEqual([(event.status_code, event.retries) for event in self.after], [(403, 0), (200, 0), (200, 1)])
+
+        self.session.register_hook("after_request", lambda event: self.assertIsNotNone(event.exception))
+        self.scrapper.override_base_urls({Portal.USER: "http://127.0.0.1:9/"})
+        with self.assertRaises(ConnectionError):
+            self.scrapper.user_information
+        self.assertIsNone(self.after[-1].status_code)
+
+    def test_deregister(self):
+        self.assertTrue(self.session.deregister_hook("after_request", self.after.append))
+        self.assertFalse(self.session.deregister_hook("after_request", self.after.append))
+        self.scrapper.is_connected
+        self.assertEqual(self.after, [])
+        with self.assertRaises(ValueError):
+            self.session.register_hook("response", print)
+
+    def test_url_template(self):
+        self.assertEqual(
+            url_template("https://www.portal.nauta.cu/useraaa/recharge_detail_list/2023-03/7"),
+            "https://www.portal.nauta.cu/useraaa/recharge_detail_list/{year_month}/{count}"
+        )
+        self.assertEqual(url_template("https://www.portal.nauta.cu/user/login/es-es"),
+                         "https://www.portal.nauta.cu/user/login/es-es")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,186 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>.
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import gzip
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from bs4 import BeautifulSoup
+from requests import Response, Session
+from requests.utils import get_encoding_from_headers
+from urllib3.util.request import ACCEPT_ENCODING
+
+from suitetecsa_core import Action, Portal
+from suitetecsa_core.core.exceptions import ConnectionException
+from suitetecsa_core.repository.scrapper_provider import DefaultNautaScrapper
+from suitetecsa_core.repository.session_provider import DefaultNautaSession, TransportConfig, STREAM_CHUNK_SIZE, \
+    Traffic
+from suitetecsa_core.testing import NautaPortalServer, make_accounts
+from suitetecsa_core.utils.parser import FormScanner
+
+
+class TestSessionTransport(unittest.TestCase):
+
+    def test_each_portal_has_its_own_adapter(self):
+        session = DefaultNautaSession(
+            Session(), {Portal.CONNECT: TransportConfig(pool_maxsize=2, connect_timeout=3, read_timeout=5)}
+        )
+        user_adapter = session._DefaultNautaSession__user_session.get_adapter("https://www.portal.nauta.cu/")
+        connect_adapter = session._DefaultNautaSession__connect_session.get_adapter("https://secure.etecsa.net:8443/")
+        self.assertIsNot(user_adapter, connect_adapter)
+        self.assertEqual(connect_adapter.timeout, (3, 5))
+        self.assertEqual(connect_adapter._pool_maxsize, 2)
+        self.assertEqual(user_adapter.timeout, TransportConfig().timeout)
+        self.assertEqual(session.transport(Portal.USER), TransportConfig())
+        session.close()
+
+    def test_only_get_requests_are_retried(self):
+        transport = TransportConfig(retries=3, backoff_factor=0)
+        with NautaPortalServer(make_accounts(1), error_rate=1.0) as server:
+            session = DefaultNautaSession(Session(), {Portal.USER: transport, Portal.CONNECT: transport})
+            scrapper = DefaultNautaScrapper(BeautifulSoup(), session)
+            server.configure(scrapper)
+            retries = []
+            session.register_hook("after_request", lambda event: retries.append(event.retries))
+            with self.assertRaises(ConnectionException):
+                scrapper.captcha_image
+            self.assertEqual(server.injected_errors, 4)
+            self.assertEqual(retries, [3])
+            with self.assertRaises(ConnectionException):
+                session.post(Portal.USER, server.base_urls[Portal.USER] + "user/login/es-es", {"csrf": "x"})
+            self.assertEqual(server.injected_errors, 5)
+            self.assertEqual(retries, [3, 0])
+
+    def test_portal_encoding_is_used_when_the_response_declares_none(self):
+        def make_response(content_type: str = None) -> Response:
+            response = Response()
+            response._content = "Información".encode("utf-8")
+            if content_type:
+                response.headers["Content-Type"] = content_type
+            # Como hace el adaptador de requests al construir la respuesta
+            response.encoding = get_encoding_from_headers(response.headers)
+            return response
+
+        for content_type, expected_result in (
+                (None, "utf-8"), ("text/html", "utf-8"), ("text/html; charset=ISO-8859-1", "ISO-8859-1")
+        ):
+            with self.subTest(content_type=content_type):
+                response = make_response(content_type)
+                DefaultNautaSession.set_encoding(Portal.USER, response)
+                self.assertEqual(response.encoding, expected_result)
+        response = make_response("text/html")
+        DefaultNautaSession.set_encoding(Portal.CONNECT, response)
+        self.assertEqual(response.text, "Información")
+
+    def test_streamed_requests_stop_reading_when_consumed(self):
+        body = b'<input name="csrf" value="abc123" />' + b"<p>padding</p>" * 100000
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                try:
+                    self.wfile.write(body)
+                except OSError:
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        session = DefaultNautaSession(Session())
+        received = []
+        session.register_hook("after_request", lambda event: received.append(event.bytes_received))
+        try:
+            url = f"http://127.0.0.1:{server.server_port}/"
+            scanner = FormScanner(("csrf",))
+            response = session.get(Portal.USER, url, consume=scanner.scan)
+            self.assertTrue(scanner.done)
+            self.assertEqual(scanner.inputs, {"csrf": "abc123"})
+            self.assertLess(len(response.content), 10 * STREAM_CHUNK_SIZE)
+            self.assertEqual(received, [len(response.content)])
+            self.assertEqual(session.get(Portal.USER, url, consume=lambda chunk: False).content, body)
+        finally:
+            session.close()
+            server.shutdown()
+            server.server_close()
+
+    def test_compressed_responses_are_decoded_and_accounted(self):
+        body = "<p>Información</p>".encode() * 1000
+        headers = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                headers.append(self.headers.get("Accept-Encoding"))
+                encoding = "x-unknown" if self.path == "/unknown" else "gzip"
+                content = gzip.compress(body)
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html")
+                self.send_header("Content-Encoding", encoding)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        session = DefaultNautaSession(Session(), count_traffic=True)
+        try:
+            url = f"http://127.0.0.1:{server.server_port}/"
+            response = session.get(Portal.USER, url, action=Action.LOAD_USER_INFORMATION)
+            self.assertEqual(response.content, body)
+            self.assertEqual(headers, [ACCEPT_ENCODING])
+            traffic = session.traffic[Action.LOAD_USER_INFORMATION]
+            self.assertEqual((traffic.requests, traffic.decoded), (1, len(body)))
+            self.assertLess(traffic.received, len(body) // 10)
+            self.assertGreater(traffic.sent, 0)
+            with self.assertRaises(ConnectionException):
+                session.get(Portal.USER, url + "unknown", consume=lambda chunk: False)
+            self.assertEqual(session.traffic[None].requests, 1)
+            self.assertEqual(session.bytes_total, traffic.total + session.traffic[None].total)
+            self.assertEqual(session.reset_traffic()[Action.LOAD_USER_INFORMATION], traffic)
+            self.assertEqual((session.traffic, session.bytes_total), ({}, 0))
+            session.count_traffic = False
+            session.get(Portal.USER, url, action=Action.LOAD_USER_INFORMATION)
+            self.assertEqual((session.traffic, session.bytes_total), ({}, 0))
+        finally:
+            session.close()
+            server.shutdown()
+            server.server_close()
+
+    def test_connection_probes(self):
+        account = make_accounts(1)[0]
+        for probe in ("get", "head"):
+            with self.subTest(probe=probe), NautaPortalServer([account], compress=True) as server:
+                session = DefaultNautaSession(Session(), count_traffic=True)
+                scrapper = DefaultNautaScrapper(BeautifulSoup(), session, connection_probe=probe)
+                server.configure(scrapper)
+                self.assertFalse(scrapper.is_connected)
+                # 'head' no sigue la redirección al portal cautivo
+                self.assertEqual(server.requests[("connect", "")], 1 if probe == "get" else 0)
+                scrapper.connect(account.username, account.password)
+                self.assertTrue(scrapper.is_connected)
+                traffic = session.traffic
+                self.assertEqual(traffic[Action.CHECK_CONNECTION].requests, 3)
+                self.assertEqual(traffic[Action.CHECK_CONNECTION].decoded > 0, probe == "get")
+                self.assertEqual(session.bytes_total, sum(item.total for item in traffic.values()))
+                self.assertIsInstance(traffic[Action.LOGIN], Traffic)
+                session.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
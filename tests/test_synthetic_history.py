@@ -0,0 +1,88 @@
+#  Copyright (c) 2023. Lesly Cintra Laza <a.k.a. lesclaz>.
+#  Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+#  documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+#  permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#  The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+#  Software.
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+#  WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE AUTHORS
+#  OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+#  OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import unittest
+from unittest.mock import MagicMock, patch
+
+from bs4 import BeautifulSoup
+
+from suitetecsa_core import Action
+from suitetecsa_core.repository.scrapper_provider import DefaultNautaScrapper
+from suitetecsa_core.repository.session_provider import DefaultNautaSession
+from suitetecsa_core.testing import SyntheticHistory
+from suitetecsa_core.testing.history import HISTORY_ACTIONS
+
+
+def make_response(text: str, url: str, status_code: int = 200) -> MagicMock:
+    content = text.encode()
+    return MagicMock(
+        status_code=status_code, ok=status_code < 400, text=text, content=content, encoding="utf-8", url=url,
+        iter_content=lambda chunk_size=1: (content[i:i + chunk_size] for i in range(0, len(content), chunk_size))
+    )
+
+
+class TestSyntheticHistory(unittest.TestCase):
+
+    @patch('requests.Session')
+    def make_scrapper(self, history: SyntheticHistory, MockSession) -> DefaultNautaScrapper:
+        session = MockSession()
+        get_routes, post_routes = history.routes()
+        self.requested_urls = []
+
+        def get_side_effect(url: str, data: dict = None, stream: bool = False):
+            self.requested_urls.append(url)
+            return make_response(get_routes[url], url)
+
+        def post_side_effect(url: str, data: dict = None, stream: bool = False):
+            return make_response(post_routes[url], url)
+
+        session.get = MagicMock(side_effect=get_side_effect)
+        session.post = MagicMock(side_effect=post_side_effect)
+        return DefaultNautaScrapper(BeautifulSoup(), DefaultNautaSession(session))
+
+    def test_is_deterministic(self):
+        self.assertEqual(SyntheticHistory(2023, 3, 30, seed=1).routes(), SyntheticHistory(2023, 3, 30, seed=1).routes())
+        self.assertNotEqual(SyntheticHistory(2023, 3, 30, seed=1).rows(Action.GET_CONNECTIONS),
+                            SyntheticHistory(2023, 3, 30, seed=2).rows(Action.GET_CONNECTIONS))
+
+    def test_scrapper_reads_every_action(self):
+        for count in (0, 1, 14, 15, 1000):
+            history = SyntheticHistory(2023, 3, count)
+            scrapper = self.make_scrapper(history)
+            for action in HISTORY_ACTIONS:
+                with self.subTest(action=action, count=count):
+                    summary = getattr(scrapper, f"get_{action.value}_summary")(2023, 3)
+                    self.assertEqual(summary, history.expected_summary(action))
+                    self.assertEqual(
+                        getattr(scrapper, f"get_{action.value}")(2023, 3, summary), history.expected(action)
+                    )
+
+    def test_pagination(self):
+        history = SyntheticHistory(2023, 3, {Action.GET_CONNECTIONS: 100})
+        scrapper = self.make_scrapper(history)
+        summary = scrapper.get_connections_summary(2023, 3)
+        expected_result = history.expected(Action.GET_CONNECTIONS)
+
+        self.requested_urls.clear()
+        self.assertEqual(scrapper.get_connections(2023, 3, summary, large=20), expected_result[:20])
+        self.assertEqual(len(self.requested_urls), 2)
+
+        self.requested_urls.clear()
+        self.assertEqual(scrapper.get_connections(2023, 3, summary, large=5, _reversed=True),
+                         expected_result[::-1][:5])
+        # La última página solo tiene 2 filas, así que hacen falta las dos últimas
+        self.assertEqual(self.requested_urls, [
+            f"https://www.portal.nauta.cu/{history.list_path(Action.GET_CONNECTIONS, page)}" for page in (8, 7)
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()